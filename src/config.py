@@ -7,6 +7,28 @@ ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+SIMULATION_HZ = 60  # Fixed gameplay tick rate; frame-counted timers and per-tick speeds assume this rate
+MAX_RENDER_FPS = 240  # Render cap for the main game loop (0 = uncapped)
+MAX_FRAME_TIME = 0.1  # Seconds of simulation allowed to catch up after a slow frame
+
+# Enemy projectiles: initial ProjectileBuffer slots (it doubles when full) and per-type motion.
+# speed multiplies the (dx, dy) an attack returns; lifetime is in simulation ticks; solid ones stop at walls.
+PROJECTILE_CAPACITY = 1024
+PROJECTILE_TYPES = {
+    "bolt": {"speed": 5, "lifetime": SIMULATION_HZ * 4, "solid": True},
+    "sweep": {"speed": 0, "lifetime": SIMULATION_HZ // 2, "solid": False}
+}
+PROJECTILE_DAMAGE = 5
+
+# Hit sparks and bursts share one fixed-size ParticleSystem; emits beyond capacity are dropped
+PARTICLE_CAPACITY = 2048
+
+# Rendered text kept by assets.render_text (least recently used entries are dropped first)
+TEXT_CACHE_SIZE = 256
+
+# F3 performance overlay: frames of history in the graph, and how often (in frames) its layer is redrawn
+PERF_HISTORY = 120
+PERF_REFRESH = 15
 TILE_SIZE = 40
 MORNING_GLORY = (147, 208, 207)
 TANGOA = (14, 39, 59)
@@ -25,6 +47,30 @@ SCENE_WIDTH = 20
 SCENE_HEIGHT = 13
 HUD_HEIGHT = 50
 
+# Pre-baked maze layouts (built by python -m src.tools.build_maze_pack)
+MAZE_PACK_PATH = os.path.join(ROOT_DIR, "data/maze_pack.bin")
+
+# Logging (src/modules/logs.py): console threshold, what the crash-dump ring buffer keeps, and where dumps go
+LOG_LEVEL = "WARNING"
+LOG_RING_LEVEL = "INFO"
+LOG_RING_SIZE = 2000
+LOG_DIR = os.path.join(ROOT_DIR, "logs")
+
+# Session telemetry (src/modules/telemetry.py): JSON lines appended locally, never sent anywhere.
+# Frame times are summarized per scene visit, and at least every TELEMETRY_WINDOW frames on long visits.
+TELEMETRY_ENABLED = True
+TELEMETRY_PATH = os.path.join(LOG_DIR, "telemetry.jsonl")
+TELEMETRY_WINDOW = 3600
+
+# Hitch detector (src/modules/hitches.py): a frame longer than HITCH_FACTOR frame budgets is logged with what
+# ran during it; the overlay lists recent ones and HITCH_PATH gets every one as a JSON line
+HITCH_FACTOR = 2.0
+HITCH_HISTORY = 50
+HITCH_PATH = os.path.join(LOG_DIR, "hitches.jsonl")
+
+# Input recorder (src/modules/recorder.py): main-loop frames between game-state digests in a recording
+REPLAY_CHECKPOINT_FRAMES = 300
+
 # Sound paths
 SOUND_FRAGMENT = os.path.join(ROOT_DIR, "assets/sounds/effects/fragment_collect.wav")
 SOUND_ATTACK = os.path.join(ROOT_DIR, "assets/sounds/effects/attack.wav")
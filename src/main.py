@@ -2,97 +2,141 @@ import pygame
 import sys
 import random
 import os
+import argparse
+import atexit
 from src.modules.player import Player
 from src.modules.cutscenes import play_intro_cutscene, play_area_cutscene
 from src.modules.checkpoint import CheckpointSystem
-from src.modules.enemies import Sapa, SplitterSapa, ProjectileSapa, ChaserSapa, DiagonalSapa, BossArea1, BossArea2, \
-    BossArea3, BossArea4, BossArea5, Skuld
+from src.modules.enemies import Sapa, BossArea1, BossArea2, BossArea3, BossArea4, BossArea5, Skuld
 from src.modules.combat import CombatSystem
 from src.modules.npcs import NPC, vitalik_cutscene, vitalik_choice
 from src.modules.ui import DialogueBox, show_tutorial, show_pause_menu, prompt_easy_mode, prompt_game_over
 from src.modules.world import World
+from src.modules.projectiles import ProjectileBuffer
+from src.modules.timestep import FixedTimestep, Interpolator
+from src.modules.perf_overlay import PerfOverlay
+from src.modules import memory_report as memory
+from src.modules import profiling as timings
+from src.modules import context_profile
+from src.modules import surface_tracker
+from src.modules import telemetry
+from src.modules import hitches
+from src.modules import recorder
+from src.modules import gameloop
 from src.modules.game_state import save_game, load_game
 from src.modules.setup import get_player_info
 from src.modules.interactions import vendor_interaction, play_sword_puzzle, play_vitalik_puzzle, play_quest_minigame, final_cutscene, get_minigames
 from src.modules.rendering import draw_ui, draw_labels, draw_exits, draw_minimap, apply_critical_tint
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TILE_SIZE, WHITE, BLACK, GOLD, HUD_HEART_ICON, HUD_COIN_ICON, HUD_VIRUS_ICON, HUD_RING_ICON, MALE_SPRITE, FEMALE_SPRITE, EXIT_ARROW_SPRITE, DEFAULT_FONT, UI_BACKGROUND, MAZE_WIDTH, MAZE_HEIGHT, SOUND_GAME_MUSIC, SOUND_CUTSCENE_MUSIC, HUD_HEIGHT, SAPA_PROJECTILE
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MAX_RENDER_FPS, TILE_SIZE, WHITE, BLACK, GOLD, HUD_HEART_ICON, HUD_COIN_ICON, HUD_VIRUS_ICON, HUD_RING_ICON, MALE_SPRITE, FEMALE_SPRITE, EXIT_ARROW_SPRITE, DEFAULT_FONT, UI_BACKGROUND, MAZE_WIDTH, MAZE_HEIGHT, SOUND_GAME_MUSIC, SOUND_CUTSCENE_MUSIC, HUD_HEIGHT, SAPA_PROJECTILE, LOG_LEVEL, TELEMETRY_ENABLED
+from src.modules.logs import get_logger, configure, install_crash_handler
 
-def main():
-    print("Starting game...")
+log = get_logger(__name__)
+
+def main(seed=None, horde=0, memory_report=False, log_level=LOG_LEVEL, timings_path=None, profile_dir=None,
+         track_surfaces=False, telemetry_enabled=TELEMETRY_ENABLED, telemetry_path=None, record_path=None):
+    configure(log_level)
+    # Uncaught exceptions also write the recent log records to logs/crash-*.log
+    install_crash_handler()
+    log.info("Starting game...")
+    if record_path is not None:
+        # Before anything reads input, the clock or a random number
+        recorder.start_recording(record_path or None, seed=seed, horde=horde)
+        atexit.register(recorder.write)
+    if memory_report:
+        memory.start()
+    if telemetry_enabled:
+        telemetry.enable(telemetry_path, seed=seed)
+        atexit.register(telemetry.write)
+    # Slow frames are logged with what ran during them; cheap enough to leave on
+    hitches.install()
+    atexit.register(hitches.write)
+    if timings_path is not None:
+        timings.enable()
+        # Menus and minigames leave through sys.exit() from many places, so the file is written at interpreter exit
+        atexit.register(timings.write, timings_path or None)
+    if profile_dir is not None:
+        context_profile.enable(profile_dir or None)
+        atexit.register(context_profile.write)
+    if track_surfaces:
+        if profile_dir is not None:
+            log.warning("--track-surfaces and --profile both need the profile hook; not tracking surfaces.")
+        else:
+            # Before any font or surface is created, so they are all tracked
+            surface_tracker.install()
     pygame.init()
     pygame.mixer.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
     pygame.display.set_caption("A Superseed Odyssey: Rise of the Sapa Slayer")
     clock = pygame.time.Clock()
 
-    print("Pygame initialized. Screen and clock created.")
+    log.info("Pygame initialized. Screen and clock created.")
 
     try:
         pygame.mixer.music.load(SOUND_CUTSCENE_MUSIC)
         pygame.mixer.music.play(-1)
-        print("Cutscene music loaded and playing.")
+        log.info("Cutscene music loaded and playing.")
     except pygame.error as e:
-        print(f"Failed to load cutscene music: {e}. Continuing without music.")
+        log.warning("Failed to load cutscene music: %s. Continuing without music.", e)
 
     try:
         font = pygame.font.SysFont(DEFAULT_FONT, 24)
     except:
-        print(f"Failed to load font '{DEFAULT_FONT}'. Using default font.")
+        log.warning("Failed to load font '%s'. Using default font.", DEFAULT_FONT)
         font = pygame.font.Font(None, 24)
 
     try:
-        print(f"Attempting to load heart icon from: {HUD_HEART_ICON}")
+        log.debug("Attempting to load heart icon from: %s", HUD_HEART_ICON)
         if not os.path.exists(HUD_HEART_ICON):
             raise FileNotFoundError(f"File not found: {HUD_HEART_ICON}")
         heart_icon = pygame.image.load(HUD_HEART_ICON).convert_alpha()
         heart_icon = pygame.transform.scale(heart_icon, (20, 20))
     except (pygame.error, FileNotFoundError, Exception) as e:
-        print(f"Failed to load heart icon at {HUD_HEART_ICON}. Error: {e}. Using placeholder.")
+        log.warning("Failed to load heart icon at %s. Error: %s. Using placeholder.", HUD_HEART_ICON, e)
         heart_icon = pygame.Surface((20, 20))
         heart_icon.fill((255, 0, 0))
 
     try:
-        print(f"Attempting to load coin icon from: {HUD_COIN_ICON}")
+        log.debug("Attempting to load coin icon from: %s", HUD_COIN_ICON)
         if not os.path.exists(HUD_COIN_ICON):
             raise FileNotFoundError(f"File not found: {HUD_COIN_ICON}")
         coin_icon = pygame.image.load(HUD_COIN_ICON).convert_alpha()
         coin_icon = pygame.transform.scale(coin_icon, (20, 20))
     except (pygame.error, FileNotFoundError, Exception) as e:
-        print(f"Failed to load coin icon at {HUD_COIN_ICON}. Error: {e}. Using placeholder.")
+        log.warning("Failed to load coin icon at %s. Error: %s. Using placeholder.", HUD_COIN_ICON, e)
         coin_icon = pygame.Surface((20, 20))
         coin_icon.fill(GOLD)
 
     try:
-        print(f"Attempting to load virus icon from: {HUD_VIRUS_ICON}")
+        log.debug("Attempting to load virus icon from: %s", HUD_VIRUS_ICON)
         if not os.path.exists(HUD_VIRUS_ICON):
             raise FileNotFoundError(f"File not found: {HUD_VIRUS_ICON}")
         virus_icon = pygame.image.load(HUD_VIRUS_ICON).convert_alpha()
         virus_icon = pygame.transform.scale(virus_icon, (20, 20))
     except (pygame.error, FileNotFoundError, Exception) as e:
-        print(f"Failed to load virus icon at {HUD_VIRUS_ICON}. Error: {e}. Using placeholder.")
+        log.warning("Failed to load virus icon at %s. Error: %s. Using placeholder.", HUD_VIRUS_ICON, e)
         virus_icon = pygame.Surface((20, 20))
         virus_icon.fill((200, 0, 0))
 
     try:
-        print(f"Attempting to load ring icon from: {HUD_RING_ICON}")
+        log.debug("Attempting to load ring icon from: %s", HUD_RING_ICON)
         if not os.path.exists(HUD_RING_ICON):
             raise FileNotFoundError(f"File not found: {HUD_RING_ICON}")
         ring_icon = pygame.image.load(HUD_RING_ICON).convert_alpha()
         ring_icon = pygame.transform.scale(ring_icon, (20, 20))
     except (pygame.error, FileNotFoundError, Exception) as e:
-        print(f"Failed to load ring icon at {HUD_RING_ICON}. Error: {e}. Using placeholder.")
+        log.warning("Failed to load ring icon at %s. Error: %s. Using placeholder.", HUD_RING_ICON, e)
         ring_icon = pygame.Surface((20, 20))
         ring_icon.fill(GOLD)
 
     ui_background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
     try:
-        print(f"Attempting to load UI background from: {UI_BACKGROUND}")
+        log.debug("Attempting to load UI background from: %s", UI_BACKGROUND)
         if not os.path.exists(UI_BACKGROUND):
             raise FileNotFoundError(f"File not found: {UI_BACKGROUND}")
         ui_background = pygame.image.load(UI_BACKGROUND).convert()
         ui_background = pygame.transform.scale(ui_background, (SCREEN_WIDTH, SCREEN_HEIGHT))
     except (pygame.error, FileNotFoundError, Exception) as e:
-        print(f"Failed to load UI background at {UI_BACKGROUND}. Error: {e}. Using placeholder.")
+        log.warning("Failed to load UI background at %s. Error: %s. Using placeholder.", UI_BACKGROUND, e)
         for y in range(SCREEN_HEIGHT):
             r = 14 + (y / SCREEN_HEIGHT) * (50 - 14)
             g = 39 + (y / SCREEN_HEIGHT) * (70 - 39)
@@ -102,13 +146,13 @@ def main():
     # Load Sapa projectile sprite
     sapa_projectile_sprite = None
     try:
-        print(f"Attempting to load Sapa projectile sprite from: {SAPA_PROJECTILE}")
+        log.debug("Attempting to load Sapa projectile sprite from: %s", SAPA_PROJECTILE)
         if not os.path.exists(SAPA_PROJECTILE):
             raise FileNotFoundError(f"File not found: {SAPA_PROJECTILE}")
         sapa_projectile_sprite = pygame.image.load(SAPA_PROJECTILE).convert_alpha()
         sapa_projectile_sprite = pygame.transform.scale(sapa_projectile_sprite, (10, 10))
     except (pygame.error, FileNotFoundError, Exception) as e:
-        print(f"Failed to load Sapa projectile sprite at {SAPA_PROJECTILE}. Error: {e}. Using placeholder.")
+        log.warning("Failed to load Sapa projectile sprite at %s. Error: %s. Using placeholder.", SAPA_PROJECTILE, e)
         sapa_projectile_sprite = None
 
     # Check for saved game
@@ -120,22 +164,24 @@ def main():
         player_sprite = pygame.transform.scale(player_sprite, (TILE_SIZE, TILE_SIZE))
     else:
         player_name, player_gender, player_sprite = get_player_info(screen)
-    print(f"Player info collected: Name={player_name}, Gender={player_gender}")
+    log.info("Player info collected: Name=%s, Gender=%s", player_name, player_gender)
 
     # Load Exit Arrow sprite
     exit_arrow_sprite = None
     try:
-        print(f"Attempting to load exit arrow sprite from: {EXIT_ARROW_SPRITE}")
+        log.debug("Attempting to load exit arrow sprite from: %s", EXIT_ARROW_SPRITE)
         if not os.path.exists(EXIT_ARROW_SPRITE):
             raise FileNotFoundError(f"File not found: {EXIT_ARROW_SPRITE}")
         exit_arrow_sprite = pygame.image.load(EXIT_ARROW_SPRITE).convert_alpha()
         exit_arrow_sprite = pygame.transform.scale(exit_arrow_sprite, (30, 30))
     except (pygame.error, FileNotFoundError, Exception) as e:
-        print(f"Failed to load exit arrow sprite at {EXIT_ARROW_SPRITE}. Error: {e}. Using placeholder.")
+        log.warning("Failed to load exit arrow sprite at %s. Error: %s. Using placeholder.", EXIT_ARROW_SPRITE, e)
         exit_arrow_sprite = None
+    sprites = {"font": font, "heart": heart_icon, "coin": coin_icon, "virus": virus_icon, "ring": ring_icon,
+               "projectile": sapa_projectile_sprite, "arrow": exit_arrow_sprite}
 
     try:
-        print("Creating Player object...")
+        log.debug("Creating Player object...")
         player = Player(0, 0, player_name, player_gender, player_sprite)
         if game_state:
             player.rect.x, player.rect.y = game_state['player']['rect']
@@ -159,59 +205,66 @@ def main():
             player.inventory.supercollateral = game_state['player']['inventory']['supercollateral']
             player.inventory.fragments = game_state['player']['inventory']['fragments']
             player.inventory.has_sword = game_state['player']['inventory']['has_sword']
-        print(f"Player created: Name={player.name}, Gender={player.gender}")
+        log.info("Player created: Name=%s, Gender=%s", player.name, player.gender)
     except Exception as e:
-        print(f"Error creating Player object: {e}")
+        log.error("Error creating Player object: %s", e)
         pygame.quit()
         sys.exit()
 
     try:
-        print("Creating World object...")
+        log.debug("Creating World object...")
         vitalik_freed = game_state['vitalik_freed'] if game_state else False
-        world = World(player, vitalik_freed)
+        if game_state and seed is None:
+            # Older saves have no seed; those worlds get a fresh one
+            seed = game_state['world'].get('seed')
+        world = World(player, vitalik_freed, seed=seed,
+                      scene_deltas=game_state['world'].get('scene_deltas') if game_state else None)
+        log.info("World seed: %s", world.seed)
         if game_state:
             world.current_area = game_state['world']['current_area']
             world.current_scene = game_state['world']['current_scene']
-        print("World object created.")
+        log.debug("World object created.")
+        if memory_report:
+            memory.report(world, "world loaded")
     except Exception as e:
-        print(f"Error creating World object: {e}")
+        log.error("Error creating World object: %s", e)
         pygame.quit()
         sys.exit()
 
     current_scene = world.get_current_scene()
     start_x, start_y = current_scene.maze.find_open_start_position()
     player.rect.x, player.rect.y = start_x, start_y
-    print(f"Player positioned at: ({player.rect.x}, {player.rect.y})")
+    log.info("Player positioned at: (%s, %s)", player.rect.x, player.rect.y)
 
-    print("Creating Checkpoints, Combat, and DialogueBox...")
+    log.debug("Creating Checkpoints, Combat, and DialogueBox...")
     try:
-        print("Creating Checkpoints object...")
+        log.debug("Creating Checkpoints object...")
         checkpoints = CheckpointSystem()
-        print("Checkpoints object created.")
+        log.debug("Checkpoints object created.")
     except Exception as e:
-        print(f"Error creating Checkpoints object: {e}")
+        log.error("Error creating Checkpoints object: %s", e)
         pygame.quit()
         sys.exit()
 
     try:
-        print("Creating Combat object...")
+        log.debug("Creating Combat object...")
         combat = CombatSystem()
-        print("Combat object created.")
+        log.debug("Combat object created.")
     except Exception as e:
-        print(f"Error creating Combat object: {e}")
+        log.error("Error creating Combat object: %s", e)
         pygame.quit()
         sys.exit()
 
     try:
-        print("Creating DialogueBox object...")
+        log.debug("Creating DialogueBox object...")
         dialogue_box = DialogueBox()
-        print("DialogueBox object created.")
+        log.debug("DialogueBox object created.")
     except Exception as e:
-        print(f"Error creating DialogueBox object: {e}")
+        log.error("Error creating DialogueBox object: %s", e)
         pygame.quit()
         sys.exit()
 
-    print("World, Checkpoints, Combat, and DialogueBox created.")
+    log.info("World, Checkpoints, Combat, and DialogueBox created.")
 
     minigames = get_minigames()
     vitalik_freed = game_state['vitalik_freed'] if game_state else False
@@ -222,6 +275,7 @@ def main():
 
     for area in world.areas:
         for scene in area.scenes:
+            npc_rng = scene.stream("npcs")
             if area.area_id == 0 and scene.scene_id == 2:
                 scene.npc = NPC(scene, is_vitalik=True)
                 if vitalik_freed:
@@ -233,44 +287,44 @@ def main():
                 npc_with_lore.lore = ["The gods rendered this area free of Sapa while Vitalik remained trapped."]
                 npc_with_lore.rect = pygame.Rect(start_x + TILE_SIZE, start_y + TILE_SIZE, TILE_SIZE, TILE_SIZE)
                 scene.npcs.append(npc_with_lore)
-                num_additional_npcs = random.randint(2, 4)
+                num_additional_npcs = npc_rng.randint(2, 4)
                 for _ in range(num_additional_npcs):
                     new_npc = NPC(scene, is_vitalik=False)
                     scene.npcs.append(new_npc)
             elif area.area_id in range(1, 6) and scene.scene_id == area.sapa_free_scene:
                 scene.npcs = []
-                num_npcs = random.randint(3, 5)
+                num_npcs = npc_rng.randint(3, 5)
                 for _ in range(num_npcs):
                     new_npc = NPC(scene, is_vitalik=False)
                     scene.npcs.append(new_npc)
             else:
-                if vitalik_freed and (area.area_id > 0 or scene.scene_id >= 3) and random.random() < 0.3:
+                if vitalik_freed and (area.area_id > 0 or scene.scene_id >= 3) and npc_rng.random() < 0.3:
                     if not scene.npc or not scene.npc.is_vitalik:
                         new_vendor = NPC(scene, is_vendor=True)
                         if not hasattr(scene, 'npcs'):
                             scene.npcs = []
                         scene.npcs.append(new_vendor)
-                if player.inventory.has_sword and random.random() < 0.3:
+                if player.inventory.has_sword and npc_rng.random() < 0.3:
                     if not scene.npc or not scene.npc.is_vitalik:
-                        is_crypto_scholar = random.random() < 0.2
+                        is_crypto_scholar = npc_rng.random() < 0.2
                         new_npc = NPC(scene, is_crypto_scholar=is_crypto_scholar)
                         if not hasattr(scene, 'npcs'):
                             scene.npcs = []
                         scene.npcs.append(new_npc)
-            if random.random() < 0.2:
-                scene.minigame = random.choice(minigames)
-    print("NPCs, vendors, and minigames placed in scenes.")
+            if npc_rng.random() < 0.2:
+                scene.minigame = npc_rng.choice(minigames)
+    log.info("NPCs, vendors, and minigames placed in scenes.")
 
     paused = True  # Pause the game state before the intro cutscene
     if not game_state:
         try:
             if not play_intro_cutscene(screen, clock, player, ui_background):
-                print("Intro cutscene failed or skipped.")
+                log.info("Intro cutscene failed or skipped.")
                 pygame.quit()
                 sys.exit()
-            print("Intro cutscene completed.")
+            log.info("Intro cutscene completed.")
         except Exception as e:
-            print(f"Error during intro cutscene: {e}")
+            log.error("Error during intro cutscene: %s", e)
             pygame.quit()
             sys.exit()
     paused = False
@@ -279,9 +333,9 @@ def main():
         pygame.mixer.music.stop()
         pygame.mixer.music.load(SOUND_GAME_MUSIC)
         pygame.mixer.music.play(-1)
-        print("Game music loaded and playing.")
+        log.info("Game music loaded and playing.")
     except pygame.error as e:
-        print(f"Failed to load game music: {e}. Continuing without music.")
+        log.warning("Failed to load game music: %s. Continuing without music.", e)
 
     choice_made = game_state['choice_made'] if game_state else False
     self_save_choice_made = game_state['self_save_choice_made'] if game_state else False
@@ -300,13 +354,20 @@ def main():
                     vitalik = scene.npc
                     break
 
-    last_time = pygame.time.get_ticks()
+    # Gameplay advances in fixed ticks; rendering runs as fast as MAX_RENDER_FPS allows and
+    # interpolates moving things between the last two ticks.
+    timestep = FixedTimestep(clock=recorder.timestep_clock())
+    interpolator = Interpolator()
+    scheduler = gameloop.new_scheduler()
+    perf = PerfOverlay()
     paused = False
     show_minimap = False
     consecutive_losses = 0
     last_scene = None
     last_area = -1
-    projectiles = []
+    projectiles = ProjectileBuffer()
+    # A lambda so a recording's state digests follow the world rebuilt on restart
+    recorder.watch(lambda: (player, world, projectiles, combat, timestep))
     infection_active = True
     game_over = False
     music_volume = 1.0
@@ -315,11 +376,10 @@ def main():
     fullscreen = False
 
     while not game_over:
-        delta_time = 0
-        if not paused:
-            current_time = pygame.time.get_ticks()
-            delta_time = (current_time - last_time) / 1000.0
-            last_time = current_time
+        perf.begin_frame()
+        timings.tick()
+        context_profile.set_scene(world.current_area, world.current_scene)
+        timestep.advance()
 
         current_scene = world.get_current_scene()
         sapas = current_scene.sapas
@@ -337,7 +397,7 @@ def main():
 
                 paused = True
                 if not play_area_cutscene(screen, clock, player, world.current_area, ui_background):
-                    print("Area cutscene skipped or failed, continuing to game loop.")
+                    log.info("Area cutscene skipped or failed, continuing to game loop.")
                 last_area = world.current_area
                 paused = False
 
@@ -346,12 +406,7 @@ def main():
                     current_scene.draw(screen)
                     for sapa in sapas:
                         sapa.draw(screen)
-                    for proj in projectiles:
-                        rect, dx, dy = proj
-                        if sapa_projectile_sprite:
-                            screen.blit(sapa_projectile_sprite, (rect.x, rect.y))
-                        else:
-                            pygame.draw.rect(screen, (255, 0, 0), rect)
+                    projectiles.draw(screen, sapa_projectile_sprite)
                     if current_scene.npc:
                         current_scene.npc.draw(screen)
                     if hasattr(current_scene, 'npcs'):
@@ -376,10 +431,10 @@ def main():
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in main loop.")
+                log.info("Quit event in main loop.")
                 game_over = True
             if event.type == pygame.KEYDOWN:
-                print(f"Key pressed in main loop: {event.key}")
+                log.debug("Key pressed in main loop: %s", event.key)
                 if event.key == pygame.K_p and not dialogue_box.active:
                     paused = True
                     show_minimap = show_pause_menu(screen, player, dialogue_box, ui_background, world, checkpoints,
@@ -430,7 +485,7 @@ def main():
                                     while dialogue_box.active:
                                         for event in pygame.event.get():
                                             if event.type == pygame.QUIT:
-                                                print("Quit event in Vitalik freed dialogue.")
+                                                log.info("Quit event in Vitalik freed dialogue.")
                                                 pygame.quit()
                                                 sys.exit()
                                             if event.type == pygame.KEYDOWN:
@@ -452,7 +507,7 @@ def main():
                                 while dialogue_box.active:
                                     for event in pygame.event.get():
                                         if event.type == pygame.QUIT:
-                                            print("Quit event in NPC lore dialogue.")
+                                            log.info("Quit event in NPC lore dialogue.")
                                             pygame.quit()
                                             sys.exit()
                                         if event.type == pygame.KEYDOWN:
@@ -475,7 +530,7 @@ def main():
                                             while dialogue_box.active:
                                                 for event in pygame.event.get():
                                                     if event.type == pygame.QUIT:
-                                                        print("Quit event in vendor prompt.")
+                                                        log.info("Quit event in vendor prompt.")
                                                         pygame.quit()
                                                         sys.exit()
                                                     if event.type == pygame.KEYDOWN:
@@ -503,7 +558,7 @@ def main():
                                         while dialogue_box.active:
                                             for event in pygame.event.get():
                                                 if event.type == pygame.QUIT:
-                                                    print("Quit event in NPC lore dialogue.")
+                                                    log.info("Quit event in NPC lore dialogue.")
                                                     pygame.quit()
                                                     sys.exit()
                                                 if event.type == pygame.KEYDOWN:
@@ -524,7 +579,7 @@ def main():
                             while dialogue_box.active:
                                 for event in pygame.event.get():
                                     if event.type == pygame.QUIT:
-                                        print("Quit event in minigame prompt.")
+                                        log.info("Quit event in minigame prompt.")
                                         pygame.quit()
                                         sys.exit()
                                     if event.type == pygame.KEYDOWN:
@@ -548,7 +603,7 @@ def main():
                                 while dialogue_box.active:
                                     for event in pygame.event.get():
                                         if event.type == pygame.QUIT:
-                                            print("Quit event in sword acquired dialogue.")
+                                            log.info("Quit event in sword acquired dialogue.")
                                             pygame.quit()
                                             sys.exit()
                                         if event.type == pygame.KEYDOWN:
@@ -567,7 +622,7 @@ def main():
                                 infection_active = False
                             paused = False
                     if event.key == pygame.K_y and not dialogue_box.active and current_scene.minigame:
-                        print("Starting minigame...")
+                        log.info("Starting minigame...")
                         minigame_dict = current_scene.minigame
                         minigame_func = minigame_dict["func"]
                         requires_gender = minigame_dict["requires_gender"]
@@ -584,7 +639,7 @@ def main():
                                     while dialogue_box.active:
                                         for event in pygame.event.get():
                                             if event.type == pygame.QUIT:
-                                                print("Quit event in minigame success dialogue.")
+                                                log.info("Quit event in minigame success dialogue.")
                                                 pygame.quit()
                                                 sys.exit()
                                             if event.type == pygame.KEYDOWN:
@@ -603,7 +658,7 @@ def main():
                                     while dialogue_box.active:
                                         for event in pygame.event.get():
                                             if event.type == pygame.QUIT:
-                                                print("Quit event in minigame failure dialogue.")
+                                                log.info("Quit event in minigame failure dialogue.")
                                                 pygame.quit()
                                                 sys.exit()
                                             if event.type == pygame.KEYDOWN:
@@ -622,7 +677,7 @@ def main():
                                     while dialogue_box.active:
                                         for event in pygame.event.get():
                                             if event.type == pygame.QUIT:
-                                                print("Quit event in minigame cancelled dialogue.")
+                                                log.info("Quit event in minigame cancelled dialogue.")
                                                 pygame.quit()
                                                 sys.exit()
                                             if event.type == pygame.KEYDOWN:
@@ -637,14 +692,14 @@ def main():
                                         clock.tick(FPS)
                                     break
                             except Exception as e:
-                                print(f"Error in minigame {minigame_func.__name__}: {e}")
+                                log.error("Error in minigame %s: %s", minigame_func.__name__, e)
                                 available_minigames.remove(minigame_dict)
                                 if not available_minigames:
                                     dialogue_box.show(["All minigames failed to load. No reward this time."], context="default")
                                     while dialogue_box.active:
                                         for event in pygame.event.get():
                                             if event.type == pygame.QUIT:
-                                                print("Quit event in minigame failure dialogue.")
+                                                log.info("Quit event in minigame failure dialogue.")
                                                 pygame.quit()
                                                 sys.exit()
                                             if event.type == pygame.KEYDOWN:
@@ -665,7 +720,7 @@ def main():
                                 while dialogue_box.active:
                                     for event in pygame.event.get():
                                         if event.type == pygame.QUIT:
-                                            print("Quit event in minigame retry dialogue.")
+                                            log.info("Quit event in minigame retry dialogue.")
                                             pygame.quit()
                                             sys.exit()
                                         if event.type == pygame.KEYDOWN:
@@ -679,7 +734,7 @@ def main():
                                     pygame.display.flip()
                                     clock.tick(FPS)
                                 break
-                        print("Minigame completed.")
+                        log.info("Minigame completed.")
                     if event.key == pygame.K_n and not dialogue_box.active:
                         current_scene.minigame = None
                     if event.key == pygame.K_o:
@@ -691,277 +746,147 @@ def main():
                         paused = False
                     if event.key == pygame.K_m:
                         show_minimap = not show_minimap
+                if event.key == pygame.K_F3:
+                    perf.toggle()
+                if event.key == pygame.K_F4 and surface_tracker.installed():
+                    surface_tracker.report()
+        perf.lap("events")
 
-        if not paused and not dialogue_box.active:
-            # Sapa spawning logic: Maintain up to 5 Sapa, but not in Sapa-free scenes
-            if (world.current_area > 0 or world.current_scene != 2) and world.current_scene != world.areas[
-                world.current_area].sapa_free_scene and len(sapas) < 5:
-                spawn_probability = 0.1 if player.inventory.has_sword and world.current_scene < 4 else 0.05
-                if random.random() < spawn_probability:
-                    available_sapa_types = [Sapa, DiagonalSapa]
-                    if world.current_area >= 1 and player.inventory.has_sword:
-                        available_sapa_types.append(ChaserSapa)
-                    if world.current_area >= 2:
-                        available_sapa_types.append(SplitterSapa)
-                    if world.current_area >= 3:
-                        available_sapa_types.append(ProjectileSapa)
-                    sapa_type = random.choice(available_sapa_types)
-                    new_sapa = sapa_type(current_scene, player.level)
-                    sapas.append(new_sapa)
-                    print(f"Spawned new Sapa: {new_sapa.name}, Total Sapa: {len(sapas)}")
-
-            keys = pygame.key.get_pressed()
-            player.move(keys, current_scene.maze)
+        while not paused and not dialogue_box.active and not game_over and timestep.step():
+            current_scene = gameloop.begin_tick(world, player, vitalik, combat, scheduler, interpolator, horde)
+            sapas = current_scene.sapas
 
-            if vitalik and vitalik.following:
-                dx = player.rect.x - vitalik.rect.x
-                dy = player.rect.y - vitalik.rect.y
-                distance = (dx ** 2 + dy ** 2) ** 0.5
-                if distance > TILE_SIZE * 1.5:
-                    speed = 3
-                    if distance != 0:
-                        dx = dx / distance * speed
-                        dy = dy / distance * speed
-                    new_rect = vitalik.rect.copy()
-                    new_rect.x += dx
-                    new_rect.y += dy
-                    if not current_scene.maze.collides(new_rect):
-                        vitalik.rect.x = new_rect.x
-                        vitalik.rect.y = new_rect.y
-                    else:
-                        new_rect_x = vitalik.rect.copy()
-                        new_rect_x.x += dx
-                        if not current_scene.maze.collides(new_rect_x):
-                            vitalik.rect.x = new_rect_x.x
-                        new_rect_y = vitalik.rect.copy()
-                        new_rect_y.y += dy
-                        if not current_scene.maze.collides(new_rect_y):
-                            vitalik.rect.y = new_rect_y.y
-
-            entry_x, entry_y = current_scene.entry
-            exit_x, exit_y = current_scene.exit
+            with timings.scope("sim.exit_check"):
+                entry_x, entry_y = current_scene.entry
+                exit_x, exit_y = current_scene.exit
 
-            playable_height = SCREEN_HEIGHT - HUD_HEIGHT
-            tile_height = playable_height / MAZE_HEIGHT
+                playable_height = SCREEN_HEIGHT - HUD_HEIGHT
+                tile_height = playable_height / MAZE_HEIGHT
 
-            if exit_x == MAZE_WIDTH - 1:
-                exit_rect = pygame.Rect((exit_x - 1) * TILE_SIZE, (exit_y * tile_height) + HUD_HEIGHT,
-                                        TILE_SIZE * 2, int(tile_height * 2))
-            elif exit_y == MAZE_HEIGHT - 1:
-                exit_rect = pygame.Rect(exit_x * TILE_SIZE, (exit_y * tile_height) + HUD_HEIGHT,
-                                        TILE_SIZE * 2, int(tile_height * 2))
-            elif exit_y == 0:
-                exit_rect = pygame.Rect(exit_x * TILE_SIZE, HUD_HEIGHT,
-                                        TILE_SIZE * 2, int(tile_height * 2))
-            elif exit_x == 0:
-                exit_rect = pygame.Rect(0, (exit_y * tile_height) + HUD_HEIGHT,
-                                        TILE_SIZE * 2, int(tile_height * 2))
-            else:
-                exit_rect = pygame.Rect(exit_x * TILE_SIZE, (exit_y * tile_height) + HUD_HEIGHT,
-                                        TILE_SIZE * 2, int(tile_height * 2))
+                if exit_x == MAZE_WIDTH - 1:
+                    exit_rect = pygame.Rect((exit_x - 1) * TILE_SIZE, (exit_y * tile_height) + HUD_HEIGHT,
+                                            TILE_SIZE * 2, int(tile_height * 2))
+                elif exit_y == MAZE_HEIGHT - 1:
+                    exit_rect = pygame.Rect(exit_x * TILE_SIZE, (exit_y * tile_height) + HUD_HEIGHT,
+                                            TILE_SIZE * 2, int(tile_height * 2))
+                elif exit_y == 0:
+                    exit_rect = pygame.Rect(exit_x * TILE_SIZE, HUD_HEIGHT,
+                                            TILE_SIZE * 2, int(tile_height * 2))
+                elif exit_x == 0:
+                    exit_rect = pygame.Rect(0, (exit_y * tile_height) + HUD_HEIGHT,
+                                            TILE_SIZE * 2, int(tile_height * 2))
+                else:
+                    exit_rect = pygame.Rect(exit_x * TILE_SIZE, (exit_y * tile_height) + HUD_HEIGHT,
+                                            TILE_SIZE * 2, int(tile_height * 2))
 
-            if "east" in current_scene.exits and player.rect.colliderect(exit_rect):
-                print(
-                    f"Player collided with exit at ({exit_x}, {exit_y}), moving east. Player rect: {player.rect}, Exit rect: {exit_rect}")
-                if world.current_area == 0 and world.current_scene == 2 and not vitalik_freed:
-                    paused = True
-                    dialogue_box.show(["Vitalik: You must free me before we can proceed! Press E to interact."], context="default")
-                    while dialogue_box.active:
-                        for event in pygame.event.get():
-                            if event.type == pygame.QUIT:
-                                print("Quit event in prompt.")
-                                game_over = True
-                                break
-                            if event.type == pygame.KEYDOWN:
-                                if event.key == pygame.K_SPACE:
-                                    dialogue_box.next_line()
-                                elif event.key == pygame.K_ESCAPE:
-                                    dialogue_box.active = False
-                                    break
-                        screen.fill(BLACK)
-                        current_scene.draw(screen)
-                        for sapa in sapas:
-                            sapa.draw(screen)
-                        for proj in projectiles:
-                            rect, dx, dy = proj
-                            if sapa_projectile_sprite:
-                                screen.blit(sapa_projectile_sprite, (rect.x, rect.y))
-                            else:
-                                pygame.draw.rect(screen, (255, 0, 0), rect)
-                        if current_scene.npc:
-                            current_scene.npc.draw(screen)
-                        if hasattr(current_scene, 'npcs'):
-                            for npc in current_scene.npcs:
-                                npc.draw(screen)
-                        if vitalik and vitalik.following:
-                            vitalik.draw(screen)
-                        player.draw(screen)
-                        combat.draw(screen)
-                        draw_ui(screen, player, world, font, heart_icon, coin_icon, virus_icon, ring_icon,
-                                infection_active)
-                        draw_labels(screen, current_scene, player, font)
-                        draw_exits(screen, current_scene, font, exit_arrow_sprite)
-                        if show_minimap:
-                            draw_minimap(screen, current_scene, player, font)
-                        apply_critical_tint(screen, infection_active, player)
-                        dialogue_box.draw(screen)
-                        pygame.display.flip()
-                        clock.tick(FPS)
-                    paused = False
-                    continue
-                if world.current_area == 0 and world.current_scene == 4 and (
-                        not player.inventory.has_sword or not player.world_choice_made):
-                    dialogue_box.show([
-                        "You must acquire the Sword of Solvency and choose your path before proceeding to the next area!"], context="default")
-                    while dialogue_box.active:
-                        for event in pygame.event.get():
-                            if event.type == pygame.QUIT:
-                                print("Quit event in prompt.")
-                                pygame.quit()
-                                sys.exit()
-                            if event.type == pygame.KEYDOWN:
-                                if event.key == pygame.K_SPACE:
-                                    dialogue_box.next_line()
-                                elif event.key == pygame.K_ESCAPE:
-                                    dialogue_box.active = False
+                if "east" in current_scene.exits and player.rect.colliderect(exit_rect):
+                    log.info("Player collided with exit at (%s, %s), moving east. Player rect: %s, Exit rect: %s", exit_x, exit_y, player.rect, exit_rect)
+                    if world.current_area == 0 and world.current_scene == 2 and not vitalik_freed:
+                        paused = True
+                        dialogue_box.show(["Vitalik: You must free me before we can proceed! Press E to interact."], context="default")
+                        while dialogue_box.active:
+                            for event in pygame.event.get():
+                                if event.type == pygame.QUIT:
+                                    log.info("Quit event in prompt.")
+                                    game_over = True
                                     break
-                        screen.blit(ui_background, (0, 0))
-                        dialogue_box.draw(screen)
-                        pygame.display.flip()
-                        clock.tick(FPS)
-                    continue
-                world.move_to_scene("east")
-                current_scene = world.get_current_scene()
-                start_x, start_y = current_scene.maze.find_open_start_position()
-                player.rect.x, player.rect.y = start_x, start_y
-                if vitalik and vitalik.following:
-                    vitalik.rect.x, vitalik.rect.y = start_x + TILE_SIZE, start_y
-                current_scene.sapas.clear()
-                if world.current_area != 0 or world.current_scene != 2:
-                    current_scene.npcs = []
-                if not player.inventory.has_sword or not player.world_choice_made:
-                    current_scene.sword = None
-                current_scene.minigame = None
-                projectiles.clear()
+                                if event.type == pygame.KEYDOWN:
+                                    if event.key == pygame.K_SPACE:
+                                        dialogue_box.next_line()
+                                    elif event.key == pygame.K_ESCAPE:
+                                        dialogue_box.active = False
+                                        break
+                            screen.fill(BLACK)
+                            current_scene.draw(screen)
+                            for sapa in sapas:
+                                sapa.draw(screen)
+                            projectiles.draw(screen, sapa_projectile_sprite)
+                            if current_scene.npc:
+                                current_scene.npc.draw(screen)
+                            if hasattr(current_scene, 'npcs'):
+                                for npc in current_scene.npcs:
+                                    npc.draw(screen)
+                            if vitalik and vitalik.following:
+                                vitalik.draw(screen)
+                            player.draw(screen)
+                            combat.draw(screen)
+                            draw_ui(screen, player, world, font, heart_icon, coin_icon, virus_icon, ring_icon,
+                                    infection_active)
+                            draw_labels(screen, current_scene, player, font)
+                            draw_exits(screen, current_scene, font, exit_arrow_sprite)
+                            if show_minimap:
+                                draw_minimap(screen, current_scene, player, font)
+                            apply_critical_tint(screen, infection_active, player)
+                            dialogue_box.draw(screen)
+                            pygame.display.flip()
+                            clock.tick(FPS)
+                        paused = False
+                        continue
+                    if world.current_area == 0 and world.current_scene == 4 and (
+                            not player.inventory.has_sword or not player.world_choice_made):
+                        dialogue_box.show([
+                            "You must acquire the Sword of Solvency and choose your path before proceeding to the next area!"], context="default")
+                        while dialogue_box.active:
+                            for event in pygame.event.get():
+                                if event.type == pygame.QUIT:
+                                    log.info("Quit event in prompt.")
+                                    pygame.quit()
+                                    sys.exit()
+                                if event.type == pygame.KEYDOWN:
+                                    if event.key == pygame.K_SPACE:
+                                        dialogue_box.next_line()
+                                    elif event.key == pygame.K_ESCAPE:
+                                        dialogue_box.active = False
+                                        break
+                            screen.blit(ui_background, (0, 0))
+                            dialogue_box.draw(screen)
+                            pygame.display.flip()
+                            clock.tick(FPS)
+                        continue
+                    world.move_to_scene("east")
+                    current_scene = world.get_current_scene()
+                    start_x, start_y = current_scene.maze.find_open_start_position()
+                    player.rect.x, player.rect.y = start_x, start_y
+                    if vitalik and vitalik.following:
+                        vitalik.rect.x, vitalik.rect.y = start_x + TILE_SIZE, start_y
+                    current_scene.sapas.clear()
+                    if world.current_area != 0 or world.current_scene != 2:
+                        current_scene.npcs = []
+                    if not player.inventory.has_sword or not player.world_choice_made:
+                        current_scene.sword = None
+                    current_scene.minigame = None
+                    projectiles.clear()
 
-            for token in current_scene.tokens[:]:
-                if player.rect.colliderect(token):
+            with timings.scope("sim.pickups"):
+                # The index is re-synced on the schedule; overlap is tested every tick, since a corner clip can
+                # touch a pickup for a single tick
+                if scheduler.due("pickups"):
+                    current_scene.sync_pickups()
+                for token in current_scene.pickup_index.query(player.rect, "token"):
                     current_scene.tokens.remove(token)
+                    current_scene.pickup_index.remove(token)
                     if player.inventory.has_sword:
                         player.inventory.add_supercollateral(5)
                     else:
                         player.update_infection(-10)
-            for checkpoint in current_scene.checkpoints:
-                if player.rect.colliderect(checkpoint):
+                for checkpoint in current_scene.pickup_index.query(player.rect, "checkpoint"):
                     checkpoints.save(player)
-            if current_scene.npc and current_scene.npc.is_vitalik and not vitalik_freed and player.rect.colliderect(
-                    current_scene.npc.rect):
-                paused = True
-                if not vitalik_cutscene(screen, clock, player, dialogue_box, ui_background):
-                    game_over = True
-                if play_vitalik_puzzle(screen, clock, dialogue_box, ui_background, player_gender):
-                    vitalik_freed = True
-                    current_scene.npc.is_freed = True
-                    current_scene.npc.following = True
-                    vitalik = current_scene.npc
-                    dialogue_box.show(["Vitalik: I am freed! Let’s find the Sword of Solvency together."], context="default")
-                    while dialogue_box.active:
-                        for event in pygame.event.get():
-                            if event.type == pygame.QUIT:
-                                print("Quit event in Vitalik freed dialogue.")
-                                pygame.quit()
-                                sys.exit()
-                            if event.type == pygame.KEYDOWN:
-                                if event.key == pygame.K_SPACE:
-                                    dialogue_box.next_line()
-                                elif event.key == pygame.K_ESCAPE:
-                                    dialogue_box.active = False
-                                    break
-                        screen.blit(ui_background, (0, 0))
-                        dialogue_box.draw(screen)
-                        pygame.display.flip()
-                        clock.tick(FPS)
-                else:
-                    game_over = True
-                paused = False
-            if current_scene.npc and current_scene.npc.is_vitalik and current_scene.npc.is_freed and not choice_made and player.inventory.has_sword:
-                paused = True
-                choice = vitalik_choice(screen, clock, player, dialogue_box, ui_background)
-                choice_made = True
-                if choice == "self" and not self_save_choice_made:
-                    self_save_choice_made = True
-                    player.lose_sword()
-                    infection_active = True
-                    while True:
-                        x, y = current_scene.find_open_position()
-                        distance = ((x - player.rect.x) ** 2 + (y - player.rect.y) ** 2) ** 0.5
-                        if distance > 5 * TILE_SIZE:
-                            current_scene.sword = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-                            break
-                    for _ in range(5):
-                        new_sapa = Sapa(current_scene, player.level)
-                        sapas.append(new_sapa)
-                elif choice == "world":
-                    player.world_choice_made = True
-                    dialogue_box.show([
-                        f"Vitalik: A true hero rises! I knew you had it in you, {player.name}! The first fragment’s light will cleanse your infection completely.",
-                        "Vitalik: Together, we’ll gather the fragments, defeat Skuld, and bring prosperity back to Krypto—let’s do this!"
-                    ], context="default")
-                    while dialogue_box.active:
-                        for event in pygame.event.get():
-                            if event.type == pygame.QUIT:
-                                print("Quit event in world choice dialogue.")
-                                pygame.quit()
-                                sys.exit()
-                            if event.type == pygame.KEYDOWN:
-                                if event.key == pygame.K_SPACE:
-                                    dialogue_box.next_line()
-                                elif event.key == pygame.K_ESCAPE:
-                                    dialogue_box.active = False
-                                    break
-                        screen.blit(ui_background, (0, 0))
-                        dialogue_box.draw(screen)
-                        pygame.display.flip()
-                        clock.tick(FPS)
-                    choice_made = True
-                paused = False
-            if current_scene.sword and player.rect.colliderect(
-                    current_scene.sword) and vitalik_freed and not player.inventory.has_sword:
-                paused = True
-                if play_sword_puzzle(screen, clock, dialogue_box, ui_background, player_gender):
-                    player.inventory.add_sword()
-                    infection_active = False
-                    current_scene.sword = None
-                    dialogue_box.show([f"Vitalik: {player.name} acquired the Sword of Solvency!"], context="default")
-                    while dialogue_box.active:
-                        for event in pygame.event.get():
-                            if event.type == pygame.QUIT:
-                                print("Quit event in sword acquired dialogue.")
-                                pygame.quit()
-                                sys.exit()
-                            if event.type == pygame.KEYDOWN:
-                                if event.key == pygame.K_SPACE:
-                                    dialogue_box.next_line()
-                                elif event.key == pygame.K_ESCAPE:
-                                    dialogue_box.active = False
-                                    break
-                        screen.blit(ui_background, (0, 0))
-                        dialogue_box.draw(screen)
-                        pygame.display.flip()
-                        clock.tick(FPS)
-                if self_save_choice_made and player.inventory.has_sword:
-                    choice_made = False
-                    self_save_choice_made = False
-                    infection_active = False
-                paused = False
-            for fragment in current_scene.fragments[:]:
-                if player.rect.colliderect(fragment):
-                    if current_scene.boss and current_scene.boss.hp > 0:
-                        dialogue_box.show(["Vitalik: Defeat the boss to claim the fragment!"], context="default")
+            with timings.scope("sim.interactions"):
+                if current_scene.npc and current_scene.npc.is_vitalik and not vitalik_freed and player.rect.colliderect(
+                        current_scene.npc.rect):
+                    paused = True
+                    if not vitalik_cutscene(screen, clock, player, dialogue_box, ui_background):
+                        game_over = True
+                    if play_vitalik_puzzle(screen, clock, dialogue_box, ui_background, player_gender):
+                        vitalik_freed = True
+                        current_scene.npc.is_freed = True
+                        current_scene.npc.following = True
+                        vitalik = current_scene.npc
+                        dialogue_box.show(["Vitalik: I am freed! Let’s find the Sword of Solvency together."], context="default")
                         while dialogue_box.active:
                             for event in pygame.event.get():
                                 if event.type == pygame.QUIT:
-                                    print("Quit event in boss prompt.")
+                                    log.info("Quit event in Vitalik freed dialogue.")
                                     pygame.quit()
                                     sys.exit()
                                 if event.type == pygame.KEYDOWN:
@@ -975,16 +900,87 @@ def main():
                             pygame.display.flip()
                             clock.tick(FPS)
                     else:
-                        player.collect_fragment()
+                        game_over = True
+                    paused = False
+                if current_scene.npc and current_scene.npc.is_vitalik and current_scene.npc.is_freed and not choice_made and player.inventory.has_sword:
+                    paused = True
+                    choice = vitalik_choice(screen, clock, player, dialogue_box, ui_background)
+                    choice_made = True
+                    if choice == "self" and not self_save_choice_made:
+                        self_save_choice_made = True
+                        player.lose_sword()
+                        infection_active = True
+                        while True:
+                            x, y = current_scene.find_open_position()
+                            distance = ((x - player.rect.x) ** 2 + (y - player.rect.y) ** 2) ** 0.5
+                            if distance > 5 * TILE_SIZE:
+                                current_scene.sword = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
+                                break
+                        for _ in range(5):
+                            new_sapa = Sapa(current_scene, player.level)
+                            sapas.append(new_sapa)
+                    elif choice == "world":
+                        player.world_choice_made = True
+                        dialogue_box.show([
+                            f"Vitalik: A true hero rises! I knew you had it in you, {player.name}! The first fragment’s light will cleanse your infection completely.",
+                            "Vitalik: Together, we’ll gather the fragments, defeat Skuld, and bring prosperity back to Krypto—let’s do this!"
+                        ], context="default")
+                        while dialogue_box.active:
+                            for event in pygame.event.get():
+                                if event.type == pygame.QUIT:
+                                    log.info("Quit event in world choice dialogue.")
+                                    pygame.quit()
+                                    sys.exit()
+                                if event.type == pygame.KEYDOWN:
+                                    if event.key == pygame.K_SPACE:
+                                        dialogue_box.next_line()
+                                    elif event.key == pygame.K_ESCAPE:
+                                        dialogue_box.active = False
+                                        break
+                            screen.blit(ui_background, (0, 0))
+                            dialogue_box.draw(screen)
+                            pygame.display.flip()
+                            clock.tick(FPS)
+                        choice_made = True
+                    paused = False
+                if current_scene.sword and player.rect.colliderect(
+                        current_scene.sword) and vitalik_freed and not player.inventory.has_sword:
+                    paused = True
+                    if play_sword_puzzle(screen, clock, dialogue_box, ui_background, player_gender):
+                        player.inventory.add_sword()
                         infection_active = False
-                        current_scene.fragments.remove(fragment)
-                        if player.inventory.fragments == 1:
-                            infection_active = False
-                            dialogue_box.show(["Vitalik: The first fragment has fully cured your infection!"], context="default")
+                        current_scene.sword = None
+                        dialogue_box.show([f"Vitalik: {player.name} acquired the Sword of Solvency!"], context="default")
+                        while dialogue_box.active:
+                            for event in pygame.event.get():
+                                if event.type == pygame.QUIT:
+                                    log.info("Quit event in sword acquired dialogue.")
+                                    pygame.quit()
+                                    sys.exit()
+                                if event.type == pygame.KEYDOWN:
+                                    if event.key == pygame.K_SPACE:
+                                        dialogue_box.next_line()
+                                    elif event.key == pygame.K_ESCAPE:
+                                        dialogue_box.active = False
+                                        break
+                            screen.blit(ui_background, (0, 0))
+                            dialogue_box.draw(screen)
+                            pygame.display.flip()
+                            clock.tick(FPS)
+                    if self_save_choice_made and player.inventory.has_sword:
+                        choice_made = False
+                        self_save_choice_made = False
+                        infection_active = False
+                    paused = False
+            with timings.scope("sim.fragments"):
+                for fragment in current_scene.pickup_index.query(player.rect, "fragment"):
+                    if fragment in current_scene.fragments:
+                        if current_scene.boss and current_scene.boss.hp > 0:
+                            dialogue_box.show(["Vitalik: Defeat the boss to claim the fragment!"], context="default")
                             while dialogue_box.active:
                                 for event in pygame.event.get():
                                     if event.type == pygame.QUIT:
-                                        print("Quit event in fragment dialogue.")
+                                        log.info("Quit event in boss prompt.")
                                         pygame.quit()
                                         sys.exit()
                                     if event.type == pygame.KEYDOWN:
@@ -997,121 +993,119 @@ def main():
                                 dialogue_box.draw(screen)
                                 pygame.display.flip()
                                 clock.tick(FPS)
-                        if player.inventory.fragments < 6:
-                            world.current_area += 1
+                        else:
+                            player.collect_fragment()
+                            combat.particles.emit("fragment", fragment.centerx, fragment.centery)
+                            infection_active = False
+                            current_scene.fragments.remove(fragment)
+                            if player.inventory.fragments == 1:
+                                infection_active = False
+                                dialogue_box.show(["Vitalik: The first fragment has fully cured your infection!"], context="default")
+                                while dialogue_box.active:
+                                    for event in pygame.event.get():
+                                        if event.type == pygame.QUIT:
+                                            log.info("Quit event in fragment dialogue.")
+                                            pygame.quit()
+                                            sys.exit()
+                                        if event.type == pygame.KEYDOWN:
+                                            if event.key == pygame.K_SPACE:
+                                                dialogue_box.next_line()
+                                            elif event.key == pygame.K_ESCAPE:
+                                                dialogue_box.active = False
+                                                break
+                                    screen.blit(ui_background, (0, 0))
+                                    dialogue_box.draw(screen)
+                                    pygame.display.flip()
+                                    clock.tick(FPS)
+                            if player.inventory.fragments < 6:
+                                world.current_area += 1
+                                world.current_scene = 0
+                                current_scene = world.get_current_scene()
+                                start_x, start_y = current_scene.maze.find_open_start_position()
+                                player.rect.x, player.rect.y = start_x, start_y
+                                if vitalik and vitalik.following:
+                                    vitalik.rect.x, vitalik.rect.y = start_x + TILE_SIZE, start_y
+                                current_scene.sapas.clear()
+                                current_scene.npcs = []
+                                if not player.inventory.has_sword or not player.world_choice_made:
+                                    current_scene.sword = None
+                                current_scene.minigame = None
+                                projectiles.clear()
+
+            if gameloop.finish_tick(current_scene, player, projectiles, combat, scheduler):
+                game_over = True
+
+            with timings.scope("sim.infection"):
+                if infection_active and not dialogue_box.active:
+                    infection_rate_per_second = 1.0 if not player.easy_mode else 0.5
+                    infection_increment = infection_rate_per_second * timestep.dt
+                    if player.update_infection(infection_increment):
+                        paused = True
+                        choice = prompt_game_over(screen, dialogue_box, player, world, checkpoints, ui_background)
+                        if choice == "start_over":
+                            world.current_area = 0
                             world.current_scene = 0
+                            world = World(player, vitalik_freed=False)
                             current_scene = world.get_current_scene()
                             start_x, start_y = current_scene.maze.find_open_start_position()
                             player.rect.x, player.rect.y = start_x, start_y
+                            player.hp = 100
+                            player.max_hp = 100
+                            player.infection_level = 50
+                            player.level = 1
+                            player.xp = 0
+                            player.xp_to_next_level = 10
+                            player.attack_power = 2
+                            player.optimism_ring_fill = 0
+                            player.optimism_ring_fill_rate = 1.0
+                            player.optimism_ring_duration = 5
+                            player.optimism_ring_cooldown = 0
+                            player.optimism_ring_active = False
+                            player.optimism_ring_timer = 0
+                            player.inventory.supercollateral = 0
+                            player.inventory.fragments = 0
+                            player.inventory.has_sword = False
+                            infection_active = True
+                            vitalik_freed = False
+                            choice_made = False
+                            self_save_choice_made = False
+                            world_choice_made = False
+                            first_vendor_spawn = True
+                            vitalik = None
+                            current_scene.sapas.clear()
+                            current_scene.npcs = []
+                            current_scene.sword = None
+                            current_scene.minigame = None
+                            projectiles.clear()
+                            consecutive_losses = 0
+                            log.info("Game state fully reset after 'start over'.")
+                        elif choice == "resume":
+                            checkpoints.load(player)
+                            current_scene.sapas.clear()
+                            current_scene.npcs = []
+                            current_scene.sword = None
+                            current_scene.minigame = None
+                            projectiles.clear()
+                            consecutive_losses = 0
+                        elif choice == "restart_area":
+                            world.current_scene = 0
+                            current_scene = world.get_current_scene()
+                            start_x, start_y = current_scene.maze.find_open_start_position()
+                            player.rect.x, player.rect.y = start_x, start_y
+                            player.hp = 100
+                            player.infection_level = 50
                             if vitalik and vitalik.following:
                                 vitalik.rect.x, vitalik.rect.y = start_x + TILE_SIZE, start_y
                             current_scene.sapas.clear()
                             current_scene.npcs = []
-                            if not player.inventory.has_sword or not player.world_choice_made:
-                                current_scene.sword = None
+                            current_scene.sword = None
                             current_scene.minigame = None
                             projectiles.clear()
+                            consecutive_losses = 0
+                        paused = False
+                        continue
 
-            for sapa in sapas[:]:
-                sapa.move(current_scene.maze, player)
-                if player.optimism_ring_active:
-                    continue
-                projectile = sapa.attack(player)
-                if projectile:
-                    if isinstance(projectile, list):
-                        for new_sapa in projectile:
-                            new_sapa.level = sapa.level
-                            sapas.extend(projectile)
-                    else:
-                        projectiles.append(projectile)
-                if vitalik and not vitalik.invulnerable and sapa.rect.colliderect(vitalik.rect):
-                    print("Sapa attempted to attack Vitalik, but he's invulnerable.")
-                if player.hp <= 0:
-                    game_over = True
-
-            for proj in projectiles[:]:
-                rect, dx, dy = proj
-                rect.x += dx * 5
-                rect.y += dy * 5
-                if rect.colliderect(player.rect) and not player.optimism_ring_active:
-                    player.take_damage(5)
-                    projectiles.remove(proj)
-                elif rect.x < 0 or rect.x > SCREEN_WIDTH or rect.y < 0 or rect.y > SCREEN_HEIGHT:
-                    projectiles.remove(proj)
-
-            combat.update(sapas, player)
-            player.update()
-
-            if infection_active and not dialogue_box.active:
-                infection_rate_per_second = 1.0 if not player.easy_mode else 0.5
-                infection_increment = infection_rate_per_second * delta_time
-                if player.update_infection(infection_increment):
-                    paused = True
-                    choice = prompt_game_over(screen, dialogue_box, player, world, checkpoints, ui_background)
-                    if choice == "start_over":
-                        world.current_area = 0
-                        world.current_scene = 0
-                        world = World(player, vitalik_freed=False)
-                        current_scene = world.get_current_scene()
-                        start_x, start_y = current_scene.maze.find_open_start_position()
-                        player.rect.x, player.rect.y = start_x, start_y
-                        player.hp = 100
-                        player.max_hp = 100
-                        player.infection_level = 50
-                        player.level = 1
-                        player.xp = 0
-                        player.xp_to_next_level = 10
-                        player.attack_power = 2
-                        player.optimism_ring_fill = 0
-                        player.optimism_ring_fill_rate = 1.0
-                        player.optimism_ring_duration = 5
-                        player.optimism_ring_cooldown = 0
-                        player.optimism_ring_active = False
-                        player.optimism_ring_timer = 0
-                        player.inventory.supercollateral = 0
-                        player.inventory.fragments = 0
-                        player.inventory.has_sword = False
-                        infection_active = True
-                        vitalik_freed = False
-                        choice_made = False
-                        self_save_choice_made = False
-                        world_choice_made = False
-                        first_vendor_spawn = True
-                        vitalik = None
-                        current_scene.sapas.clear()
-                        current_scene.npcs = []
-                        current_scene.sword = None
-                        current_scene.minigame = None
-                        projectiles.clear()
-                        consecutive_losses = 0
-                        print("Game state fully reset after 'start over'.")
-                    elif choice == "resume":
-                        checkpoints.load(player)
-                        current_scene.sapas.clear()
-                        current_scene.npcs = []
-                        current_scene.sword = None
-                        current_scene.minigame = None
-                        projectiles.clear()
-                        consecutive_losses = 0
-                    elif choice == "restart_area":
-                        world.current_scene = 0
-                        current_scene = world.get_current_scene()
-                        start_x, start_y = current_scene.maze.find_open_start_position()
-                        player.rect.x, player.rect.y = start_x, start_y
-                        player.hp = 100
-                        player.infection_level = 50
-                        if vitalik and vitalik.following:
-                            vitalik.rect.x, vitalik.rect.y = start_x + TILE_SIZE, start_y
-                        current_scene.sapas.clear()
-                        current_scene.npcs = []
-                        current_scene.sword = None
-                        current_scene.minigame = None
-                        projectiles.clear()
-                        consecutive_losses = 0
-                    paused = False
-                    continue
-
-            print(f"Player infection level: {player.infection_level}, HP: {player.hp}")
+                log.debug("Player infection level: %s, HP: %s", player.infection_level, player.hp)
 
             if player.inventory.fragments == 6:
                 paused = True
@@ -1127,7 +1121,7 @@ def main():
                 consecutive_losses = 1
             last_scene = current_scene_index
 
-            print(f"Consecutive losses: {consecutive_losses}")
+            log.info("Consecutive losses: %s", consecutive_losses)
             if consecutive_losses >= 3 and not player.easy_mode:
                 paused = True
                 prompt_easy_mode(screen, dialogue_box, player, ui_background)
@@ -1174,7 +1168,7 @@ def main():
                 consecutive_losses = 0
                 last_scene = None
                 last_area = -1
-                print("Game state fully reset after 'start over'.")
+                log.info("Game state fully reset after 'start over'.")
             elif choice == "resume":
                 checkpoints.load(player)
                 current_scene.sapas.clear()
@@ -1201,39 +1195,64 @@ def main():
             paused = False
             continue
 
-        screen.fill(BLACK)
-        current_scene.draw(screen)
-        for sapa in sapas:
-            sapa.draw(screen)
-        for proj in projectiles:
-            rect, dx, dy = proj
-            if sapa_projectile_sprite:
-                screen.blit(sapa_projectile_sprite, (rect.x, rect.y))
-            else:
-                pygame.draw.rect(screen, (255, 0, 0), rect)
-        if current_scene.npc:
-            current_scene.npc.draw(screen)
-        if hasattr(current_scene, 'npcs'):
-            for npc in current_scene.npcs:
-                npc.draw(screen)
-        if vitalik and vitalik.following:
-            vitalik.draw(screen)
-        player.draw(screen)
-        combat.draw(screen)
-        draw_ui(screen, player, world, font, heart_icon, coin_icon, virus_icon, ring_icon, infection_active)
-        draw_labels(screen, current_scene, player, font)
-        draw_exits(screen, current_scene, font, exit_arrow_sprite)
-        if show_minimap:
-            draw_minimap(screen, current_scene, player, font)
-        apply_critical_tint(screen, infection_active, player)
-        dialogue_box.draw(screen)
-        pygame.display.flip()
+        perf.lap("simulation")
+        gameloop.draw_frame(perf.canvas(screen), world, current_scene, player, vitalik, projectiles, combat,
+                            dialogue_box, sprites, interpolator, timestep.alpha(), infection_active, show_minimap,
+                            perf)
+        perf.lap("draw")
+        counts = {"sapas": len(sapas), "projectiles": len(projectiles), "attacks": len(combat.attacks),
+                  "effects": len(combat.particles),
+                  "npcs": (1 if current_scene.npc else 0) + len(getattr(current_scene, 'npcs', []))}
+        perf.end_frame(screen, counts)
+        with timings.scope("render.flip"):
+            pygame.display.flip()
+        surface_tracker.end_frame()
+        modal = hitches.modal_this_frame()
+        telemetry.frame(world.current_area, world.current_scene, counts, modal)
+        hitches.end_frame(world.current_area, world.current_scene, counts)
+        recorder.frame()
+        if modal or paused or dialogue_box.active:
+            # Time spent in a modal screen or with the simulation held isn't owed as catch-up ticks
+            timestep.reset()
 
-        clock.tick(FPS)
+        clock.tick(MAX_RENDER_FPS)
 
-    print("Game over. Exiting...")
+    log.info("Game over. Exiting...")
+    if memory_report:
+        memory.report(world, "at exit")
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="A Superseed Odyssey: Rise of the Sapa Slayer")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="World seed; the same seed rebuilds the same mazes, items and spawns")
+    parser.add_argument("--horde", type=int, default=0, metavar="N",
+                        help="Horde arena mode: keep N sapas alive in the current scene, of any type")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="Trace allocations and print memory use by subsystem once the world is built and at exit")
+    parser.add_argument("--log-level", default=LOG_LEVEL, type=str.upper,
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+                        help=f"Console log level (default {LOG_LEVEL}); DEBUG logs per-frame detail and costs frame time")
+    parser.add_argument("--timings", nargs="?", const="", default=None, metavar="PATH",
+                        help="Time main-loop phases and renderers; per-second p50/p95/max per scope is written on exit "
+                             "to PATH (.json or .csv, default logs/timings-<time>.csv)")
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="DIR",
+                        help="cProfile each scene and modal screen separately; .pstats files and a hotspot summary "
+                             "are written on exit to DIR (default logs/profile-<time>/)")
+    parser.add_argument("--track-surfaces", action="store_true",
+                        help="Debug: count surface allocations and bytes per frame by call site; F4 or exit prints "
+                             "the worst offenders")
+    parser.add_argument("--no-telemetry", action="store_true",
+                        help="Don't append this session's frame times, load times and entity counts to the local "
+                             "telemetry file")
+    parser.add_argument("--telemetry-path", default=None, metavar="PATH",
+                        help="Telemetry file to append to (default logs/telemetry.jsonl)")
+    parser.add_argument("--record", nargs="?", const="", default=None, metavar="PATH",
+                        help="Record seeds and per-frame input for python -m src.tools.replay; written on exit to "
+                             "PATH (default logs/recording-<time>.json.gz)")
+    args = parser.parse_args()
+    main(seed=args.seed, horde=args.horde, memory_report=args.memory_report, log_level=args.log_level,
+         timings_path=args.timings, profile_dir=args.profile, track_surfaces=args.track_surfaces,
+         telemetry_enabled=TELEMETRY_ENABLED and not args.no_telemetry, telemetry_path=args.telemetry_path,
+         record_path=args.record)
\ No newline at end of file
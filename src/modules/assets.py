@@ -0,0 +1,66 @@
+# src/modules/assets.py
+import os
+import time
+from collections import OrderedDict
+import pygame
+from src.config import TEXT_CACHE_SIZE
+from src.modules import frame_stats, hitches, telemetry
+
+# One surface per (file, size, alpha) or per generated key, shared read-only by every scene, enemy and NPC
+_surfaces = {}  # key -> (surface, category)
+_text = OrderedDict()  # (font, text, antialias, color) -> surface, oldest first
+
+
+def load_image(path, size=None, alpha=True, category="sprites"):
+    # Raises FileNotFoundError / pygame.error like pygame.image.load, so callers keep their own fallbacks
+    key = (path, size, alpha)
+    cached = _surfaces.get(key)
+    if cached is None:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"File not found: {path}")
+        start = time.perf_counter()
+        surface = pygame.image.load(path)
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        if size is not None:
+            surface = pygame.transform.scale(surface, size)
+        cached = _surfaces[key] = (surface, category)
+        telemetry.asset_loaded(path, start, category)
+        hitches.note_since("asset_load", os.path.basename(path), start)
+    return cached[0]
+
+
+def shared_surface(key, build, category="sprites"):
+    # For generated surfaces (placeholders, gradients, flashes): build() runs once per key
+    cached = _surfaces.get(key)
+    if cached is None:
+        cached = _surfaces[key] = (build(), category)
+    return cached[0]
+
+
+def render_text(font, text, color, antialias=True):
+    # font.render for text that repeats frame to frame (HUD values, labels); treat the result as read-only
+    key = (font, text, antialias, color)
+    surface = _text.get(key)
+    if surface is not None:
+        _text.move_to_end(key)
+        frame_stats.text_hits += 1
+        return surface
+    frame_stats.text_misses += 1
+    frame_stats.surfaces += 1
+    surface = _text[key] = font.render(text, antialias, color)
+    if len(_text) > TEXT_CACHE_SIZE:
+        _text.popitem(last=False)
+    return surface
+
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def cached_surfaces():
+    return [(key, surface, category) for key, (surface, category) in _surfaces.items()]
+
+
+def clear_cache():
+    _surfaces.clear()
+    _text.clear()
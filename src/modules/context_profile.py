@@ -0,0 +1,147 @@
+# src/modules/context_profile.py
+# --profile: one cProfile profile per context instead of one for the whole session. The context is a stack:
+# the bottom is the (area, scene) being played, modal screens push on top of it while they run, and only
+# the top profile is enabled. On exit every context gets a .pstats file plus a hotspot summary.
+import cProfile
+import functools
+import io
+import os
+import pstats
+import time
+from contextlib import contextmanager
+from src.config import LOG_DIR
+from src.modules import hitches
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+DIALOGUE = "dialogue"
+
+_enabled = False
+_directory = None
+_profiles = {}  # context name -> cProfile.Profile
+_stack = []
+_current = None
+
+
+def _profile(name):
+    profile = _profiles.get(name)
+    if profile is None:
+        profile = _profiles[name] = cProfile.Profile()
+    return profile
+
+
+def _activate():
+    # Moves profiling to whatever is now on top of the stack
+    global _current
+    top = _stack[-1] if _stack else None
+    if top == _current:
+        return
+    if _current is not None:
+        _profiles[_current].disable()
+    _current = top
+    if top is not None:
+        _profile(top).enable()
+
+
+def enable(directory=None):
+    global _enabled, _directory
+    _enabled = True
+    _directory = directory or os.path.join(LOG_DIR, time.strftime("profile-%Y%m%d-%H%M%S"))
+    _stack[:] = ["startup"]
+    _activate()
+    log.info("Profiling by context; results go to %s", _directory)
+
+
+def enabled():
+    return _enabled
+
+
+def set_scene(area, scene):
+    # Called every frame by the main loop; only does work when the scene changed
+    if _enabled:
+        name = f"area{area}_scene{scene}"
+        if _stack[0] != name:
+            _stack[0] = name
+            _activate()
+
+
+def push(name):
+    if _enabled:
+        _stack.append(name)
+        _activate()
+
+
+def remove(name):
+    # Drops the most recent `name`, wherever it is, so contexts left out of order don't stick
+    if _enabled and name in _stack[1:]:
+        del _stack[len(_stack) - 1 - _stack[::-1].index(name)]
+        _activate()
+
+
+def dialogue(active):
+    # DialogueBox.active changes; dialogue counts as its own context only when it is opened over gameplay,
+    # not as part of a menu or minigame that uses the box
+    if not _enabled:
+        return
+    if active and len(_stack) == 1:
+        push(DIALOGUE)
+    elif not active:
+        remove(DIALOGUE)
+
+
+@contextmanager
+def context(name):
+    push(name)
+    try:
+        yield
+    finally:
+        remove(name)
+
+
+def profiled(name):
+    # Decorator for modal screens: the whole call is profiled as `name`
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            # A modal screen's frames run inside one main-loop frame, which is then not a hitch
+            hitches.modal(name)
+            if not _enabled:
+                return function(*args, **kwargs)
+            with context(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def write(top=15):
+    # <directory>/<context>.pstats for each context and summary.txt with the top cumulative entries
+    global _current
+    if not _enabled:
+        return None
+    if _current is not None:
+        _profiles[_current].disable()
+        _current = None
+    try:
+        os.makedirs(_directory, exist_ok=True)
+        totals = []
+        for name, profile in _profiles.items():
+            profile.create_stats()
+            if not profile.stats:
+                continue
+            profile.dump_stats(os.path.join(_directory, f"{name}.pstats"))
+            totals.append((pstats.Stats(profile).total_tt, name, profile))
+        with open(os.path.join(_directory, "summary.txt"), "w", encoding="utf-8") as f:
+            for total, name, profile in sorted(totals, key=lambda item: -item[0]):
+                f.write(f"=== {name}: {total:.3f} s ===\n")
+                text = io.StringIO()
+                pstats.Stats(profile, stream=text).sort_stats("cumulative").print_stats(top)
+                # Skip pstats' header lines up to the column titles
+                lines = text.getvalue().splitlines()
+                start = next((i for i, line in enumerate(lines) if line.lstrip().startswith("ncalls")), 0)
+                f.write("\n".join(line for line in lines[start:] if line.strip()) + "\n\n")
+        log.info("Wrote %s profiles to %s", len(totals), _directory)
+        return _directory
+    except OSError as e:
+        log.error("Failed to write profiles to %s: %s", _directory, e)
+        return None
@@ -1,9 +1,14 @@
 import pygame
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TANGOA, WHITE, BLACK, UI_BACKGROUND
 from src.modules.ui import DialogueBox
+from src.modules.context_profile import profiled
+from src.modules.logs import get_logger
 
+log = get_logger(__name__)
+
+@profiled("cutscene.intro")
 def play_intro_cutscene(screen, clock, player, ui_background):
-    print("Entering play_intro_cutscene...")
+    log.debug("Entering play_intro_cutscene...")
     try:
         pronoun = "he" if player.gender == "male" else "she"
         lines = [
@@ -23,13 +28,13 @@ def play_intro_cutscene(screen, clock, player, ui_background):
         while running and dialogue_box.active:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    print("Quit event in intro_cutscene.")
+                    log.info("Quit event in intro_cutscene.")
                     return False, paused
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         dialogue_box.next_line()
                     elif event.key == pygame.K_ESCAPE:
-                        print("Intro cutscene skipped by user.")
+                        log.info("Intro cutscene skipped by user.")
                         return False, paused
 
             screen.blit(ui_background, (0, 0))
@@ -52,14 +57,15 @@ def play_intro_cutscene(screen, clock, player, ui_background):
         pygame.display.flip()
         pygame.time.delay(500)
 
-        print("Exiting intro_cutscene successfully.")
+        log.debug("Exiting intro_cutscene successfully.")
         return True, paused
     except Exception as e:
-        print(f"Error in intro_cutscene: {e}")
+        log.error("Error in intro_cutscene: %s", e)
         raise
 
+@profiled("cutscene.area")
 def play_area_cutscene(screen, clock, player, area_id, ui_background):
-    print(f"Entering play_area_cutscene for Area {area_id}...")
+    log.debug("Entering play_area_cutscene for Area %s...", area_id)
     try:
         # Add fade-in effect
         fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -132,13 +138,13 @@ def play_area_cutscene(screen, clock, player, area_id, ui_background):
         while running and dialogue_box.active:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    print("Quit event in area_cutscene.")
+                    log.info("Quit event in area_cutscene.")
                     return False, paused
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         dialogue_box.next_line()
                     elif event.key == pygame.K_ESCAPE:
-                        print(f"Area {area_id} cutscene skipped by user.")
+                        log.info("Area %s cutscene skipped by user.", area_id)
                         return False, paused
 
             screen.blit(ui_background, (0, 0))
@@ -161,8 +167,8 @@ def play_area_cutscene(screen, clock, player, area_id, ui_background):
         pygame.display.flip()
         pygame.time.delay(500)
 
-        print(f"Exiting area_cutscene for Area {area_id} successfully.")
+        log.debug("Exiting area_cutscene for Area %s successfully.", area_id)
         return True, paused
     except Exception as e:
-        print(f"Error in area_cutscene: {e}")
+        log.error("Error in area_cutscene: %s", e)
         raise
\ No newline at end of file
@@ -1,14 +1,38 @@
 import pygame
-import random
 import math
 import os
-from src.config import TILE_SIZE, MAZE_WIDTH, MAZE_HEIGHT, FPS, SAPA_SPRITE, SPLITTER_SAPA_SPRITE, \
+from src.config import TILE_SIZE, SIMULATION_HZ, SAPA_SPRITE, SPLITTER_SAPA_SPRITE, \
     PROJECTILE_SAPA_SPRITE, CHASER_SAPA_SPRITE, DIAGONAL_SAPA_SPRITE, BOSS_1_SPRITE, BOSS_2_SPRITE, \
-    BOSS_3_SPRITE, BOSS_4_SPRITE, BOSS_5_SPRITE, SKULD_SPRITE, HUD_HEIGHT
+    BOSS_3_SPRITE, BOSS_4_SPRITE, BOSS_5_SPRITE, SKULD_SPRITE
+from src.modules.assets import load_image, shared_surface
+from src.modules.enemy_pool import KIND_CUSTOM, KIND_PATROL, KIND_DIAGONAL, KIND_CHASER, KIND_SHOOTER, pooled
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+def filled_surface(width, height, color):
+    surface = pygame.Surface((width, height))
+    surface.fill(color)
+    return surface
 
 class Enemy:
+    # Numeric state lives in the scene's EnemyPool; each Enemy is a view over one pool slot
+    pool_kind = KIND_CUSTOM
+    level = pooled("level")
+    hp = pooled("hp")
+    damage = pooled("damage")
+    speed = pooled("speed")
+    attack_cooldown = pooled("attack_cooldown")
+    attack_cooldown_max = pooled("attack_cooldown_max")
+    hit_timer = pooled("hit_timer")
+    patrol_timer = pooled("patrol_timer")
+    patrol_interval = pooled("patrol_interval")
+
     def __init__(self, scene, name, sprite_path, player_level, width=TILE_SIZE, height=TILE_SIZE, speed=2, base_hp=10):
         self.scene = scene
+        self.rng = scene.stream("enemies")
+        self.pool = scene.enemy_pool
+        self.slot = self.pool.allocate(self, self.pool_kind)
         self.name = name
         self.width = width
         self.height = height
@@ -18,94 +42,43 @@ class Enemy:
         self.level = player_level
         self.rect = self.place_in_maze()
         try:
-            print(f"Attempting to load sprite from: {sprite_path}")
+            log.debug("Attempting to load sprite from: %s", sprite_path)
             if not os.path.exists(sprite_path):
                 raise FileNotFoundError(f"File not found: {sprite_path}")
-            self.image = pygame.image.load(sprite_path).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
+            self.image = load_image(sprite_path, (self.width, self.height), category="enemies")
         except (pygame.error, FileNotFoundError, Exception) as e:
-            print(f"Failed to load sprite {sprite_path}: {e}. Using placeholder.")
-            self.image = pygame.Surface((self.width, self.height))
-            self.image.fill((150, 0, 0))
+            log.warning("Failed to load sprite %s: %s. Using placeholder.", sprite_path, e)
+            self.image = shared_surface(("enemy_placeholder", self.width, self.height),
+                                        lambda: filled_surface(self.width, self.height, (150, 0, 0)), category="enemies")
         self.attack_cooldown = 0
-        self.attack_cooldown_max = FPS
-        self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        self.attack_cooldown_max = SIMULATION_HZ
+        self.direction = self.rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
         self.hit_timer = 0
         self.patrol_timer = 0
-        self.patrol_interval = FPS * 3
+        self.patrol_interval = SIMULATION_HZ * 3
+
+    @property
+    def direction(self):
+        return self.pool.dir_x[self.slot], self.pool.dir_y[self.slot]
+
+    @direction.setter
+    def direction(self, value):
+        self.pool.dir_x[self.slot], self.pool.dir_y[self.slot] = value
 
     def place_in_maze(self):
-        max_attempts = 100
-        attempt = 0
-        # Divide the scene into quadrants to ensure distribution
-        quadrants = [
-            (0, MAZE_WIDTH // 2, 0, MAZE_HEIGHT // 2),  # Top-left
-            (MAZE_WIDTH // 2, MAZE_WIDTH, 0, MAZE_HEIGHT // 2),  # Top-right
-            (0, MAZE_WIDTH // 2, MAZE_HEIGHT // 2, MAZE_HEIGHT),  # Bottom-left
-            (MAZE_WIDTH // 2, MAZE_WIDTH, MAZE_HEIGHT // 2, MAZE_HEIGHT)  # Bottom-right
-        ]
-        # Choose a quadrant based on the number of Sapas already in each quadrant
-        quadrant_counts = [0] * 4
-        for sapa in self.scene.sapas:
-            for i, (x_min, x_max, y_min, y_max) in enumerate(quadrants):
-                if x_min * TILE_SIZE <= sapa.rect.x < x_max * TILE_SIZE and \
-                   y_min * TILE_SIZE <= (sapa.rect.y - HUD_HEIGHT) < y_max * TILE_SIZE:
-                    quadrant_counts[i] += 1
-                    break
-        # Prefer the quadrant with the fewest Sapas
-        min_count = min(quadrant_counts)
-        possible_quadrants = [i for i, count in enumerate(quadrant_counts) if count == min_count]
-        chosen_quadrant = random.choice(possible_quadrants)
-        x_min, x_max, y_min, y_max = quadrants[chosen_quadrant]
-
-        while attempt < max_attempts:
-            x = random.randint(x_min, x_max - 1) * TILE_SIZE
-            y = random.randint(y_min, y_max - 1) * TILE_SIZE + HUD_HEIGHT
-            rect = pygame.Rect(x, y, self.width, self.height)
-            entry_x, entry_y = self.scene.entry
-            exit_x, exit_y = self.scene.exit
-            entry_distance = ((x - entry_x * TILE_SIZE) ** 2 + (y - (entry_y * TILE_SIZE + HUD_HEIGHT)) ** 2) ** 0.5
-            exit_distance = ((x - exit_x * TILE_SIZE) ** 2 + (y - (exit_y * TILE_SIZE + HUD_HEIGHT)) ** 2) ** 0.5
-            player_distance = ((x - self.scene.player.rect.x) ** 2 + (y - self.scene.player.rect.y) ** 2) ** 0.5
-            too_close_to_sapa = False
-            for sapa in self.scene.sapas:
-                sapa_distance = ((x - sapa.rect.x) ** 2 + (y - sapa.rect.y) ** 2) ** 0.5
-                if sapa_distance < 200:  # Increased minimum distance to 200 pixels
-                    too_close_to_sapa = True
-                    break
-            if (not self.scene.maze.collides(rect) and
-                entry_distance > 100 and
-                exit_distance > 100 and
-                player_distance > 150 and  # Relaxed player distance to ensure placement
-                not too_close_to_sapa):
-                return rect
-            attempt += 1
-        # Fallback: Relax constraints if no position found
-        attempt = 0
-        while attempt < max_attempts:
-            x = random.randint(0, MAZE_WIDTH - 1) * TILE_SIZE
-            y = random.randint(0, MAZE_HEIGHT - 1) * TILE_SIZE + HUD_HEIGHT
-            rect = pygame.Rect(x, y, self.width, self.height)
-            if not self.scene.maze.collides(rect):
-                return rect
-            attempt += 1
-        return pygame.Rect(TILE_SIZE, TILE_SIZE + HUD_HEIGHT, self.width, self.height)
+        # Quadrant balance, entry/exit/player distance and sapa separation are handled by the scene's spawn service
+        return self.scene.spawns.reserve("enemy", self.width, self.height, self.rng)
 
     def move(self, maze, player):
         self.patrol_timer += 1
         if self.patrol_timer >= self.patrol_interval:
-            self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+            self.direction = self.rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
             self.patrol_timer = 0
 
-        new_rect = self.rect.copy()
         dx, dy = self.direction
-        new_rect.x += dx * self.speed
-        new_rect.y += dy * self.speed
-
-        if not maze.collides(new_rect):
-            self.rect = new_rect
-        else:
-            self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        self.rect.x, self.rect.y, blocked_x, blocked_y = maze.move_and_slide(self.rect, dx * self.speed, dy * self.speed)
+        if blocked_x or blocked_y:
+            self.direction = self.rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
             self.patrol_timer = 0
 
     def attack(self, player):
@@ -125,20 +98,23 @@ class Enemy:
     def draw(self, screen):
         if self.hit_timer > 0:
             if self.hit_timer % 2 == 0:
-                temp_surface = pygame.Surface((self.width, self.height))
-                temp_surface.fill((255, 255, 255))
-                screen.blit(temp_surface, self.rect)
+                flash = shared_surface(("enemy_flash", self.width, self.height),
+                                       lambda: filled_surface(self.width, self.height, (255, 255, 255)), category="enemies")
+                screen.blit(flash, self.rect)
             else:
                 screen.blit(self.image, self.rect)
-            self.hit_timer -= 1
         else:
             screen.blit(self.image, self.rect)
 
 class Sapa(Enemy):
+    pool_kind = KIND_PATROL
+
     def __init__(self, scene, player_level):
         super().__init__(scene, "Sapa", SAPA_SPRITE, player_level)
 
 class SplitterSapa(Enemy):
+    pool_kind = KIND_PATROL
+
     def __init__(self, scene, player_level):
         super().__init__(scene, "Splitter Sapa", SPLITTER_SAPA_SPRITE, player_level, base_hp=10)
         self.split_count = 0
@@ -158,10 +134,14 @@ class SplitterSapa(Enemy):
         return [] if self.hp <= 0 else None
 
 class ProjectileSapa(Enemy):
+    pool_kind = KIND_SHOOTER
+    projectile_cooldown = pooled("special_cooldown")
+    projectile_cooldown_max = pooled("special_cooldown_max")
+
     def __init__(self, scene, player_level):
         super().__init__(scene, "Projectile Sapa", PROJECTILE_SAPA_SPRITE, player_level)
         self.projectile_cooldown = 0
-        self.projectile_cooldown_max = FPS * 3
+        self.projectile_cooldown_max = SIMULATION_HZ * 3
 
     def attack(self, player):
         if self.projectile_cooldown > 0:
@@ -179,46 +159,50 @@ class ProjectileSapa(Enemy):
         return None
 
 class ChaserSapa(Enemy):
+    pool_kind = KIND_CHASER
+
     def __init__(self, scene, player_level):
         super().__init__(scene, "Chaser Sapa", CHASER_SAPA_SPRITE, player_level)
 
     def move(self, maze, player):
-        new_rect = self.rect.copy()
+        flow_field = self.scene.flow_field
+        flow_field.update(player.rect)
+        step = flow_field.steer(self.rect, self.speed)
+        if step and step != (0, 0):
+            self.rect.x, self.rect.y, _, _ = maze.move_and_slide(self.rect, *step)
+            return
+        dx, dy = 0, 0
         if player.rect.x > self.rect.x:
-            new_rect.x += self.speed
+            dx = self.speed
         elif player.rect.x < self.rect.x:
-            new_rect.x -= self.speed
+            dx = -self.speed
         if player.rect.y > self.rect.y:
-            new_rect.y += self.speed
+            dy = self.speed
         elif player.rect.y < self.rect.y:
-            new_rect.y -= self.speed
+            dy = -self.speed
 
-        if not maze.collides(new_rect):
-            self.rect = new_rect
-        else:
-            self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        self.rect.x, self.rect.y, blocked_x, blocked_y = maze.move_and_slide(self.rect, dx, dy)
+        if blocked_x or blocked_y:
+            self.direction = self.rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
 
 class DiagonalSapa(Enemy):
+    pool_kind = KIND_DIAGONAL
+
     def __init__(self, scene, player_level):
         super().__init__(scene, "Diagonal Sapa", DIAGONAL_SAPA_SPRITE, player_level)
-        self.direction = random.choice([(1, 1), (-1, -1), (1, -1), (-1, 1)])
+        self.direction = self.rng.choice([(1, 1), (-1, -1), (1, -1), (-1, 1)])
 
     def move(self, maze, player):
-        new_rect = self.rect.copy()
         dx, dy = self.direction
-        new_rect.x += dx * self.speed
-        new_rect.y += dy * self.speed
-
-        if not maze.collides(new_rect):
-            self.rect = new_rect
-        else:
-            self.direction = random.choice([(1, 1), (-1, -1), (1, -1), (-1, 1)])
+        self.rect.x, self.rect.y, blocked_x, blocked_y = maze.move_and_slide(self.rect, dx * self.speed, dy * self.speed)
+        if blocked_x or blocked_y:
+            self.direction = self.rng.choice([(1, 1), (-1, -1), (1, -1), (-1, 1)])
 
 class BossArea1(Enemy):
     def __init__(self, scene, player_level):
         super().__init__(scene, "Boss Area 1", BOSS_1_SPRITE, player_level, width=TILE_SIZE * 2, height=TILE_SIZE * 2, speed=2, base_hp=50)
         self.projectile_cooldown = 0
-        self.projectile_cooldown_max = FPS * 2
+        self.projectile_cooldown_max = SIMULATION_HZ * 2
 
     def attack(self, player):
         if self.projectile_cooldown > 0:
@@ -239,7 +223,7 @@ class BossArea2(Enemy):
     def __init__(self, scene, player_level):
         super().__init__(scene, "Boss Area 2", BOSS_2_SPRITE, player_level, width=TILE_SIZE * 2, height=TILE_SIZE * 2, speed=2, base_hp=50)
         self.sweep_cooldown = 0
-        self.sweep_cooldown_max = FPS * 5
+        self.sweep_cooldown_max = SIMULATION_HZ * 5
 
     def attack(self, player):
         if self.sweep_cooldown > 0:
@@ -247,13 +231,13 @@ class BossArea2(Enemy):
             return super().attack(player)
         sweep_rect = pygame.Rect(self.rect.centerx - 50, self.rect.centery - 50, 100, 100)
         self.sweep_cooldown = self.sweep_cooldown_max
-        return (sweep_rect, 0, 0)
+        return (sweep_rect, 0, 0, "sweep")
 
 class BossArea3(Enemy):
     def __init__(self, scene, player_level):
         super().__init__(scene, "Boss Area 3", BOSS_3_SPRITE, player_level, width=TILE_SIZE * 2, height=TILE_SIZE * 2, speed=2, base_hp=50)
         self.minion_cooldown = 0
-        self.minion_cooldown_max = FPS * 10
+        self.minion_cooldown_max = SIMULATION_HZ * 10
 
     def attack(self, player):
         if self.minion_cooldown > 0:
@@ -272,20 +256,22 @@ class BossArea4(Enemy):
     def __init__(self, scene, player_level):
         super().__init__(scene, "Boss Area 4", BOSS_4_SPRITE, player_level, width=TILE_SIZE * 2, height=TILE_SIZE * 2, speed=2, base_hp=50)
         self.dash_cooldown = 0
-        self.dash_cooldown_max = FPS * 3
+        self.dash_cooldown_max = SIMULATION_HZ * 3
         self.dashing = False
 
     def move(self, maze, player):
         if self.dash_cooldown > 0:
             self.dash_cooldown -= 1
             if self.dashing:
-                new_rect = self.rect.copy()
-                dx = (player.rect.x - self.rect.x) / 10
-                dy = (player.rect.y - self.rect.y) / 10
-                new_rect.x += dx * self.speed * 2
-                new_rect.y += dy * self.speed * 2
-                if not maze.collides(new_rect):
-                    self.rect = new_rect
+                dx = (player.rect.x - self.rect.x) / 10 * self.speed * 2
+                dy = (player.rect.y - self.rect.y) / 10 * self.speed * 2
+                # Dash the same distance, but along the maze rather than straight into the nearest wall
+                flow_field = self.scene.flow_field
+                flow_field.update(player.rect)
+                step = flow_field.steer(self.rect, max(abs(dx), abs(dy)), max_hops=16)
+                if step and step != (0, 0):
+                    dx, dy = step
+                self.rect.x, self.rect.y, _, _ = maze.move_and_slide(self.rect, dx, dy)
                 self.dashing = False
             else:
                 super().move(maze, player)
@@ -297,7 +283,7 @@ class BossArea5(Enemy):
     def __init__(self, scene, player_level):
         super().__init__(scene, "Boss Area 5", BOSS_5_SPRITE, player_level, width=TILE_SIZE * 2, height=TILE_SIZE * 2, speed=2, base_hp=50)
         self.circle_cooldown = 0
-        self.circle_cooldown_max = FPS * 4
+        self.circle_cooldown_max = SIMULATION_HZ * 4
 
     def attack(self, player):
         if self.circle_cooldown > 0:
@@ -318,11 +304,11 @@ class Skuld(Enemy):
         super().__init__(scene, "Skuld", SKULD_SPRITE, player_level, width=TILE_SIZE * 3, height=TILE_SIZE * 3, speed=2, base_hp=100)
         self.phase = 1
         self.projectile_cooldown = 0
-        self.projectile_cooldown_max = FPS * 2
+        self.projectile_cooldown_max = SIMULATION_HZ * 2
         self.minion_cooldown = 0
-        self.minion_cooldown_max = FPS * 10
+        self.minion_cooldown_max = SIMULATION_HZ * 10
         self.sweep_cooldown = 0
-        self.sweep_cooldown_max = FPS * 5
+        self.sweep_cooldown_max = SIMULATION_HZ * 5
 
     def attack(self, player):
         attacks = []
@@ -356,6 +342,6 @@ class Skuld(Enemy):
                 self.sweep_cooldown -= 1
             else:
                 sweep_rect = pygame.Rect(self.rect.centerx - 50, self.rect.centery - 50, 100, 100)
-                attacks.append((sweep_rect, 0, 0))
+                attacks.append((sweep_rect, 0, 0, "sweep"))
                 self.sweep_cooldown = self.sweep_cooldown_max
         return attacks
\ No newline at end of file
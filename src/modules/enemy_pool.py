@@ -0,0 +1,156 @@
+# src/modules/enemy_pool.py
+import weakref
+from array import array
+import pygame
+
+# Movement/attack behaviour batched by EnemyPool.update; KIND_CUSTOM (bosses) keeps calling the view's own methods
+KIND_CUSTOM = 0
+KIND_PATROL = 1
+KIND_DIAGONAL = 2
+KIND_CHASER = 3
+KIND_SHOOTER = 4
+
+CARDINAL_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+DIAGONAL_DIRECTIONS = [(1, 1), (-1, -1), (1, -1), (-1, 1)]
+
+FIELDS = ["kind", "level", "hp", "damage", "speed", "dir_x", "dir_y", "attack_cooldown", "attack_cooldown_max",
+          "hit_timer", "patrol_timer", "patrol_interval", "special_cooldown", "special_cooldown_max"]
+
+
+def pooled(field):
+    # Property that stores an Enemy attribute in its pool slot instead of on the object
+    def get(view):
+        return getattr(view.pool, field)[view.slot]
+
+    def set(view, value):
+        getattr(view.pool, field)[view.slot] = int(value)
+
+    return property(get, set)
+
+
+class EnemyPool:
+    # Per-enemy numbers in parallel int arrays, one slot per live Enemy view. Positions stay in each
+    # view's Rect, which rendering, the spatial hash and interpolation already share.
+    def __init__(self, rng):
+        self.rng = rng
+        for field in FIELDS:
+            setattr(self, field, array("i"))
+        self.free = []
+        self.size = 0
+
+    def __len__(self):
+        return self.size - len(self.free)
+
+    def allocate(self, view, kind):
+        if self.free:
+            slot = self.free.pop()
+            for field in FIELDS:
+                getattr(self, field)[slot] = 0
+        else:
+            slot = self.size
+            self.size += 1
+            for field in FIELDS:
+                getattr(self, field).append(0)
+        self.kind[slot] = kind
+        # Slots are recycled once the view is gone, however it left the scene's lists
+        weakref.finalize(view, self.free.append, slot)
+        return slot
+
+    def collect(self, result, projectiles, spawned):
+        if not result:
+            return
+        if isinstance(result, tuple):
+            projectiles.append(result)
+            return
+        for item in result:
+            if isinstance(item, tuple):
+                projectiles.append(item)
+            else:
+                spawned.append(item)
+
+    def update(self, views, maze, player, attacks_enabled=True, flow_field=None, repath=True):
+        # One tick for every enemy in views: timers, movement and attacks with the per-kind logic inlined,
+        # instead of a move() and an attack() call per enemy. Returns (new projectiles, spawned enemies).
+        # Chasers follow flow_field when given; it is refreshed toward the player only on repath ticks.
+        projectiles = []
+        spawned = []
+        rng = self.rng
+        kind_of = self.kind
+        hit_timer = self.hit_timer
+        speed_of = self.speed
+        dir_x = self.dir_x
+        dir_y = self.dir_y
+        patrol_timer = self.patrol_timer
+        patrol_interval = self.patrol_interval
+        attack_cooldown = self.attack_cooldown
+        attack_cooldown_max = self.attack_cooldown_max
+        special_cooldown = self.special_cooldown
+        special_cooldown_max = self.special_cooldown_max
+        damage = self.damage
+        slide = maze.slide
+        player_rect = player.rect
+        player_x, player_y = player_rect.x, player_rect.y
+        if flow_field is not None and repath:
+            flow_field.update(player_rect)
+
+        for view in views:
+            slot = view.slot
+            kind = kind_of[slot]
+            if hit_timer[slot] > 0:
+                hit_timer[slot] -= 1
+            if kind == KIND_CUSTOM:
+                view.move(maze, player)
+                if attacks_enabled:
+                    self.collect(view.attack(player), projectiles, spawned)
+                continue
+
+            rect = view.rect
+            x, y = rect.x, rect.y
+            speed = speed_of[slot]
+            if kind == KIND_CHASER:
+                step = flow_field.steer(rect, speed) if flow_field is not None else None
+                if step and step != (0, 0):
+                    dx, dy = step
+                else:
+                    # Sharing the player's tile (or cut off from it): head straight for them
+                    dx = speed if player_x > x else -speed if player_x < x else 0
+                    dy = speed if player_y > y else -speed if player_y < y else 0
+            else:
+                if kind != KIND_DIAGONAL:
+                    patrol_timer[slot] += 1
+                    if patrol_timer[slot] >= patrol_interval[slot]:
+                        dir_x[slot], dir_y[slot] = rng.choice(CARDINAL_DIRECTIONS)
+                        patrol_timer[slot] = 0
+                dx = dir_x[slot] * speed
+                dy = dir_y[slot] * speed
+            x, y, blocked_x, blocked_y = slide(x, y, rect.width, rect.height, dx, dy)
+            rect.x = x
+            rect.y = y
+            if blocked_x or blocked_y:
+                if kind == KIND_DIAGONAL:
+                    dir_x[slot], dir_y[slot] = rng.choice(DIAGONAL_DIRECTIONS)
+                else:
+                    dir_x[slot], dir_y[slot] = rng.choice(CARDINAL_DIRECTIONS)
+                    if kind != KIND_CHASER:
+                        patrol_timer[slot] = 0
+
+            if not attacks_enabled:
+                continue
+            if kind == KIND_SHOOTER:
+                if special_cooldown[slot] > 0:
+                    special_cooldown[slot] -= 1
+                else:
+                    aim_x = player_x - x
+                    aim_y = player_y - y
+                    distance = (aim_x ** 2 + aim_y ** 2) ** 0.5
+                    if distance > 0:
+                        projectiles.append((pygame.Rect(rect.centerx, rect.centery, 10, 10),
+                                            aim_x / distance, aim_y / distance))
+                        special_cooldown[slot] = special_cooldown_max[slot]
+                    continue
+            if attack_cooldown[slot] > 0:
+                attack_cooldown[slot] -= 1
+            elif rect.colliderect(player_rect):
+                player.take_damage(damage[slot])
+                attack_cooldown[slot] = attack_cooldown_max[slot]
+        return projectiles, spawned
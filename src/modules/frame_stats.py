@@ -0,0 +1,16 @@
+# src/modules/frame_stats.py
+# Per-frame draw counters for the F3 performance overlay. Draw code bumps them directly
+# (frame_stats.blits += n); the overlay reads and resets them once a frame.
+blits = 0
+surfaces = 0
+text_hits = 0
+text_misses = 0
+
+
+def reset():
+    global blits, surfaces, text_hits, text_misses
+    blits = surfaces = text_hits = text_misses = 0
+
+
+def snapshot():
+    return blits, surfaces, text_hits, text_misses
@@ -1,9 +1,18 @@
 # src/modules/game_state.py
 import pickle
+import time
+from src.modules import hitches, telemetry
 from src.modules.npcs import NPC
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+# Relative to the working directory; a replay points this at a scratch copy
+SAVE_PATH = 'savegame.pkl'
 
 def save_game(player, world, vitalik_freed, choice_made, self_save_choice_made, vitalik):
-    print("Saving game state...")
+    log.info("Saving game state...")
+    start = time.perf_counter()
     try:
         game_state = {
             'player': {
@@ -33,7 +42,9 @@ def save_game(player, world, vitalik_freed, choice_made, self_save_choice_made,
             },
             'world': {
                 'current_area': world.current_area,
-                'current_scene': world.current_scene
+                'current_scene': world.current_scene,
+                'seed': world.seed,
+                'scene_deltas': world.snapshot_deltas()
             },
             'vitalik_freed': vitalik_freed,
             'choice_made': choice_made,
@@ -45,18 +56,25 @@ def save_game(player, world, vitalik_freed, choice_made, self_save_choice_made,
                 'rect': (vitalik.rect.x, vitalik.rect.y) if vitalik else None
             }
         }
-        with open('savegame.pkl', 'wb') as f:
+        with open(SAVE_PATH, 'wb') as f:
             pickle.dump(game_state, f)
-        print("Game state saved successfully.")
+        log.debug("Game state saved successfully.")
+        telemetry.event("save", ms=telemetry.elapsed_ms(start), ok=True)
+        hitches.note_since("save_game", "", start)
     except Exception as e:
-        print(f"Failed to save game state: {e}")
+        log.warning("Failed to save game state: %s", e)
+        telemetry.event("save", ms=telemetry.elapsed_ms(start), ok=False, error=type(e).__name__)
 
 def load_game():
-    print("Loading game state...")
+    log.info("Loading game state...")
+    start = time.perf_counter()
     try:
-        with open('savegame.pkl', 'rb') as f:
+        with open(SAVE_PATH, 'rb') as f:
             game_state = pickle.load(f)
+        telemetry.event("load", ms=telemetry.elapsed_ms(start), ok=True)
+        hitches.note_since("load_game", "", start)
         return game_state
     except Exception as e:
-        print(f"Failed to load game state: {e}. Starting new game.")
+        log.warning("Failed to load game state: %s. Starting new game.", e)
+        telemetry.event("load", ms=telemetry.elapsed_ms(start), ok=False, error=type(e).__name__)
         return None
\ No newline at end of file
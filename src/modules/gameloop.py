@@ -0,0 +1,136 @@
+# src/modules/gameloop.py
+# The parts of a main-loop tick and frame that never open a modal screen, shared by main() and the frame
+# benchmark (src/tools/framebench.py) so the benchmark runs the game's own code. A tick is begin_tick(),
+# then main's exits, pickups, interactions and prompts, then finish_tick(); a frame draws with draw_frame().
+import pygame
+from src.config import TILE_SIZE, BLACK, PROJECTILE_DAMAGE
+from src.modules.enemies import Sapa, SplitterSapa, ProjectileSapa, ChaserSapa, DiagonalSapa
+from src.modules.scheduler import TickScheduler
+from src.modules.rendering import draw_ui, draw_labels, draw_exits, draw_minimap, apply_critical_tint
+from src.modules import profiling as timings
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+
+def new_scheduler():
+    # Periodic gameplay checks that don't need to run on every tick, staggered so they rarely coincide
+    scheduler = TickScheduler()
+    scheduler.register("repath", every=4)
+    scheduler.register("pickups", every=3, phase=1)
+    return scheduler
+
+
+def roll_spawn(world, scene, player, horde=0):
+    # Sapa spawning logic: Maintain up to 5 Sapa, but not in Sapa-free scenes.
+    # Horde arena mode (--horde N) keeps N sapas, drawn from every type, in whichever scene the player is in.
+    sapas = scene.sapas
+    max_sapas = horde if horde else 5
+    if (horde or (world.current_area > 0 or world.current_scene != 2) and world.current_scene != world.areas[
+        world.current_area].sapa_free_scene) and len(sapas) < max_sapas:
+        spawn_probability = 0.1 if player.inventory.has_sword and world.current_scene < 4 else 0.05
+        if horde:
+            spawn_probability = 1.0
+        spawn_rng = scene.stream("spawns")
+        if spawn_rng.random() < spawn_probability:
+            available_sapa_types = [Sapa, DiagonalSapa]
+            if world.current_area >= 1 and player.inventory.has_sword or horde:
+                available_sapa_types.append(ChaserSapa)
+            if world.current_area >= 2 or horde:
+                available_sapa_types.append(SplitterSapa)
+            if world.current_area >= 3 or horde:
+                available_sapa_types.append(ProjectileSapa)
+            sapa_type = spawn_rng.choice(available_sapa_types)
+            new_sapa = sapa_type(scene, player.level)
+            sapas.append(new_sapa)
+            log.debug("Spawned new Sapa: %s, Total Sapa: %s", new_sapa.name, len(sapas))
+
+
+def begin_tick(world, player, vitalik, combat, scheduler, interpolator, horde=0):
+    # Start of a simulation tick: scheduled phases, interpolation snapshot, spawning and movement.
+    # Returns the scene the tick runs in.
+    scheduler.tick()
+    scene = world.get_current_scene()
+    interpolator.capture([player.rect] + ([vitalik.rect] if vitalik else []) +
+                         [sapa.rect for sapa in scene.sapas] +
+                         [attack.rect for attack in combat.attacks])
+
+    with timings.scope("sim.spawn"):
+        roll_spawn(world, scene, player, horde)
+
+    with timings.scope("sim.player_move"):
+        keys = pygame.key.get_pressed()
+        player.move(keys, scene.maze)
+
+    with timings.scope("sim.vitalik_follow"):
+        if vitalik and vitalik.following:
+            dx = player.rect.x - vitalik.rect.x
+            dy = player.rect.y - vitalik.rect.y
+            distance = (dx ** 2 + dy ** 2) ** 0.5
+            if distance > TILE_SIZE * 1.5:
+                speed = 3
+                if distance != 0:
+                    dx = dx / distance * speed
+                    dy = dy / distance * speed
+                vitalik.rect.x, vitalik.rect.y, _, _ = scene.maze.move_and_slide(vitalik.rect, dx, dy)
+    return scene
+
+
+def finish_tick(scene, player, projectiles, combat, scheduler):
+    # Enemies, projectiles, combat and the player's own timers. Returns True if the sapas killed the player.
+    sapas = scene.sapas
+    # Every sapa's timers, movement and attacks in one batched pass over the scene's enemy pool
+    with timings.scope("sim.sapas"):
+        new_projectiles, spawned_sapas = scene.enemy_pool.update(
+            sapas, scene.maze, player, attacks_enabled=not player.optimism_ring_active,
+            flow_field=scene.flow_field, repath=scheduler.due("repath"))
+        projectiles.extend(new_projectiles)
+        sapas.extend(spawned_sapas)
+        defeated = player.hp <= 0
+        scene.sapa_index.sync(sapas)
+        scene.spawns.track(sapas)
+
+    # The optimism ring lets projectiles pass through the player untouched
+    with timings.scope("sim.projectiles"):
+        hits = projectiles.update(scene.maze, None if player.optimism_ring_active else player.rect)
+        for _ in range(hits):
+            player.take_damage(PROJECTILE_DAMAGE)
+
+    with timings.scope("sim.combat"):
+        combat.update(sapas, player, scene.sapa_index)
+    player.update()
+    return defeated
+
+
+def draw_frame(canvas, world, scene, player, vitalik, projectiles, combat, dialogue_box, sprites, interpolator,
+               alpha, infection_active, show_minimap, perf):
+    # The whole frame, with moving things placed `alpha` of the way from the previous tick to the latest.
+    # sprites holds the HUD font and icons loaded once by the caller.
+    interpolator.begin(alpha)
+    canvas.fill(BLACK)
+    scene_start = perf.now()
+    scene.draw(canvas)
+    perf.add("scene_draw", scene_start)
+    with timings.scope("render.sapas"):
+        for sapa in scene.sapas:
+            sapa.draw(canvas)
+    with timings.scope("render.projectiles"):
+        projectiles.draw(canvas, sprites["projectile"], alpha)
+    if scene.npc:
+        scene.npc.draw(canvas)
+    if hasattr(scene, 'npcs'):
+        for npc in scene.npcs:
+            npc.draw(canvas)
+    if vitalik and vitalik.following:
+        vitalik.draw(canvas)
+    player.draw(canvas)
+    combat.draw(canvas)
+    draw_ui(canvas, player, world, sprites["font"], sprites["heart"], sprites["coin"], sprites["virus"],
+            sprites["ring"], infection_active)
+    draw_labels(canvas, scene, player, sprites["font"])
+    draw_exits(canvas, scene, sprites["font"], sprites["arrow"])
+    if show_minimap:
+        draw_minimap(canvas, scene, player, sprites["font"])
+    apply_critical_tint(canvas, infection_active, player)
+    dialogue_box.draw(canvas)
+    interpolator.end()
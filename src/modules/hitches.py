@@ -0,0 +1,180 @@
+# src/modules/hitches.py
+# Hitch detector: code that can stall a frame notes what it did (scene construction, asset loads, saves,
+# spawn retries, music loads, font lookups, GC collections), and when a frame takes longer than
+# HITCH_FACTOR frame budgets those notes are kept with the game context. Frames that ran a modal screen
+# (menus, minigames, blocking dialogue) are not hitches. The F3 overlay lists recent hitches and every one
+# is appended to HITCH_PATH as a JSON line.
+import gc
+import json
+import os
+import time
+from collections import deque
+import pygame
+from src.config import FPS, HITCH_FACTOR, HITCH_HISTORY, HITCH_PATH
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+BUDGET_MS = 1000 / FPS
+MAX_NOTES = 64  # per frame; a scene build loads many sprites, the rest are counted in "dropped"
+
+_installed = False
+_path = None
+_notes = []  # (kind, detail, ms) this frame
+_dropped = 0
+_gc = [[0, 0.0], [0, 0.0], [0, 0.0]]  # per generation: collections and ms this frame
+_gc_start = 0.0
+_modal = None
+_last = None
+_scene = None
+_recent = deque(maxlen=HITCH_HISTORY)
+_pending = []  # hitches not yet appended to the file
+_count = 0
+
+
+def note(kind, detail, ms):
+    global _dropped
+    if not _installed:
+        return
+    if len(_notes) < MAX_NOTES:
+        _notes.append((kind, detail, ms))
+    else:
+        _dropped += 1
+
+
+def note_since(kind, detail, start):
+    if _installed:
+        note(kind, detail, (time.perf_counter() - start) * 1000)
+
+
+def modal(name):
+    # A menu, minigame or blocking dialogue is running inside this frame
+    global _modal
+    _modal = name
+
+
+def modal_this_frame():
+    # The modal screen that ran since the last end_frame(), or None
+    return _modal
+
+
+def _timed(kind, function, describe):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            note(kind, describe(*args, **kwargs), (time.perf_counter() - start) * 1000)
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def _music_name(filename, *args, **kwargs):
+    return os.path.basename(str(filename))
+
+
+def _font_name(name, size, *args, **kwargs):
+    return f"{name} {size}"
+
+
+def _gc_callback(phase, info):
+    global _gc_start
+    if phase == "start":
+        _gc_start = time.perf_counter()
+    else:
+        entry = _gc[info["generation"]]
+        entry[0] += 1
+        entry[1] += (time.perf_counter() - _gc_start) * 1000
+
+
+def install(path=None):
+    # Before pygame.init(), so the wrappers see the first music load and font lookup
+    global _installed, _path
+    if _installed:
+        return
+    _installed = True
+    _path = path or HITCH_PATH
+    pygame.mixer.music.load = _timed("music_load", pygame.mixer.music.load, _music_name)
+    pygame.font.SysFont = _timed("font_lookup", pygame.font.SysFont, _font_name)
+    gc.callbacks.append(_gc_callback)
+    log.info("Hitch detector on: frames over %.1f ms are logged to %s", BUDGET_MS * HITCH_FACTOR, _path)
+
+
+def installed():
+    return _installed
+
+
+def _reset_frame():
+    global _dropped, _modal
+    _notes.clear()
+    _dropped = 0
+    _modal = None
+    for entry in _gc:
+        entry[0], entry[1] = 0, 0.0
+
+
+def end_frame(area, scene, counts):
+    # Once per main-loop frame, after the flip; the frame is the time since the previous call
+    global _last, _scene, _count
+    if not _installed:
+        return
+    now = time.perf_counter()
+    frame_ms = (now - _last) * 1000 if _last is not None else 0.0
+    _last = now
+    if _modal is None and frame_ms > BUDGET_MS * HITCH_FACTOR:
+        notes = [{"kind": kind, "detail": detail, "ms": round(ms, 3)} for kind, detail, ms in _notes]
+        for generation, (collections, ms) in enumerate(_gc):
+            if collections:
+                notes.append({"kind": "gc", "detail": f"gen{generation} x{collections}", "ms": round(ms, 3)})
+        # Longest first; notes can nest (a scene build includes its asset loads)
+        notes.sort(key=lambda item: -item["ms"])
+        hitch = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "frame_ms": round(frame_ms, 3),
+                 "budget_ms": round(BUDGET_MS, 3), "area": area, "scene": scene, "counts": dict(counts),
+                 "notes": notes, "dropped": _dropped}
+        _recent.append(hitch)
+        _pending.append(hitch)
+        _count += 1
+        log.debug("Hitch: %.1f ms in area %s scene %s", frame_ms, area, scene)
+    _reset_frame()
+    if (area, scene) != _scene:
+        # Scene changes are where hitches cluster; append them once the new scene is up
+        _scene = (area, scene)
+        flush()
+
+
+def recent(limit=None):
+    hitches = list(_recent)
+    return hitches[-limit:] if limit else hitches
+
+
+def count():
+    return _count
+
+
+def summary(hitch, causes=2):
+    # One line for the overlay: when, how long, where, and the biggest causes
+    causes = ", ".join(f"{item['kind']} {item['detail']} {item['ms']:.1f}" for item in hitch["notes"][:causes])
+    return (f"{hitch['time'][11:]} {hitch['frame_ms']:.0f} ms a{hitch['area']}s{hitch['scene']}: "
+            f"{causes or 'nothing noted'}")
+
+
+def flush():
+    if not _pending:
+        return
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(_path)), exist_ok=True)
+        with open(_path, "a", encoding="utf-8") as f:
+            for hitch in _pending:
+                f.write(json.dumps(hitch, separators=(",", ":")) + "\n")
+    except OSError as e:
+        log.warning("Failed to append hitches to %s: %s", _path, e)
+    _pending.clear()
+
+
+def write():
+    # atexit
+    if _installed:
+        flush()
+        if _count:
+            log.info("%s hitches this session, logged to %s", _count, _path)
@@ -8,6 +8,10 @@ from src.modules.minigames.sapa_dodge import play_sapa_dodge
 from src.modules.minigames.anagram import play_anagram
 from src.modules.minigames.memory_sequence import play_memory_sequence
 from src.modules.minigames.color_match import play_color_match
+from src.modules.context_profile import profiled
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
 
 def get_minigames():
     return [
@@ -18,12 +22,13 @@ def get_minigames():
         {"func": play_color_match, "requires_gender": False}
     ]
 
+@profiled("vendor")
 def vendor_interaction(screen, clock, player, vendor, dialogue_box, ui_background):
-    print("Entering vendor_interaction...")
+    log.debug("Entering vendor_interaction...")
     try:
         font = pygame.font.SysFont(DEFAULT_FONT, 36)
     except:
-        print(f"Failed to load font '{DEFAULT_FONT}'. Using default font.")
+        log.warning("Failed to load font '%s'. Using default font.", DEFAULT_FONT)
         font = pygame.font.Font(None, 36)
 
     panel = pygame.Surface((SCREEN_WIDTH - 80, SCREEN_HEIGHT - 100), pygame.SRCALPHA)
@@ -46,10 +51,10 @@ def vendor_interaction(screen, clock, player, vendor, dialogue_box, ui_backgroun
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in vendor_interaction.")
+                log.info("Quit event in vendor_interaction.")
                 return False
             if event.type == pygame.KEYDOWN:
-                print(f"Key pressed in vendor_interaction: {event.key}")
+                log.debug("Key pressed in vendor_interaction: %s", event.key)
                 if event.key in range(pygame.K_1, pygame.K_9 + 1):
                     index = event.key - pygame.K_1 + 1
                     if 1 <= index <= len(options):
@@ -80,11 +85,12 @@ def vendor_interaction(screen, clock, player, vendor, dialogue_box, ui_backgroun
     dialogue_box.active = False
     dialogue_box.lines = []
     dialogue_box.current_line = 0
-    print("Exiting vendor_interaction...")
+    log.debug("Exiting vendor_interaction...")
     return True
 
+@profiled("sword_puzzle")
 def play_sword_puzzle(screen, clock, dialogue_box, ui_background, player_gender):
-    print("Entering play_sword_puzzle...")
+    log.debug("Entering play_sword_puzzle...")
     minigames = get_minigames()
     available_minigames = minigames.copy()
     dialogue_box.show(["Vitalik: A puzzle guards the Sword of Solvency! Solve it to proceed. Press Y to start, N to skip, or ESC to close."], context="default")
@@ -94,7 +100,7 @@ def play_sword_puzzle(screen, clock, dialogue_box, ui_background, player_gender)
     while not choice_made:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in play_sword_puzzle.")
+                log.info("Quit event in play_sword_puzzle.")
                 return False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_y:
@@ -116,7 +122,7 @@ def play_sword_puzzle(screen, clock, dialogue_box, ui_background, player_gender)
                                 dialogue_box.show(["Vitalik: Puzzle cancelled. Try again. Press Y to retry, N to skip, or ESC to close."], context="default")
                                 break
                         except Exception as e:
-                            print(f"Error in play_sword_puzzle with minigame {selected_minigame['func'].__name__}: {e}")
+                            log.error("Error in play_sword_puzzle with minigame %s: %s", selected_minigame['func'].__name__, e)
                             available_minigames.remove(selected_minigame)
                             if not available_minigames:
                                 dialogue_box.show(["Vitalik: All puzzles failed! You cannot proceed."], context="default")
@@ -138,11 +144,12 @@ def play_sword_puzzle(screen, clock, dialogue_box, ui_background, player_gender)
     dialogue_box.active = False
     dialogue_box.lines = []
     dialogue_box.current_line = 0
-    print("Exiting play_sword_puzzle...")
+    log.debug("Exiting play_sword_puzzle...")
     return result
 
+@profiled("vitalik_puzzle")
 def play_vitalik_puzzle(screen, clock, dialogue_box, ui_background, player_gender):
-    print("Entering play_vitalik_puzzle...")
+    log.debug("Entering play_vitalik_puzzle...")
     minigames = get_minigames()
     available_minigames = minigames.copy()
     dialogue_box.show(["Vitalik: I’m trapped! Solve this puzzle to free me. Press Y to start, N to skip, or ESC to close."], context="default")
@@ -152,7 +159,7 @@ def play_vitalik_puzzle(screen, clock, dialogue_box, ui_background, player_gende
     while not choice_made:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in play_vitalik_puzzle.")
+                log.info("Quit event in play_vitalik_puzzle.")
                 return False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_y:
@@ -174,7 +181,7 @@ def play_vitalik_puzzle(screen, clock, dialogue_box, ui_background, player_gende
                                 dialogue_box.show(["Vitalik: Puzzle cancelled. Try again. Press Y to retry, N to skip, or ESC to close."], context="default")
                                 break
                         except Exception as e:
-                            print(f"Error in play_vitalik_puzzle with minigame {selected_minigame['func'].__name__}: {e}")
+                            log.error("Error in play_vitalik_puzzle with minigame %s: %s", selected_minigame['func'].__name__, e)
                             available_minigames.remove(selected_minigame)
                             if not available_minigames:
                                 dialogue_box.show(["Vitalik: All puzzles failed! You cannot proceed."], context="default")
@@ -196,11 +203,12 @@ def play_vitalik_puzzle(screen, clock, dialogue_box, ui_background, player_gende
     dialogue_box.active = False
     dialogue_box.lines = []
     dialogue_box.current_line = 0
-    print("Exiting play_vitalik_puzzle...")
+    log.debug("Exiting play_vitalik_puzzle...")
     return result
 
+@profiled("quest")
 def play_quest_minigame(screen, clock, dialogue_box, ui_background, minigame_dict, player, player_gender):
-    print("Entering play_quest_minigame...")
+    log.debug("Entering play_quest_minigame...")
     minigame_func = minigame_dict["func"]
     requires_gender = minigame_dict["requires_gender"]
     available_minigames = get_minigames().copy()
@@ -211,7 +219,7 @@ def play_quest_minigame(screen, clock, dialogue_box, ui_background, minigame_dic
     while not choice_made:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in play_quest_minigame.")
+                log.info("Quit event in play_quest_minigame.")
                 return False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_y:
@@ -233,7 +241,7 @@ def play_quest_minigame(screen, clock, dialogue_box, ui_background, minigame_dic
                                 dialogue_box.show(["NPC: Challenge cancelled. Press Y to retry, N to skip, or ESC to close."], context="default")
                                 return False
                         except Exception as e:
-                            print(f"Error in play_quest_minigame with minigame {minigame_func.__name__}: {e}")
+                            log.error("Error in play_quest_minigame with minigame %s: %s", minigame_func.__name__, e)
                             available_minigames.remove(minigame_dict)
                             if not available_minigames:
                                 dialogue_box.show(["NPC: All challenges failed to load. No reward this time."], context="default")
@@ -256,11 +264,12 @@ def play_quest_minigame(screen, clock, dialogue_box, ui_background, minigame_dic
     dialogue_box.active = False
     dialogue_box.lines = []
     dialogue_box.current_line = 0
-    print("Exiting play_quest_minigame...")
+    log.debug("Exiting play_quest_minigame...")
     return False
 
+@profiled("final_cutscene")
 def final_cutscene(screen, clock, player, ui_background):
-    print("Entering final_cutscene...")
+    log.debug("Entering final_cutscene...")
     pronoun = "his" if player.gender == "male" else "her"
     lines = [
         f"Vitalik: With Skuld defeated, {player.name} stands before the restored Superseed.",
@@ -277,10 +286,10 @@ def final_cutscene(screen, clock, player, ui_background):
     while running and dialogue_box.active:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in final_cutscene.")
+                log.info("Quit event in final_cutscene.")
                 return False
             if event.type == pygame.KEYDOWN:
-                print(f"Key pressed in final_cutscene: {event.key}")
+                log.debug("Key pressed in final_cutscene: %s", event.key)
                 if event.key == pygame.K_SPACE:
                     dialogue_box.next_line()
                 elif event.key == pygame.K_ESCAPE:
@@ -294,5 +303,5 @@ def final_cutscene(screen, clock, player, ui_background):
     dialogue_box.active = False
     dialogue_box.lines = []
     dialogue_box.current_line = 0
-    print("Exiting final_cutscene...")
+    log.debug("Exiting final_cutscene...")
     return True
\ No newline at end of file
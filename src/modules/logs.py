@@ -0,0 +1,85 @@
+# src/modules/logs.py
+# Leveled logging for the game. Modules log through get_logger(__name__) with %-style arguments, so a
+# disabled level costs one cached level check: no string formatting and no I/O.
+import logging
+import os
+import sys
+import time
+import traceback
+from collections import deque
+from src.config import LOG_LEVEL, LOG_RING_LEVEL, LOG_RING_SIZE, LOG_DIR
+
+FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+_ring = None
+
+
+class RingBufferHandler(logging.Handler):
+    # The last `capacity` records, kept for crash dumps. Messages are resolved on arrival so the buffer
+    # doesn't keep exceptions (and their frames) or mutable arguments alive.
+    def __init__(self, capacity):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+    def dump(self, stream):
+        formatter = logging.Formatter(FORMAT)
+        for record in list(self.records):
+            stream.write(formatter.format(record) + "\n")
+
+
+def get_logger(name):
+    return logging.getLogger(name)
+
+
+def configure(level=LOG_LEVEL, ring_level=LOG_RING_LEVEL, ring_size=LOG_RING_SIZE):
+    global _ring
+    root = logging.getLogger("src")
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    console = logging.StreamHandler(sys.stdout)
+    console.setLevel(level)
+    console.setFormatter(logging.Formatter(FORMAT))
+    _ring = RingBufferHandler(ring_size)
+    _ring.setLevel(ring_level)
+    root.addHandler(console)
+    root.addHandler(_ring)
+    # The logger itself only lets through what at least one handler wants
+    root.setLevel(min(console.level, _ring.level))
+    root.propagate = False
+
+
+def dump_crash(exc_info=None):
+    # Writes the exception and the ring buffer to LOG_DIR/crash-<time>.log; returns the path or None
+    try:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        path = os.path.join(LOG_DIR, time.strftime("crash-%Y%m%d-%H%M%S.log"))
+        with open(path, "w", encoding="utf-8") as f:
+            if exc_info is not None:
+                f.write("".join(traceback.format_exception(*exc_info)))
+                f.write("\n")
+            f.write(f"--- last {len(_ring.records) if _ring else 0} log records ---\n")
+            if _ring is not None:
+                _ring.dump(f)
+        return path
+    except OSError as e:
+        sys.stderr.write(f"Failed to write crash dump: {e}\n")
+        return None
+
+
+def install_crash_handler():
+    previous = sys.excepthook
+
+    def handle(exc_type, exc_value, exc_traceback):
+        if not issubclass(exc_type, (KeyboardInterrupt, SystemExit)):
+            path = dump_crash((exc_type, exc_value, exc_traceback))
+            if path:
+                sys.stderr.write(f"Crash log written to {path}\n")
+        previous(exc_type, exc_value, exc_traceback)
+
+    sys.excepthook = handle
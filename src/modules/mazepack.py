@@ -0,0 +1,148 @@
+# src/modules/mazepack.py
+# Pre-baked maze layouts, bit-packed one record per maze (see src/tools/build_maze_pack.py).
+#
+# File layout (little endian):
+#   header  : magic "MZPK", version u16, width u8, height u8, record_size u16, config_count u16
+#   index   : config_count x (name 16s, first_record u32, record_count u32)
+#   records : grid bits row-major, LSB first, padded to a whole byte; then entry x, entry y, exit x, exit y (u8)
+import mmap
+import os
+import struct
+import zlib
+from src.config import MAZE_WIDTH, MAZE_HEIGHT, MAZE_PACK_PATH
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+MAGIC = b"MZPK"
+VERSION = 1
+HEADER = struct.Struct("<4sHBBHH")
+INDEX_ENTRY = struct.Struct("<16sII")
+GRID_BYTES = (MAZE_WIDTH * MAZE_HEIGHT + 7) // 8
+RECORD_SIZE = GRID_BYTES + 4
+
+# Variety transforms that keep a 20x13 grid 20x13 (a quarter turn would not fit the playfield)
+TRANSFORMS = ["identity", "mirror_x", "mirror_y", "rotate_180"]
+
+
+def pack_record(grid, entry, exit_):
+    bits = 0
+    for i, cell in enumerate(cell for row in grid for cell in row):
+        if cell:
+            bits |= 1 << i
+    return bits.to_bytes(GRID_BYTES, "little") + bytes((entry[0], entry[1], exit_[0], exit_[1]))
+
+
+def unpack_record(data, width=MAZE_WIDTH, height=MAZE_HEIGHT):
+    # One bin() call beats 260 shifts; reversed so character i is bit i
+    bits = format(int.from_bytes(data[:GRID_BYTES], "little"), f"0{GRID_BYTES * 8}b")[::-1]
+    grid = [[int(c) for c in bits[y * width:(y + 1) * width]] for y in range(height)]
+    entry = (data[GRID_BYTES], data[GRID_BYTES + 1])
+    exit_ = (data[GRID_BYTES + 2], data[GRID_BYTES + 3])
+    return grid, entry, exit_
+
+
+def transform_opening(opening, flip_x, flip_y, width, height):
+    # Openings are two cells wide and recorded by their higher-index cell, so along the opening's
+    # own axis a mirror maps x -> width - x; across it the usual width - 1 - x applies.
+    x, y = opening
+    along_x = y in (0, height - 1)
+    if flip_x:
+        x = width - x if along_x else width - 1 - x
+    if flip_y:
+        y = height - 1 - y if along_x else height - y
+    return x, y
+
+
+def apply_transform(grid, entry, exit_, transform):
+    height = len(grid)
+    width = len(grid[0])
+    flip_x = transform in ("mirror_x", "rotate_180")
+    flip_y = transform in ("mirror_y", "rotate_180")
+    rows = grid[::-1] if flip_y else grid
+    grid = [row[::-1] if flip_x else row[:] for row in rows]
+    entry = transform_opening(entry, flip_x, flip_y, width, height)
+    exit_ = transform_opening(exit_, flip_x, flip_y, width, height)
+    return grid, entry, exit_
+
+
+def write_pack(path, configurations):
+    # configurations: list of (name, [record bytes])
+    header = HEADER.pack(MAGIC, VERSION, MAZE_WIDTH, MAZE_HEIGHT, RECORD_SIZE, len(configurations))
+    index = b""
+    first = 0
+    for name, records in configurations:
+        index += INDEX_ENTRY.pack(name.encode("ascii"), first, len(records))
+        first += len(records)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(index)
+        for _, records in configurations:
+            for record in records:
+                f.write(record)
+
+
+class MazePack:
+    def __init__(self, path):
+        log.info("Opening maze pack %s...", path)
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, width, height, record_size, config_count = HEADER.unpack_from(self.data, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Unsupported maze pack format {magic!r} v{version}")
+            if (width, height, record_size) != (MAZE_WIDTH, MAZE_HEIGHT, RECORD_SIZE):
+                raise ValueError(f"Maze pack is {width}x{height}, game expects {MAZE_WIDTH}x{MAZE_HEIGHT}")
+            self.records_offset = HEADER.size + INDEX_ENTRY.size * config_count
+            self.configs = {}
+            for i in range(config_count):
+                name, first, count = INDEX_ENTRY.unpack_from(self.data, HEADER.size + INDEX_ENTRY.size * i)
+                self.configs[name.rstrip(b"\0").decode("ascii")] = (first, count)
+            # Identifies this exact pack so saved per-scene deltas are only replayed onto the same layouts
+            self.checksum = zlib.crc32(self.data) & 0xFFFFFFFF
+            log.info("Maze pack loaded: %s", ', '.join((f'{k}={v[1]}' for k, v in self.configs.items())))
+        except Exception:
+            self.file.close()
+            raise
+
+    def count(self, config):
+        return self.configs.get(config, (0, 0))[1]
+
+    def record(self, config, index):
+        first, count = self.configs[config]
+        offset = self.records_offset + (first + index % count) * RECORD_SIZE
+        return unpack_record(self.data[offset:offset + RECORD_SIZE])
+
+    def pick(self, config, rng):
+        # Seeded choice of record and variety transform; returns None when the pack lacks this config
+        count = self.count(config)
+        if count == 0:
+            return None
+        index = rng.randrange(count)
+        transform = rng.choice(TRANSFORMS)
+        grid, entry, exit_ = apply_transform(*self.record(config, index), transform)
+        return grid, entry, exit_, f"pack:{self.checksum:08x}:{config}:{index}:{transform}"
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+
+_pack = None
+_pack_loaded = False
+
+
+def get_maze_pack():
+    # Opened lazily once per process; a missing or unreadable pack means scenes fall back to the generator
+    global _pack, _pack_loaded
+    if not _pack_loaded:
+        _pack_loaded = True
+        try:
+            if not os.path.exists(MAZE_PACK_PATH):
+                raise FileNotFoundError(f"File not found: {MAZE_PACK_PATH}")
+            _pack = MazePack(MAZE_PACK_PATH)
+        except (OSError, ValueError, struct.error) as e:
+            log.warning("Failed to load maze pack: %s. Generating mazes at runtime.", e)
+            _pack = None
+    return _pack
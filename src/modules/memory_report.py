@@ -0,0 +1,89 @@
+# src/modules/memory_report.py
+# --memory-report: Python heap by subsystem (tracemalloc) plus pixel memory of the surfaces the game holds,
+# which SDL allocates outside the Python heap.
+import os
+import sys
+import tracemalloc
+import pygame
+from src.modules.assets import cached_surfaces, surface_bytes
+
+SCENE_SURFACES = ["background", "floor_tile", "wall_tile", "sword_sprite", "token_sprite", "checkpoint_sprite",
+                  "fragment_sprite"]
+
+
+def start():
+    print("Memory report enabled; tracing Python allocations...")
+    tracemalloc.start()
+
+
+def subsystem_of(filename):
+    parts = filename.replace("\\", "/").split("/")
+    if "src" in parts:
+        return os.path.splitext("/".join(parts[parts.index("src") + 1:]))[0].replace("/", ".")
+    if "pygame" in parts:
+        return "pygame"
+    return "python"
+
+
+def resident_kb():
+    # Current RSS from /proc where available, else the peak from getrusage
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+    except (ImportError, OSError):
+        return None
+
+
+def world_surfaces(world):
+    # Every distinct surface reachable from loaded scenes, tagged with what holds it
+    found = {}
+
+    def add(surface, category):
+        if isinstance(surface, pygame.Surface) and id(surface) not in found:
+            found[id(surface)] = (surface, category)
+
+    for key, surface, category in cached_surfaces():
+        add(surface, category)
+    for area in world.areas:
+        for scene in area.scenes:
+            for name in SCENE_SURFACES:
+                add(getattr(scene, name, None), "scene")
+            for enemy in scene.sapas + ([scene.boss] if scene.boss else []):
+                add(getattr(enemy, "image", None), "enemies")
+            for npc in ([scene.npc] if scene.npc else []) + getattr(scene, "npcs", []):
+                add(getattr(npc, "image", None), "npcs")
+    return found.values()
+
+
+def report(world=None, label="", limit=12):
+    print(f"=== Memory report{': ' + label if label else ''} ===")
+    rss = resident_kb()
+    if rss is not None:
+        print(f"Resident set: {rss / 1024:.1f} MB")
+    if tracemalloc.is_tracing():
+        totals = {}
+        for stat in tracemalloc.take_snapshot().statistics("filename"):
+            subsystem = subsystem_of(stat.traceback[0].filename)
+            size, count = totals.get(subsystem, (0, 0))
+            totals[subsystem] = (size + stat.size, count + stat.count)
+        current, peak = tracemalloc.get_traced_memory()
+        print(f"Python heap: {current / 1048576:.1f} MB (peak {peak / 1048576:.1f} MB)")
+        for subsystem, (size, count) in sorted(totals.items(), key=lambda item: -item[1][0])[:limit]:
+            print(f"  {subsystem:<28} {size / 1024:>10.1f} KB  {count:>8} blocks")
+    else:
+        print("Python heap: tracemalloc not running (start with --memory-report)")
+    if world is not None:
+        by_category = {}
+        for surface, category in world_surfaces(world):
+            size, count = by_category.get(category, (0, 0))
+            by_category[category] = (size + surface_bytes(surface), count + 1)
+        total = sum(size for size, _ in by_category.values())
+        print(f"Surfaces: {total / 1048576:.1f} MB")
+        for category, (size, count) in sorted(by_category.items(), key=lambda item: -item[1][0]):
+            print(f"  {category:<28} {size / 1024:>10.1f} KB  {count:>8} surfaces")
@@ -7,6 +7,11 @@ from src.config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, DEFAULT_FONT,
     UI_BACKGROUND, ROOT_DIR, SOUND_CUTSCENE_MUSIC
 )
+from src.modules.context_profile import profiled
+from src.modules.telemetry import minigame, minigame_loaded
+from src.modules.logs import get_logger, configure
+
+log = get_logger(__name__)
 
 # --- Constants ---
 
@@ -48,7 +53,7 @@ WORD_LIST_PATH = os.path.join("data", WORD_LIST_FILENAME) # Default relative pat
 if 'ROOT_DIR' in globals() and ROOT_DIR: # Check if ROOT_DIR is defined and not empty
     WORD_LIST_PATH = os.path.join(ROOT_DIR, "data", WORD_LIST_FILENAME)
 else:
-    print("Warning: ROOT_DIR not found in config, using relative path for word list.")
+    log.warning("ROOT_DIR not found in config, using relative path for word list.")
 
 # Keys
 START_KEY = pygame.K_RETURN
@@ -77,35 +82,37 @@ def draw_text_with_shadow(screen, text, font, position, color, shadow_color, sha
         screen.blit(shadow_surface, shadow_rect)
         screen.blit(text_surface, text_rect)
     except Exception as e:
-        print(f"Error drawing text '{text}': {e}")
+        log.error("Error drawing text '%s': %s", text, e)
 
 
 def load_words(filename):
     """Loads words from a file, one word per line."""
     default_words = ["BLOCK", "CHAIN", "TOKEN", "WALLET", "MINING", "CRYPTO"] # Fallback
     if not os.path.exists(filename):
-        print(f"Warning: Word file '{filename}' not found. Using default words.")
+        log.warning("Word file '%s' not found. Using default words.", filename)
         return default_words
     try:
         with open(filename, 'r') as f:
             words = [line.strip().upper() for line in f if line.strip()]
         if not words:
-            print(f"Warning: Word file '{filename}' is empty. Using default words.")
+            log.warning("Word file '%s' is empty. Using default words.", filename)
             return default_words
-        print(f"Loaded {len(words)} words from {filename}")
+        log.info("Loaded %s words from %s", len(words), filename)
         return words
     except Exception as e:
-        print(f"Error loading word file '{filename}': {e}. Using default words.")
+        log.error("Error loading word file '%s': %s. Using default words.", filename, e)
         return default_words
 
 # --- Main Minigame Function ---
 
+@profiled("minigame.anagram")
+@minigame("anagram")
 def play_anagram(screen, clock):
     """
     Runs the Anagram minigame with hint, skip, manual start, and retry option.
     Returns: True (success), False (failure after choosing not to retry), None (cancelled).
     """
-    print("Entering Anagram minigame...")
+    log.debug("Entering Anagram minigame...")
     # --- Initialization ---
     # One assignment per line for clarity
     main_font = None
@@ -118,7 +125,7 @@ def play_anagram(screen, clock):
         prompt_font = pygame.font.SysFont(DEFAULT_FONT_NAME, PROMPT_FONT_SIZE)
         hint_font = pygame.font.SysFont(DEFAULT_FONT_NAME, HINT_FONT_SIZE)
     except Exception as e:
-        print(f"Font load error: {e}. Using default fonts.")
+        log.warning("Font load error: %s. Using default fonts.", e)
         # Fallback fonts
         main_font = pygame.font.Font(None, FONT_SIZE)
         instr_font = pygame.font.Font(None, INSTR_FONT_SIZE)
@@ -127,7 +134,7 @@ def play_anagram(screen, clock):
 
     word_list = load_words(WORD_LIST_PATH)
     if not word_list:
-        print("Error: No words available for the anagram game. Exiting.")
+        log.error("Error: No words available for the anagram game. Exiting.")
         return False # Treat as failure
 
     # --- Load Background ---
@@ -136,16 +143,16 @@ def play_anagram(screen, clock):
         if 'UI_BACKGROUND' in globals() and UI_BACKGROUND and os.path.exists(UI_BACKGROUND):
             background_surface = pygame.image.load(UI_BACKGROUND).convert()
             background_surface = pygame.transform.scale(background_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            print("Loaded UI_BACKGROUND asset.")
+            log.debug("Loaded UI_BACKGROUND asset.")
         else:
-            print("UI_BACKGROUND path not found, empty, or variable missing.")
+            log.warning("UI_BACKGROUND path not found, empty, or variable missing.")
     except pygame.error as e:
-        print(f"Failed to load UI_BACKGROUND (Pygame Error): {e}")
+        log.warning("Failed to load UI_BACKGROUND (Pygame Error): %s", e)
     except Exception as e:
-        print(f"Failed to load UI_BACKGROUND (Other Error): {e}")
+        log.warning("Failed to load UI_BACKGROUND (Other Error): %s", e)
 
     if background_surface is None: # Fallback background
-        print("Using fallback gradient background.")
+        log.warning("Using fallback gradient background.")
         background_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         # Use fill for potentially better performance on some systems
         for y in range(SCREEN_HEIGHT):
@@ -165,13 +172,13 @@ def play_anagram(screen, clock):
             pygame.mixer.music.set_volume(0.5)
             pygame.mixer.music.play(loops=-1)
             music_playing = True
-            print("Music loaded and playing.")
+            log.info("Music loaded and playing.")
         else:
-            print("SOUND_CUTSCENE_MUSIC path not found, empty, or variable missing.")
+            log.warning("SOUND_CUTSCENE_MUSIC path not found, empty, or variable missing.")
     except pygame.error as e:
-        print(f"Failed to load or play music (Pygame Error): {e}")
+        log.warning("Failed to load or play music (Pygame Error): %s", e)
     except Exception as e:
-        print(f"An unexpected error occurred during music setup: {e}")
+        log.error("An unexpected error occurred during music setup: %s", e)
 
     # --- Game State Variables ---
     word = ""
@@ -191,7 +198,7 @@ def play_anagram(screen, clock):
         """Selects, scrambles a word, and determines a hint."""
         nonlocal word, scrambled, player_input, submitted, result_message, hint_letter, hint_index
         if not word_list: # Should not happen based on check above, but safety first
-            print("Error: Word list is empty in _setup_new_word.")
+            log.error("Error: Word list is empty in _setup_new_word.")
             # How to handle this? Maybe force an exit? For now, use a placeholder.
             word = "ERROR"
             scrambled = "RORRE"
@@ -218,9 +225,10 @@ def play_anagram(screen, clock):
         player_input = ""
         submitted = False
         result_message = ""
-        print(f"New anagram word: {word} (Scrambled: {scrambled}), Hint: '{hint_letter}' at index {hint_index}")
+        log.debug("New anagram word: %s (Scrambled: %s), Hint: '%s' at index %s", word, scrambled, hint_letter, hint_index)
 
     # --- Main Loop Wrapped in Try/Finally ---
+    minigame_loaded()
     running = True
     try: # Ensure music stops even if errors occur or loop exits unexpectedly
         while running:
@@ -235,7 +243,7 @@ def play_anagram(screen, clock):
                     # State-specific key handling
                     if game_state == "WAITING_START":
                         if event.key == START_KEY:
-                            print("Starting anagram...")
+                            log.info("Starting anagram...")
                             _setup_new_word()
                             game_state = "WAITING_INPUT"
                     elif game_state == "WAITING_INPUT":
@@ -246,22 +254,22 @@ def play_anagram(screen, clock):
                                 result_message = "Success! Correct word!" if success else f"Failed! The word was {word}."
                                 game_state = "SHOWING_RESULT"
                                 result_timer = 0 # Reset timer only used for success display
-                                print(f"Player submitted: {player_input}. Correct: {success}")
+                                log.debug("Player submitted: %s. Correct: %s", player_input, success)
                         elif event.key == pygame.K_BACKSPACE:
                             player_input = player_input[:-1]
                         elif event.key == SKIP_KEY:
-                            print("Word skipped by player.")
+                            log.info("Word skipped by player.")
                             _setup_new_word() # Get a new word immediately
                         elif event.unicode.isalpha(): # Only append letters
                             player_input += event.unicode.upper()
                     elif game_state == "SHOWING_RESULT":
                         if not success: # Only handle keys on failure screen
                             if event.key == RETRY_KEY:
-                                print("Retrying anagram...")
+                                log.info("Retrying anagram...")
                                 player_input = ""; submitted = False; result_message = ""
                                 game_state = "WAITING_INPUT" # Go back to input for same word
                             elif event.key == CONFIRM_KEY:
-                                print("Continuing after failure.")
+                                log.info("Continuing after failure.")
                                 final_outcome = False # Set failure outcome
                                 running = False; break # Exit loop
 
@@ -320,21 +328,22 @@ def play_anagram(screen, clock):
             try:
                 pygame.mixer.music.stop()
                 pygame.mixer.music.unload()
-                print("Music stopped.")
+                log.info("Music stopped.")
             except pygame.error as e:
-                print(f"Error stopping music: {e}")
+                log.error("Error stopping music: %s", e)
             except Exception as e: # Catch other potential errors during cleanup
-                 print(f"Unexpected error stopping music: {e}")
+                 log.error("Unexpected error stopping music: %s", e)
 
 
     # --- Return Outcome ---
-    print(f"Exiting Anagram. Final Outcome: {final_outcome}")
+    log.debug("Exiting Anagram. Final Outcome: %s", final_outcome)
     return final_outcome
 
 
 # --- Example usage ---
 if __name__ == '__main__':
-    print("Running Anagram minigame standalone test...")
+    configure("INFO")
+    log.info("Running Anagram minigame standalone test...")
     # Initialize Pygame modules
     pygame.init()
     pygame.font.init()
@@ -342,24 +351,24 @@ if __name__ == '__main__':
 
     # Fallback / Import config safely for testing
     try: from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, DEFAULT_FONT, UI_BACKGROUND, ROOT_DIR, SOUND_CUTSCENE_MUSIC
-    except ImportError: print("Warning: Using default values for testing."); SCREEN_WIDTH, SCREEN_HEIGHT=800,600; FPS=60; WHITE=(240, 240, 242); DEFAULT_FONT="Arial"; UI_BACKGROUND=""; SOUND_CUTSCENE_MUSIC=""
+    except ImportError: log.warning("Using default values for testing."); SCREEN_WIDTH, SCREEN_HEIGHT=800,600; FPS=60; WHITE=(240, 240, 242); DEFAULT_FONT="Arial"; UI_BACKGROUND=""; SOUND_CUTSCENE_MUSIC=""
     if 'ROOT_DIR' not in locals(): ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 
     # --- Removed dummy directory/file creation ---
     # Relies on data/anagram_words.txt existing or load_words() fallback
-    print(f"Attempting to use word list at: {WORD_LIST_PATH}")
+    log.debug("Attempting to use word list at: %s", WORD_LIST_PATH)
     # ---
 
     # Check sound path
     sound_path = SOUND_CUTSCENE_MUSIC
     if 'ROOT_DIR' in locals() and SOUND_CUTSCENE_MUSIC and not os.path.exists(sound_path) and not os.path.isabs(sound_path): sound_path = os.path.join(ROOT_DIR, SOUND_CUTSCENE_MUSIC) # Allow relative path in config
-    if not os.path.exists(sound_path): print(f"Warning: Music file not found at {sound_path}.")
+    if not os.path.exists(sound_path): log.warning("Music file not found at %s.", sound_path)
 
     # Setup screen and clock
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)); pygame.display.set_caption("Anagram Minigame Test"); clock = pygame.time.Clock()
     # Call the main function
     game_result = play_anagram(screen, clock)
-    print(f"Minigame result: {game_result}")
+    log.info("Minigame result: %s", game_result)
     # Quit Pygame
     pygame.quit()
-    print("Standalone test finished.")
\ No newline at end of file
+    log.info("Standalone test finished.")
\ No newline at end of file
@@ -3,6 +3,11 @@ import pygame
 import random
 import os
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, BLACK, DEFAULT_FONT, UI_BACKGROUND
+from src.modules.context_profile import profiled
+from src.modules.telemetry import minigame, minigame_loaded
+from src.modules.logs import get_logger, configure
+
+log = get_logger(__name__)
 
 # --- Constants ---
 # Colors (Using config WHITE/BLACK)
@@ -76,12 +81,14 @@ def draw_text_with_shadow(screen, text, font, position, color, shadow_color, sha
 
 # --- Main Minigame Function ---
 
+@profiled("minigame.color_match")
+@minigame("color_match")
 def play_color_match(screen, clock):
     """
     Runs the Color Match minigame with manual start, timer, score goal, and retry.
     Returns: True (success), False (failure), None (cancelled).
     """
-    print("Entering Color Match minigame...")
+    log.debug("Entering Color Match minigame...")
 
     # --- Initialization ---
     try:
@@ -90,7 +97,7 @@ def play_color_match(screen, clock):
         instr_font = pygame.font.SysFont(DEFAULT_FONT_NAME, INSTR_FONT_SIZE)
         prompt_font = pygame.font.SysFont(DEFAULT_FONT_NAME, PROMPT_FONT_SIZE)
     except Exception as e:
-        print(f"Failed to load system font '{DEFAULT_FONT_NAME}': {e}. Using default.")
+        log.warning("Failed to load system font '%s': %s. Using default.", DEFAULT_FONT_NAME, e)
         main_font = pygame.font.Font(None, MAIN_FONT_SIZE)
         score_font = pygame.font.Font(None, SCORE_FONT_SIZE)
         instr_font = pygame.font.Font(None, INSTR_FONT_SIZE)
@@ -102,12 +109,12 @@ def play_color_match(screen, clock):
         if UI_BACKGROUND and os.path.exists(UI_BACKGROUND):
             background_surface = pygame.image.load(UI_BACKGROUND).convert()
             background_surface = pygame.transform.scale(background_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            print("Loaded UI_BACKGROUND asset.")
-        else: print("UI_BACKGROUND path not found or empty.")
-    except Exception as e: print(f"Failed to load UI_BACKGROUND: {e}")
+            log.debug("Loaded UI_BACKGROUND asset.")
+        else: log.warning("UI_BACKGROUND path not found or empty.")
+    except Exception as e: log.warning("Failed to load UI_BACKGROUND: %s", e)
 
     if background_surface is None:
-        print("Using fallback gradient background.")
+        log.warning("Using fallback gradient background.")
         background_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         for y in range(SCREEN_HEIGHT):
             t = y / SCREEN_HEIGHT
@@ -136,7 +143,7 @@ def play_color_match(screen, clock):
         nonlocal current_color, current_name, is_match
         # Ensure color and name lists have same length
         if len(COLOR_LIST) != len(COLOR_NAMES):
-             print("Error: COLOR_LIST and COLOR_NAMES must have the same number of items!")
+             log.error("Error: COLOR_LIST and COLOR_NAMES must have the same number of items!")
              # Handle error appropriately - maybe return False from main function
              return False # Indicate setup failure
 
@@ -150,6 +157,7 @@ def play_color_match(screen, clock):
         return True # Indicate setup success
 
     # --- Game Loop ---
+    minigame_loaded()
     running = True
     while running:
         # --- Event Handling ---
@@ -162,7 +170,7 @@ def play_color_match(screen, clock):
 
                 if game_state == "WAITING_START":
                     if event.key == START_KEY:
-                        print("Starting Color Match...")
+                        log.info("Starting Color Match...")
                         score = 0 # Reset score
                         if not _setup_new_pair(): # Setup first pair
                              # Handle setup error (e.g., mismatched lists)
@@ -181,7 +189,7 @@ def play_color_match(screen, clock):
                         if player_said_match == is_match:
                             # Correct Answer
                             score += 1
-                            print(f"Correct! Score: {score}")
+                            log.info("Correct! Score: %s", score)
                             # Check for win condition
                             if score >= TARGET_SCORE:
                                 success = True
@@ -194,7 +202,7 @@ def play_color_match(screen, clock):
                                 if not _setup_new_pair(): return False # Handle setup error
                         else:
                             # Incorrect Answer
-                            print("Incorrect match!")
+                            log.info("Incorrect match!")
                             success = False
                             result_message = "Incorrect Match!"
                             final_outcome = False # Failure due to wrong answer
@@ -203,12 +211,12 @@ def play_color_match(screen, clock):
                 elif game_state == "SHOWING_RESULT":
                      if not success: # Options only available on failure
                         if event.key == RETRY_KEY:
-                            print("Retrying Color Match...")
+                            log.info("Retrying Color Match...")
                             # Resetting requires going back to start
                             game_state = "WAITING_START"
                             # State variables (score, time, pair) reset automatically on transition
                         elif event.key == CONTINUE_KEY:
-                            print("Continuing after failure.")
+                            log.info("Continuing after failure.")
                             # final_outcome already set to False
                             game_state = "EXITING"
 
@@ -216,7 +224,7 @@ def play_color_match(screen, clock):
         if game_state == "PLAYING":
             elapsed_time = (pygame.time.get_ticks() - start_time) / 1000.0
             if elapsed_time >= TIME_LIMIT_SECONDS:
-                print("Time's up!")
+                log.info("Time's up!")
                 if score >= TARGET_SCORE:
                      success = True
                      result_message = f"Time's Up! Final Score: {score} - Success!"
@@ -275,19 +283,20 @@ def play_color_match(screen, clock):
 
 
     # --- End of Game Loop ---
-    print(f"Exiting Color Match. Final Outcome: {final_outcome}")
+    log.debug("Exiting Color Match. Final Outcome: %s", final_outcome)
     return final_outcome
 
 
 # --- Example usage ---
 if __name__ == '__main__':
-    print("Running Color Match standalone test...")
+    configure("INFO")
+    log.info("Running Color Match standalone test...")
     pygame.init()
     pygame.font.init()
 
     try: from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, BLACK, DEFAULT_FONT, UI_BACKGROUND
     except ImportError:
-        print("Warning: Using default values for testing.")
+        log.warning("Using default values for testing.")
         SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600; FPS = 60
         WHITE, BLACK = (240, 240, 242), (8, 8, 6); DEFAULT_FONT = "Arial"; UI_BACKGROUND = ""
 
@@ -299,7 +308,7 @@ if __name__ == '__main__':
     # def draw_text_with_shadow(...): ...
 
     game_result = play_color_match(screen, clock)
-    print(f"Minigame result: {game_result}")
+    log.info("Minigame result: %s", game_result)
 
     pygame.quit()
-    print("Standalone test finished.")
\ No newline at end of file
+    log.info("Standalone test finished.")
\ No newline at end of file
@@ -7,6 +7,11 @@ from src.config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, DEFAULT_FONT, # Removed BLACK
     UI_BACKGROUND, ROOT_DIR
 )
+from src.modules.context_profile import profiled
+from src.modules.telemetry import minigame, minigame_loaded
+from src.modules.logs import get_logger, configure
+
+log = get_logger(__name__)
 
 # --- Constants ---
 # Colors
@@ -81,28 +86,30 @@ def load_words(filename):
     """Loads words from a file, one word per line."""
     default_words = ["abandon", "ability", "able", "about", "above", "absent", "absorb", "abstract", "absurd", "abuse", "access", "accident"] # Fallback List
     if not os.path.exists(filename):
-        print(f"Warning: Word file '{filename}' not found. Using default words.")
+        log.warning("Word file '%s' not found. Using default words.", filename)
         return default_words
     try:
         with open(filename, 'r') as f:
             words = [line.strip().lower() for line in f if line.strip()]
         if not words:
-            print(f"Warning: Word file '{filename}' is empty. Using default words.")
+            log.warning("Word file '%s' is empty. Using default words.", filename)
             return default_words
-        print(f"Loaded {len(words)} words from {filename}")
+        log.info("Loaded %s words from %s", len(words), filename)
         return words
     except Exception as e:
-        print(f"Error loading word file '{filename}': {e}. Using default words.")
+        log.error("Error loading word file '%s': %s. Using default words.", filename, e)
         return default_words
 
 # --- Main Minigame Function --- <<< DEFINED *AFTER* HELPERS
 
+@profiled("minigame.complete_the_seed")
+@minigame("complete_the_seed")
 def play_complete_the_seed(screen, clock):
     """
     Runs the Complete the Seed minigame.
     Returns: True (success), False (failure), None (cancelled).
     """
-    print("Entering Complete the Seed minigame...")
+    log.debug("Entering Complete the Seed minigame...")
 
     # --- Initialization ---
     try:
@@ -111,7 +118,7 @@ def play_complete_the_seed(screen, clock):
         instr_font = pygame.font.SysFont(DEFAULT_FONT_NAME, INSTR_FONT_SIZE)
         prompt_font = pygame.font.SysFont(DEFAULT_FONT_NAME, PROMPT_FONT_SIZE)
     except Exception as e:
-        print(f"Failed to load system font '{DEFAULT_FONT_NAME}': {e}. Using default.")
+        log.warning("Failed to load system font '%s': %s. Using default.", DEFAULT_FONT_NAME, e)
         word_font = pygame.font.Font(None, WORD_FONT_SIZE)
         index_font = pygame.font.Font(None, INDEX_FONT_SIZE)
         instr_font = pygame.font.Font(None, INSTR_FONT_SIZE)
@@ -125,13 +132,13 @@ def play_complete_the_seed(screen, clock):
         if 'UI_BACKGROUND' in globals() and UI_BACKGROUND and os.path.exists(UI_BACKGROUND):
             background_surface = pygame.image.load(UI_BACKGROUND).convert()
             background_surface = pygame.transform.scale(background_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            print("Loaded UI_BACKGROUND asset.")
-        else: print("UI_BACKGROUND path not found, empty, or doesn't exist.")
-    except pygame.error as e: print(f"Failed to load UI_BACKGROUND (Pygame Error): {e}")
-    except Exception as e: print(f"Failed to load UI_BACKGROUND (Other Error): {e}")
+            log.debug("Loaded UI_BACKGROUND asset.")
+        else: log.warning("UI_BACKGROUND path not found, empty, or doesn't exist.")
+    except pygame.error as e: log.warning("Failed to load UI_BACKGROUND (Pygame Error): %s", e)
+    except Exception as e: log.warning("Failed to load UI_BACKGROUND (Other Error): %s", e)
 
     if background_surface is None: # Fallback background
-        print("Using fallback gradient background."); background_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        log.warning("Using fallback gradient background."); background_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         for y in range(SCREEN_HEIGHT):
             t = y / SCREEN_HEIGHT; r = GRADIENT_START[0] + t * (GRADIENT_END[0] - GRADIENT_START[0])
             g = GRADIENT_START[1] + t * (GRADIENT_END[1] - GRADIENT_START[1]); b = GRADIENT_START[2] + t * (GRADIENT_END[2] - GRADIENT_START[2])
@@ -140,7 +147,7 @@ def play_complete_the_seed(screen, clock):
     # --- Load Word List ---
     word_list = load_words(WORD_LIST_PATH)
     if not word_list or len(word_list) < SEQUENCE_LENGTH:
-        print(f"Error: Not enough words in word list ({len(word_list)}) for sequence length {SEQUENCE_LENGTH}. Exiting.")
+        log.error("Error: Not enough words in word list (%s) for sequence length %s. Exiting.", len(word_list), SEQUENCE_LENGTH)
         # TODO: Display an error message on screen?
         return False # Treat as failure
 
@@ -173,9 +180,10 @@ def play_complete_the_seed(screen, clock):
         current_input_index = hidden_indices[0] if hidden_indices else -1
         current_input_string = ""
         state_timer = 0.0
-        print(f"New sequence generated ({actual_sequence_length} words). Hidden indices: {hidden_indices}")
+        log.debug("New sequence generated (%s words). Hidden indices: %s", actual_sequence_length, hidden_indices)
 
     # --- Game Loop ---
+    minigame_loaded()
     running = True
     while running:
         dt = clock.tick(FPS) / 1000.0
@@ -188,8 +196,8 @@ def play_complete_the_seed(screen, clock):
 
                 if game_state == "WAITING_START":
                     if event.key == START_KEY:
-                        print("Starting Complete the Seed..."); _reset_game()
-                        if not full_sequence: print("Error during game reset."); return False
+                        log.info("Starting Complete the Seed..."); _reset_game()
+                        if not full_sequence: log.error("Error during game reset."); return False
                         game_state = "SHOWING_PHRASE"; state_timer = 0.0
                 elif game_state == "WAITING_INPUT":
                     if current_input_index != -1:
@@ -203,13 +211,13 @@ def play_complete_the_seed(screen, clock):
                                     current_input_string = player_inputs.get(current_input_index, "") # Use get for safety
                                 else: game_state = "CHECKING_ANSWER"
                             except ValueError: # Should not happen if logic is correct
-                                print(f"Error: current_input_index {current_input_index} not in hidden_indices {hidden_indices}")
+                                log.error("Error: current_input_index %s not in hidden_indices %s", current_input_index, hidden_indices)
                                 game_state = "CHECKING_ANSWER" # Proceed to check anyway
                         elif event.unicode.isalpha(): current_input_string += event.unicode
                 elif game_state == "SHOWING_RESULT":
                      if not success:
-                        if event.key == RETRY_KEY: print("Retrying..."); game_state = "WAITING_START"
-                        elif event.key == CONFIRM_KEY: print("Continuing after failure."); final_outcome = False; game_state = "EXITING"
+                        if event.key == RETRY_KEY: log.info("Retrying..."); game_state = "WAITING_START"
+                        elif event.key == CONFIRM_KEY: log.info("Continuing after failure."); final_outcome = False; game_state = "EXITING"
 
         # --- State Machine Logic ---
         state_timer += dt
@@ -225,7 +233,7 @@ def play_complete_the_seed(screen, clock):
                      if player_inputs.get(idx, "").lower().strip() == full_sequence[idx]: correct_count += 1
                  success = (correct_count == len(hidden_indices))
              final_outcome = success; result_message = "Seed Phrase Correct!" if success else "Incorrect Seed Phrase!"
-             print(f"Checking complete. Correct: {correct_count}/{len(hidden_indices)}. Success: {success}")
+             log.debug("Checking complete. Correct: %s/%s. Success: %s", correct_count, len(hidden_indices), success)
              game_state = "SHOWING_RESULT"; state_timer = 0.0
         elif game_state == "SHOWING_RESULT" and success:
              if state_timer >= RESULT_SUCCESS_DISPLAY_SECONDS: game_state = "EXITING"
@@ -279,17 +287,18 @@ def play_complete_the_seed(screen, clock):
         pygame.display.flip()
         if game_state == "EXITING": running = False
 
-    print(f"Exiting Complete the Seed. Final Outcome: {final_outcome}")
+    log.debug("Exiting Complete the Seed. Final Outcome: %s", final_outcome)
     return final_outcome
 
 # --- Example usage ---
 # (Standalone test code remains the same)
 if __name__ == '__main__':
-    print("Running Complete the Seed standalone test...")
+    configure("INFO")
+    log.info("Running Complete the Seed standalone test...")
     pygame.init(); pygame.font.init()
     try: from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, BLACK, DEFAULT_FONT, UI_BACKGROUND, ROOT_DIR
     except ImportError:
-        print("Warning: Using default values for testing."); SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600; FPS = 60
+        log.warning("Using default values for testing."); SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600; FPS = 60
         WHITE, BLACK = (240, 240, 242), (8, 8, 6); DEFAULT_FONT = "Arial"; UI_BACKGROUND = ""
         if 'ROOT_DIR' not in locals(): ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
     if 'ROOT_DIR' in locals() and not os.path.exists(os.path.join(ROOT_DIR, "data")): WORD_LIST_PATH = os.path.join("data", WORD_LIST_FILENAME)
@@ -297,12 +306,12 @@ if __name__ == '__main__':
     data_dir = os.path.dirname(WORD_LIST_PATH)
     if not os.path.exists(data_dir):
         try: os.makedirs(data_dir)
-        except OSError as e: print(f"Could not create data directory: {e}")
+        except OSError as e: log.warning("Could not create data directory: %s", e)
     if not os.path.exists(WORD_LIST_PATH):
-        print(f"Creating dummy word file: {WORD_LIST_PATH}")
+        log.debug("Creating dummy word file: %s", WORD_LIST_PATH)
         try:
             default_words_text = "\n".join(["apple", "banana", "cherry", "date", "elderberry", "fig", "grape", "honeydew", "kiwi", "lemon", "mango", "nectarine"])
             with open(WORD_LIST_PATH, "w") as f: f.write(default_words_text + "\n")
-        except IOError as e: print(f"Could not write dummy word file: {e}")
+        except IOError as e: log.warning("Could not write dummy word file: %s", e)
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)); pygame.display.set_caption("Complete the Seed Test"); clock = pygame.time.Clock()
-    game_result = play_complete_the_seed(screen, clock); print(f"Minigame result: {game_result}"); pygame.quit(); print("Standalone test finished.")
\ No newline at end of file
+    game_result = play_complete_the_seed(screen, clock); log.info("Minigame result: %s", game_result); pygame.quit(); log.info("Standalone test finished.")
\ No newline at end of file
@@ -4,6 +4,11 @@ import random
 import time # For sleep
 import os # If needed for helpers
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, BLACK, DEFAULT_FONT
+from src.modules.context_profile import profiled
+from src.modules.telemetry import minigame, minigame_loaded
+from src.modules.logs import get_logger, configure
+
+log = get_logger(__name__)
 
 # --- Constants ---
 # Colors
@@ -74,12 +79,14 @@ def draw_text_with_shadow(screen, text, font, position, color, shadow_color, sha
 
 
 # --- Main Minigame Function ---
+@profiled("minigame.memory_sequence")
+@minigame("memory_sequence")
 def play_memory_sequence(screen, clock, sequence_length=SEQUENCE_LENGTH):
     """
     Runs a single round of the Memory Sequence minigame with manual start and submit confirmation.
     Returns: True (success), False (failure), None (cancelled).
     """
-    print(f"Entering Memory Sequence minigame (Length: {sequence_length})...")
+    log.debug("Entering Memory Sequence minigame (Length: %s)...", sequence_length)
 
     # --- Initialization ---
     try:
@@ -87,7 +94,7 @@ def play_memory_sequence(screen, clock, sequence_length=SEQUENCE_LENGTH):
         instr_font = pygame.font.SysFont(DEFAULT_FONT_NAME, INSTRUCTION_FONT_SIZE)
         prompt_font = pygame.font.SysFont(DEFAULT_FONT_NAME, PROMPT_FONT_SIZE)
     except Exception as e:
-        print(f"Failed to load system font '{DEFAULT_FONT_NAME}': {e}. Using default.")
+        log.warning("Failed to load system font '%s': %s. Using default.", DEFAULT_FONT_NAME, e)
         main_font = pygame.font.Font(None, FONT_SIZE)
         instr_font = pygame.font.Font(None, INSTRUCTION_FONT_SIZE)
         prompt_font = pygame.font.Font(None, PROMPT_FONT_SIZE)
@@ -115,6 +122,7 @@ def play_memory_sequence(screen, clock, sequence_length=SEQUENCE_LENGTH):
         pygame.draw.line(background, (int(r), int(g), int(b)), (0, y), (SCREEN_WIDTH, y))
 
     # --- Game Loop ---
+    minigame_loaded()
     running = True
     while running:
         dt = clock.tick(FPS) / 1000.0 # Delta time in seconds
@@ -122,18 +130,18 @@ def play_memory_sequence(screen, clock, sequence_length=SEQUENCE_LENGTH):
         # --- Event Handling ---
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event received.")
+                log.info("Quit event received.")
                 return None # Cancel
 
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    print("Escape key pressed.")
+                    log.info("Escape key pressed.")
                     return None # Cancel
 
                 # --- Start Game ---
                 if game_state == "WAITING_START":
                     if event.key == START_KEY:
-                        print("Starting sequence display...")
+                        log.info("Starting sequence display...")
                         game_state = "SHOWING_SEQUENCE"
                         state_timer = 0
                         current_display_index = 0
@@ -232,13 +240,13 @@ def play_memory_sequence(screen, clock, sequence_length=SEQUENCE_LENGTH):
 
     # --- End of Game Loop ---
     if submitted:
-        print(f"Exiting Memory Sequence. Success: {success}")
+        log.debug("Exiting Memory Sequence. Success: %s", success)
         return success
     else:
         # This case means the player quit (Esc/Quit) before submitting.
         # The direct return None in event handling covers this.
         # If somehow the loop exits otherwise without submission, treat as failure/cancel.
-        print("Exiting Memory Sequence without submission (likely cancelled).")
+        log.debug("Exiting Memory Sequence without submission (likely cancelled).")
         # We return None for explicit cancels, so returning False here might be better
         # if the loop termination was truly abnormal. But None seems safer if unsure.
         return None # Align with Esc/Quit behaviour
@@ -246,7 +254,8 @@ def play_memory_sequence(screen, clock, sequence_length=SEQUENCE_LENGTH):
 
 # --- Example usage (for testing standalone) ---
 if __name__ == '__main__':
-    print("Running Memory Sequence standalone test...")
+    configure("INFO")
+    log.info("Running Memory Sequence standalone test...")
     pygame.init()
     # Make sure fonts are available or handle errors
     pygame.font.init()
@@ -258,7 +267,7 @@ if __name__ == '__main__':
     # def draw_text_with_shadow(...): ...
 
     game_result = play_memory_sequence(screen, clock, sequence_length=4)
-    print(f"Minigame result: {game_result}")
+    log.info("Minigame result: %s", game_result)
 
     pygame.quit()
-    print("Standalone test finished.")
\ No newline at end of file
+    log.info("Standalone test finished.")
\ No newline at end of file
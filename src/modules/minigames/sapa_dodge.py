@@ -7,6 +7,11 @@ from src.config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, BLACK, DEFAULT_FONT,
     UI_BACKGROUND, SAPA_SPRITE, MALE_SPRITE, FEMALE_SPRITE
 )
+from src.modules.context_profile import profiled
+from src.modules.telemetry import minigame, minigame_loaded
+from src.modules.logs import get_logger, configure
+
+log = get_logger(__name__)
 
 # --- Constants ---
 # Colors (Used mainly for fallbacks and text)
@@ -79,13 +84,15 @@ def draw_text_with_shadow(screen, text, font, position, color, shadow_color, sha
 # --- Main Minigame Function ---
 
 # Updated function signature to accept player_gender
+@profiled("minigame.sapa_dodge")
+@minigame("sapa_dodge")
 def play_sapa_dodge(screen, clock, player_gender):
     """
     Runs the Sapa Dodge minigame (survival objective) with sprites and retry.
     player_gender should be a string ('male', 'female', etc.) to select the correct sprite.
     Returns: True (survived), False (hit sapa), None (cancelled).
     """
-    print(f"Entering Sapa Dodge minigame for player gender: {player_gender}...")
+    log.debug("Entering Sapa Dodge minigame for player gender: %s...", player_gender)
 
     # --- Initialization ---
     try:
@@ -93,7 +100,7 @@ def play_sapa_dodge(screen, clock, player_gender):
         instr_font = pygame.font.SysFont(DEFAULT_FONT_NAME, INSTR_FONT_SIZE)
         prompt_font = pygame.font.SysFont(DEFAULT_FONT_NAME, PROMPT_FONT_SIZE)
     except Exception as e:
-        print(f"Failed to load system font '{DEFAULT_FONT_NAME}': {e}. Using default.")
+        log.warning("Failed to load system font '%s': %s. Using default.", DEFAULT_FONT_NAME, e)
         timer_font = pygame.font.Font(None, SCORE_FONT_SIZE)
         instr_font = pygame.font.Font(None, INSTR_FONT_SIZE)
         prompt_font = pygame.font.Font(None, PROMPT_FONT_SIZE)
@@ -105,12 +112,12 @@ def play_sapa_dodge(screen, clock, player_gender):
         if UI_BACKGROUND and os.path.exists(UI_BACKGROUND):
             background_surface = pygame.image.load(UI_BACKGROUND).convert()
             background_surface = pygame.transform.scale(background_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            print("Loaded UI_BACKGROUND asset.")
-        else: print("UI_BACKGROUND path not found or empty.")
-    except Exception as e: print(f"Failed to load UI_BACKGROUND: {e}")
+            log.debug("Loaded UI_BACKGROUND asset.")
+        else: log.warning("UI_BACKGROUND path not found or empty.")
+    except Exception as e: log.warning("Failed to load UI_BACKGROUND: %s", e)
 
     if background_surface is None:
-        print("Using fallback gradient background.")
+        log.warning("Using fallback gradient background.")
         background_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         for y in range(SCREEN_HEIGHT):
             t = y / SCREEN_HEIGHT
@@ -129,12 +136,12 @@ def play_sapa_dodge(screen, clock, player_gender):
             # Optional: Scale player sprite if needed
             # player_sprite = pygame.transform.scale(player_sprite, (desired_w, desired_h))
             player_width, player_height = player_sprite.get_size()
-            print(f"Loaded player sprite: {player_sprite_path}")
-        else: print(f"Player sprite path not found or empty: {player_sprite_path}")
-    except Exception as e: print(f"Failed to load player sprite: {e}")
+            log.debug("Loaded player sprite: %s", player_sprite_path)
+        else: log.warning("Player sprite path not found or empty: %s", player_sprite_path)
+    except Exception as e: log.warning("Failed to load player sprite: %s", e)
 
     if player_sprite is None:
-        print("Using fallback rect for player.")
+        log.warning("Using fallback rect for player.")
 
     # Sapa Sprite
     sapa_sprite = None
@@ -145,12 +152,12 @@ def play_sapa_dodge(screen, clock, player_gender):
             # Optional: Scale sapa sprite if needed
             # sapa_sprite = pygame.transform.scale(sapa_sprite, (desired_w, desired_h))
             sapa_width, sapa_height = sapa_sprite.get_size()
-            print(f"Loaded sapa sprite: {SAPA_SPRITE}")
-        else: print(f"Sapa sprite path not found or empty: {SAPA_SPRITE}")
-    except Exception as e: print(f"Failed to load sapa sprite: {e}")
+            log.debug("Loaded sapa sprite: %s", SAPA_SPRITE)
+        else: log.warning("Sapa sprite path not found or empty: %s", SAPA_SPRITE)
+    except Exception as e: log.warning("Failed to load sapa sprite: %s", e)
 
     if sapa_sprite is None:
-        print("Using fallback rect for sapa.")
+        log.warning("Using fallback rect for sapa.")
 
     # --- Game State Variables ---
     player_start_y = SCREEN_HEIGHT - player_height - 10
@@ -179,6 +186,7 @@ def play_sapa_dodge(screen, clock, player_gender):
         elapsed_time = 0
 
     # --- Game Loop ---
+    minigame_loaded()
     running = True
     while running:
         # --- Event Handling ---
@@ -189,17 +197,17 @@ def play_sapa_dodge(screen, clock, player_gender):
 
                 if game_state == "WAITING_START":
                     if event.key == START_KEY:
-                        print("Starting Sapa Dodge...")
+                        log.info("Starting Sapa Dodge...")
                         _reset_game()
                         game_state = "PLAYING"
 
                 elif game_state == "SHOWING_RESULT":
                      if not success:
                         if event.key == RETRY_KEY:
-                            print("Retrying Sapa Dodge...")
+                            log.info("Retrying Sapa Dodge...")
                             game_state = "WAITING_START"
                         elif event.key == CONTINUE_KEY:
-                            print("Continuing after failure.")
+                            log.info("Continuing after failure.")
                             final_outcome = False
                             game_state = "EXITING"
 
@@ -213,7 +221,7 @@ def play_sapa_dodge(screen, clock, player_gender):
             for sapa_rect in sapa_list[:]:
                 sapa_rect.y += SAPA_SPEED
                 if sapa_rect.colliderect(player):
-                    print("Collision detected!")
+                    log.info("Collision detected!")
                     success = False
                     result_message = "Hit by Sapa!"
                     final_outcome = False
@@ -229,7 +237,7 @@ def play_sapa_dodge(screen, clock, player_gender):
             if not collision_detected:
                 elapsed_time = (pygame.time.get_ticks() - start_time) / 1000.0
                 if elapsed_time >= SURVIVAL_TIME_SECONDS:
-                    print("Survival time reached!")
+                    log.info("Survival time reached!")
                     success = True
                     result_message = f"Survived {SURVIVAL_TIME_SECONDS} Seconds!"
                     final_outcome = True
@@ -293,20 +301,21 @@ def play_sapa_dodge(screen, clock, player_gender):
     # Instead, let elapsed_time increase indefinitely. Failure occurs only on collision.
     # Track high_score (max elapsed_time survived). Increase SAPA_SPEED and/or INITIAL_SAPA_COUNT
     # based on elapsed_time or score (if score is reintroduced for arcade). Add varied movement?
-    print(f"Exiting Sapa Dodge. Final Outcome: {final_outcome}")
+    log.debug("Exiting Sapa Dodge. Final Outcome: %s", final_outcome)
     return final_outcome
 
 
 # --- Example usage ---
 if __name__ == '__main__':
-    print("Running Sapa Dodge standalone test...")
+    configure("INFO")
+    log.info("Running Sapa Dodge standalone test...")
     pygame.init()
     pygame.font.init()
 
     # Mock necessary config vars if not available
     try: from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, BLACK, DEFAULT_FONT, UI_BACKGROUND, SAPA_SPRITE, MALE_SPRITE, FEMALE_SPRITE
     except ImportError:
-        print("Warning: Using default values for testing.")
+        log.warning("Using default values for testing.")
         SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600; FPS = 60
         WHITE, BLACK = (240, 240, 242), (8, 8, 6); DEFAULT_FONT = "Arial"; UI_BACKGROUND = ""
         # Provide dummy paths or empty strings for sprites to test fallbacks
@@ -323,9 +332,9 @@ if __name__ == '__main__':
 
     # Test with 'female' gender - requires calling code to pass this
     test_gender = random.choice(['male', 'female'])
-    print(f"Testing with gender: {test_gender}")
+    log.info("Testing with gender: %s", test_gender)
     game_result = play_sapa_dodge(screen, clock, player_gender=test_gender)
-    print(f"Minigame result: {game_result}")
+    log.info("Minigame result: %s", game_result)
 
     pygame.quit()
-    print("Standalone test finished.")
\ No newline at end of file
+    log.info("Standalone test finished.")
\ No newline at end of file
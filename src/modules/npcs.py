@@ -1,15 +1,20 @@
 # src/modules/npcs.py
 import pygame
-import random
 import sys
 import os
-from src.config import TILE_SIZE, MAZE_WIDTH, MAZE_HEIGHT, FPS, VITALIK_SPRITE, NPC_MALE_SPRITE, NPC_FEMALE_SPRITE ,VENDOR_SPRITE, CRYPTO_SCHOLAR_SPRITE
+from src.config import TILE_SIZE, FPS, SIMULATION_HZ, VITALIK_SPRITE, NPC_MALE_SPRITE, NPC_FEMALE_SPRITE ,VENDOR_SPRITE, CRYPTO_SCHOLAR_SPRITE
+from src.modules.assets import load_image, shared_surface
+from src.modules.context_profile import profiled
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
 
 class NPC:
     def __init__(self, scene, is_vitalik=False, is_vendor=False, is_crypto_scholar=False):
-        print("Entering NPC.__init__...")
+        log.debug("Entering NPC.__init__...")
         try:
             self.scene = scene
+            self.rng = scene.stream("npcs")
             self.is_vitalik = is_vitalik
             self.is_vendor = is_vendor
             self.is_crypto_scholar = is_crypto_scholar
@@ -22,7 +27,7 @@ class NPC:
             # Assign gender for regular NPCs (not Vitalik, vendors, or crypto scholars)
             self.gender = None
             if not self.is_vitalik and not self.is_vendor and not self.is_crypto_scholar:
-                self.gender = random.choice(["male", "female"])
+                self.gender = self.rng.choice(["male", "female"])
 
             # Determine sprite path based on NPC type and gender
             if self.is_vitalik:
@@ -43,87 +48,62 @@ class NPC:
 
             # Load sprite with fallback
             try:
-                print(f"Attempting to load NPC sprite from: {sprite_path}")
+                log.debug("Attempting to load NPC sprite from: %s", sprite_path)
                 if not os.path.exists(sprite_path):
                     raise FileNotFoundError(f"File not found: {sprite_path}")
-                self.image = pygame.image.load(sprite_path).convert_alpha()
-                self.image = pygame.transform.scale(self.image, (self.width, self.height))
+                self.image = load_image(sprite_path, (self.width, self.height), category="npcs")
             except (pygame.error, FileNotFoundError, Exception) as e:
-                print(f"Failed to load NPC sprite {sprite_path}: {e}. Using placeholder.")
-                self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-                self.image.fill(fallback_color)
-                # Add a border to ensure visibility
-                pygame.draw.rect(self.image, (255, 255, 255), (0, 0, self.width, self.height), 2)
+                log.warning("Failed to load NPC sprite %s: %s. Using placeholder.", sprite_path, e)
+                self.image = shared_surface(("npc_placeholder", self.width, self.height, fallback_color),
+                                            lambda: self.placeholder(fallback_color), category="npcs")
 
             self.rect = self.place_in_maze()
             self.vitalik_comment_timer = 0  # Timer for Vitalik's random comments
-            self.vitalik_comment_interval = FPS * 30  # Comment every 30 seconds
+            self.vitalik_comment_interval = SIMULATION_HZ * 30  # Comment every 30 seconds
             self.lore = self.generate_lore()
             self.upgrades = self.generate_upgrades() if self.is_vendor else {}
-            print("NPC initialized successfully.")
+            log.debug("NPC initialized successfully.")
         except Exception as e:
-            print(f"Error in NPC.__init__: {e}")
+            log.error("Error in NPC.__init__: %s", e)
             raise
 
+    def placeholder(self, fallback_color):
+        image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        image.fill(fallback_color)
+        # Add a border to ensure visibility
+        pygame.draw.rect(image, (255, 255, 255), (0, 0, self.width, self.height), 2)
+        return image
+
     def place_in_maze(self):
-        print("Placing NPC in maze...")
-        max_attempts = 100
-        attempt = 0
+        log.debug("Placing NPC in maze...")
         try:
-            while attempt < max_attempts:
-                # Find a position near a wall to avoid Sapa paths
-                x = random.randint(1, MAZE_WIDTH - 2) * TILE_SIZE
-                y = random.randint(1, MAZE_HEIGHT - 2) * TILE_SIZE
-                rect = pygame.Rect(x, y, self.width, self.height)
-                entry_x, entry_y = self.scene.maze.entry
-                exit_x, exit_y = self.scene.maze.exit
-                entry_distance = ((x - entry_x * TILE_SIZE) ** 2 + (y - entry_y * TILE_SIZE) ** 2) ** 0.5
-                exit_distance = ((x - exit_x * TILE_SIZE) ** 2 + (y - exit_y * TILE_SIZE) ** 2) ** 0.5
-                # Check if the position is near a wall (at least one adjacent tile is a wall)
-                grid_x = x // TILE_SIZE
-                grid_y = y // TILE_SIZE
-                near_wall = False
-                for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                    nx, ny = grid_x + dx, grid_y + dy
-                    if 0 <= nx < MAZE_WIDTH and 0 <= ny < MAZE_HEIGHT and self.scene.maze.grid[ny][nx] == 1:
-                        near_wall = True
-                        break
-                if (not self.scene.maze.collides(rect) and
-                    entry_distance > 100 and
-                    exit_distance > 100 and
-                    near_wall):
-                    player_x, player_y = self.scene.player.rect.x, self.scene.player.rect.y
-                    player_distance = ((x - player_x) ** 2 + (y - player_y) ** 2) ** 0.5
-                    if player_distance > 200:  # Ensure NPC spawns at least 200 pixels away from player
-                        print("NPC placed successfully.")
-                        return rect
-                attempt += 1
-            print("Warning: Failed to place NPC after maximum attempts. Placing at default position (1, 1).")
-            return pygame.Rect(TILE_SIZE, TILE_SIZE, self.width, self.height)
+            # Near a wall to avoid Sapa paths, away from entry/exit, at least 200 pixels from the player
+            rect = self.scene.spawns.reserve("npc", self.width, self.height, self.rng)
+            log.debug("NPC placed successfully.")
+            return rect
         except Exception as e:
-            print(f"Error in NPC.place_in_maze: {e}")
+            log.error("Error in NPC.place_in_maze: %s", e)
             raise
 
     def follow_player(self, player, dialogue_box):
-        print("Entering NPC.follow_player...")
+        log.debug("Entering NPC.follow_player...")
         try:
             if not self.following or not self.is_freed or not self.is_vitalik:
                 return
 
             # Move towards the player at a slower speed
             speed = 2
-            new_rect = self.rect.copy()
+            dx, dy = 0, 0
             if player.rect.x > self.rect.x + TILE_SIZE:
-                new_rect.x += speed
+                dx = speed
             elif player.rect.x < self.rect.x - TILE_SIZE:
-                new_rect.x -= speed
+                dx = -speed
             if player.rect.y > self.rect.y + TILE_SIZE:
-                new_rect.y += speed
+                dy = speed
             elif player.rect.y < self.rect.y - TILE_SIZE:
-                new_rect.y -= speed
+                dy = -speed
 
-            if not self.scene.maze.collides(new_rect):
-                self.rect = new_rect
+            self.rect.x, self.rect.y, _, _ = self.scene.maze.move_and_slide(self.rect, dx, dy)
 
             # Vitalik occasionally shares lore-based facts
             if self.is_vitalik and self.following:
@@ -138,14 +118,14 @@ class NPC:
                         f"Krypto’s slums were once a thriving market, before the Sapa curse turned it into a wasteland.",
                         f"The Sword of Solvency was forged by the ElPee to channel the Superseed’s power against Seisan."
                     ]
-                    dialogue_box.show([random.choice(vitalik_facts), "Press SPACE to continue, or ESC to close."])
+                    dialogue_box.show([self.rng.choice(vitalik_facts), "Press SPACE to continue, or ESC to close."])
                     self.vitalik_comment_timer = 0
         except Exception as e:
-            print(f"Error in NPC.follow_player: {e}")
+            log.error("Error in NPC.follow_player: %s", e)
             raise
 
     def generate_lore(self):
-        print("Generating lore for NPC...")
+        log.debug("Generating lore for NPC...")
         try:
             if self.is_vendor:
                 return [
@@ -162,7 +142,7 @@ class NPC:
                     "The Superseed Stablecoin maintains a peg through overcollateralization.",
                     "Dynamic Repayment Vaults stabilize the repayment rate for Supercollateral users."
                 ]
-                return [random.choice(crypto_facts)]
+                return [self.rng.choice(crypto_facts)]
             else:
                 npc_facts = [
                     "My cousin in the MEV gang turned into a Sapa overnight—it was horrifying! I hated him but still sad",
@@ -173,9 +153,9 @@ class NPC:
                     "I heard the ElPee trained their minds and bodies to fight Seisan, but it was all for nothing.",
                     "They say Krypto was once a paradise, but now it’s just darkness and despair"
                 ]
-                return [random.choice(npc_facts)]
+                return [self.rng.choice(npc_facts)]
         except Exception as e:
-            print(f"Error in generate_lore: {e}")
+            log.error("Error in generate_lore: %s", e)
             raise
 
     def generate_upgrades(self):
@@ -186,17 +166,18 @@ class NPC:
         }
 
     def draw(self, screen):
-        print("Entering NPC.draw...")
+        log.debug("Entering NPC.draw...")
         try:
             # Draw Vitalik even if not freed; other NPCs are always drawn
             screen.blit(self.image, self.rect)
-            print("NPC drawn successfully.")
+            log.debug("NPC drawn successfully.")
         except Exception as e:
-            print(f"Error in NPC.draw: {e}")
+            log.error("Error in NPC.draw: %s", e)
             raise
 
+@profiled("vitalik_cutscene")
 def vitalik_cutscene(screen, clock, player, dialogue_box, ui_background):
-    print("Entering vitalik_cutscene...")
+    log.debug("Entering vitalik_cutscene...")
     pronoun = "he" if player.gender == "male" else "she"
     lines = [
         f"Vitalik: I am Sage Vitalik, trapped by the Sapa curse.",
@@ -210,13 +191,13 @@ def vitalik_cutscene(screen, clock, player, dialogue_box, ui_background):
     while running and dialogue_box.active:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in vitalik_cutscene.")
+                log.info("Quit event in vitalik_cutscene.")
                 return False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     dialogue_box.next_line()
                 elif event.key == pygame.K_ESCAPE:
-                    print("Vitalik cutscene skipped by user.")
+                    log.info("Vitalik cutscene skipped by user.")
                     return False
 
         screen.blit(ui_background, (0, 0))
@@ -224,11 +205,12 @@ def vitalik_cutscene(screen, clock, player, dialogue_box, ui_background):
         pygame.display.flip()
         clock.tick(FPS)
 
-    print("Exiting vitalik_cutscene...")
+    log.debug("Exiting vitalik_cutscene...")
     return True
 
+@profiled("vitalik_choice")
 def vitalik_choice(screen, clock, player, dialogue_box, ui_background):
-    print("Entering vitalik_choice...")
+    log.debug("Entering vitalik_choice...")
     lines = [
         f"Vitalik: You’ve braved many dangers to claim the Sword of Solvency, {player.name}.",
         "Now, a choice lies before you.",
@@ -241,7 +223,7 @@ def vitalik_choice(screen, clock, player, dialogue_box, ui_background):
     while choice is None:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in vitalik_choice.")
+                log.info("Quit event in vitalik_choice.")
                 sys.exit()
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE and dialogue_box.active:
@@ -256,5 +238,5 @@ def vitalik_choice(screen, clock, player, dialogue_box, ui_background):
         pygame.display.flip()
         clock.tick(FPS)
 
-    print(f"Vitalik choice made: {choice}")
+    log.info("Vitalik choice made: %s", choice)
     return choice
\ No newline at end of file
@@ -0,0 +1,102 @@
+# src/modules/particles.py
+import math
+import random
+from array import array
+import pygame
+from src.config import PARTICLE_CAPACITY
+from src.modules.assets import shared_surface
+
+PALETTE = [(255, 0, 0), (255, 255, 255), (0, 200, 80), (255, 215, 0)]
+FADE_FRAMES = 8
+
+# Bursts per game event: each layer is (count, palette index, size, speed range, lifetime in ticks, drag)
+EMITTERS = {
+    "hit": [(1, 0, 20, (0, 0), 10, 1.0), (5, 1, 6, (2, 4), 12, 0.85)],
+    "split": [(1, 2, 30, (0, 0), 12, 1.0), (10, 2, 8, (2, 5), 18, 0.9)],
+    "fragment": [(16, 3, 8, (1.5, 1.5), 40, 0.97), (1, 3, 40, (0, 0), 20, 1.0)]
+}
+
+FLOAT_FIELDS = ["x", "y", "vx", "vy", "drag"]
+INT_FIELDS = ["life", "max_life", "color", "size"]
+
+
+def fade_frames(color, size):
+    # A soft circle at FADE_FRAMES alpha levels, drawn once per (colour, size) instead of per particle per frame
+    frames = []
+    for step in range(1, FADE_FRAMES + 1):
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, 255 * step // FADE_FRAMES), (size // 2, size // 2), size // 2)
+        frames.append(surface)
+    return frames
+
+
+class ParticleSystem:
+    # Live particles are slots 0..count-1 of fixed-capacity parallel arrays; dead ones are swap-removed
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        for field in FLOAT_FIELDS:
+            setattr(self, field, array("d", [0.0]) * capacity)
+        for field in INT_FIELDS:
+            setattr(self, field, array("i", [0]) * capacity)
+        self.count = 0
+        # Cosmetic only, so it never draws from the seeded gameplay streams
+        self.rng = random.Random()
+        self.frames = {}
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, vx, vy, life, color, size, drag=1.0):
+        if self.count == self.capacity:
+            return False
+        i = self.count
+        self.x[i], self.y[i], self.vx[i], self.vy[i], self.drag[i] = x, y, vx, vy, drag
+        self.life[i] = self.max_life[i] = life
+        self.color[i] = color
+        self.size[i] = size
+        if (color, size) not in self.frames:
+            self.frames[(color, size)] = shared_surface(("particle", color, size),
+                                                        lambda: fade_frames(PALETTE[color], size), category="particles")
+        self.count += 1
+        return True
+
+    def emit(self, name, x, y):
+        rng = self.rng
+        for count, color, size, (low, high), life, drag in EMITTERS[name]:
+            for _ in range(count):
+                angle = rng.random() * math.tau
+                speed = rng.uniform(low, high)
+                self.spawn(x, y, math.cos(angle) * speed, math.sin(angle) * speed, life, color, size, drag)
+
+    def update(self):
+        x, y, vx, vy, drag, life = self.x, self.y, self.vx, self.vy, self.drag, self.life
+        i = 0
+        while i < self.count:
+            life[i] -= 1
+            if life[i] <= 0:
+                last = self.count - 1
+                if i != last:
+                    for field in FLOAT_FIELDS + INT_FIELDS:
+                        values = getattr(self, field)
+                        values[i] = values[last]
+                self.count = last
+                continue
+            x[i] += vx[i]
+            y[i] += vy[i]
+            vx[i] *= drag[i]
+            vy[i] *= drag[i]
+            i += 1
+
+    def draw(self, screen):
+        if not self.count:
+            return
+        x, y, life, max_life, color, size, frames = self.x, self.y, self.life, self.max_life, self.color, self.size, self.frames
+        batch = []
+        for i in range(self.count):
+            half = size[i] // 2
+            frame = (life[i] * FADE_FRAMES - 1) // max_life[i]
+            batch.append((frames[(color[i], size[i])][frame], (int(x[i]) - half, int(y[i]) - half)))
+        screen.blits(batch, False)
+
+    def clear(self):
+        self.count = 0
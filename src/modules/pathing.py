@@ -0,0 +1,85 @@
+# src/modules/pathing.py
+from collections import deque
+from src.config import SCREEN_HEIGHT, TILE_SIZE, HUD_HEIGHT
+
+NEIGHBOURS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+class FlowField:
+    # BFS from the player's tile over the maze floor. Every reachable cell stores the direction of its
+    # next hop toward the player, so any number of pursuers can follow the maze for the cost of one
+    # BFS per player tile change.
+    def __init__(self, maze):
+        self.maze = maze
+        self.tile_height = (SCREEN_HEIGHT - HUD_HEIGHT) / maze.height
+        self.target = None
+        self.version = None
+        self.next_x = [0] * (maze.width * maze.height)
+        self.next_y = [0] * (maze.width * maze.height)
+        self.distance = [-1] * (maze.width * maze.height)
+        self.rebuilds = 0
+
+    def tile_of(self, px, py):
+        return self.maze.column_of(int(px)), self.maze.row_of(py)
+
+    def tile_center(self, column, row):
+        return column * TILE_SIZE + TILE_SIZE / 2, HUD_HEIGHT + (row + 0.5) * self.tile_height
+
+    def update(self, target_rect):
+        target = self.tile_of(target_rect.centerx, target_rect.centery)
+        target = (max(0, min(target[0], self.maze.width - 1)), target[1])
+        if target == self.target and self.version == self.maze.version:
+            return
+        self.target = target
+        self.version = self.maze.version
+        self.rebuilds += 1
+        width = self.maze.width
+        height = self.maze.height
+        grid = self.maze.grid
+        distance = self.distance
+        next_x = self.next_x
+        next_y = self.next_y
+        for i in range(width * height):
+            distance[i] = -1
+        tx, ty = target
+        distance[ty * width + tx] = 0
+        queue = deque([target])
+        while queue:
+            x, y = queue.popleft()
+            step = distance[y * width + x] + 1
+            for dx, dy in NEIGHBOURS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height and grid[ny][nx] == 0:
+                    index = ny * width + nx
+                    if distance[index] == -1:
+                        distance[index] = step
+                        # Walking back along the edge we came in on leads toward the target
+                        next_x[index] = -dx
+                        next_y[index] = -dy
+                        queue.append((nx, ny))
+
+    def steer(self, rect, travel, max_hops=8):
+        # Offset that moves rect's centre up to `travel` pixels per axis along the field, through successive
+        # tile centres so the mover lines up with one-tile corridors. Returns None when rect's tile cannot
+        # reach the target (callers fall back to their own logic).
+        cx, cy = rect.centerx, rect.centery
+        column, row = self.tile_of(cx, cy)
+        if not (0 <= column < self.maze.width) or self.distance[row * self.maze.width + column] < 0:
+            return None
+        x, y = cx, cy
+        remaining = travel
+        for _ in range(max_hops):
+            index = row * self.maze.width + column
+            if remaining <= 0 or self.distance[index] == 0:
+                break  # On the target's tile the caller closes the last stretch
+            column += self.next_x[index]
+            row += self.next_y[index]
+            goal_x, goal_y = self.tile_center(column, row)
+            step_x = max(-remaining, min(goal_x - x, remaining))
+            step_y = max(-remaining, min(goal_y - y, remaining))
+            x += step_x
+            y += step_y
+            remaining -= max(abs(step_x), abs(step_y))
+            if (x, y) != (goal_x, goal_y):
+                break
+        return x - cx, y - cy
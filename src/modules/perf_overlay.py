@@ -0,0 +1,151 @@
+# src/modules/perf_overlay.py
+import time
+from collections import deque
+import pygame
+from src.config import FPS, DEFAULT_FONT, WHITE, PERF_HISTORY, PERF_REFRESH, HITCH_FACTOR
+from src.modules import frame_stats, hitches
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+# Frame sections, timed back to back by lap(); scene_draw is the Scene.draw part of draw, timed with add()
+SECTIONS = ["events", "simulation", "draw", "scene_draw"]
+COLORS = [(80, 160, 255), (255, 170, 0), (80, 220, 120), (255, 255, 255)]
+PANEL_WIDTH, PANEL_HEIGHT = 380, 236
+HITCH_LINES = 3
+GRAPH_HEIGHT = 90
+GRAPH_SCALE_MS = 2000 / FPS  # top of the graph is two frame budgets
+
+
+class CountingSurface(pygame.Surface):
+    # Off-screen frame the game draws into while the overlay is open, so every blit gets counted
+    def blit(self, source, dest, area=None, special_flags=0):
+        frame_stats.blits += 1
+        return super().blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        if not isinstance(blit_sequence, (list, tuple)):
+            blit_sequence = list(blit_sequence)
+        frame_stats.blits += len(blit_sequence)
+        return super().blits(blit_sequence, doreturn)
+
+
+class PerfOverlay:
+    # F3: rolling frame-time graph split by section, plus entity counts and per-frame draw counters.
+    # The panel is rendered into a layer every `refresh` frames; the frames in between only blit it.
+    def __init__(self, history=PERF_HISTORY, refresh=PERF_REFRESH):
+        self.visible = False
+        self.refresh = refresh
+        self.samples = deque(maxlen=history)  # per frame: milliseconds per section
+        self.frame_ms = deque(maxlen=history)  # wall time from one frame start to the next
+        self.times = [0.0] * len(SECTIONS)
+        self.frame_start = None
+        self.last = 0.0
+        self.totals = [0, 0, 0, 0]  # frame_stats summed since the layer was last drawn
+        self.frames = 0
+        self.canvas_surface = None
+        self.layer = None
+        self.font = None
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.layer = None
+        self.totals = [0, 0, 0, 0]
+        self.frames = 0
+        log.info("Performance overlay %s.", "shown" if self.visible else "hidden")
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            self.frame_ms.append((now - self.frame_start) * 1000)
+        self.frame_start = self.last = now
+        self.times = [0.0] * len(SECTIONS)
+        frame_stats.reset()
+
+    @staticmethod
+    def now():
+        return time.perf_counter()
+
+    def lap(self, section):
+        # Charges the time since the previous lap to `section`
+        now = time.perf_counter()
+        self.times[SECTIONS.index(section)] += now - self.last
+        self.last = now
+
+    def add(self, section, start):
+        # For a section nested inside another one, measured from `start`
+        self.times[SECTIONS.index(section)] += time.perf_counter() - start
+
+    def canvas(self, screen):
+        # What to draw the frame on: the screen itself, or a counting copy of it while the overlay is open
+        if not self.visible:
+            return screen
+        if self.canvas_surface is None or self.canvas_surface.get_size() != screen.get_size():
+            self.canvas_surface = CountingSurface(screen.get_size())
+        return self.canvas_surface
+
+    def end_frame(self, screen, counts):
+        # After the frame is drawn on canvas(screen) and before the flip
+        self.samples.append([t * 1000 for t in self.times])
+        if not self.visible:
+            return
+        for i, value in enumerate(frame_stats.snapshot()):
+            self.totals[i] += value
+        self.frames += 1
+        screen.blit(self.canvas_surface, (0, 0))
+        if self.layer is None or self.frames >= self.refresh:
+            self.layer = self.render(counts)
+            self.totals = [0, 0, 0, 0]
+            self.frames = 0
+        screen.blit(self.layer, (screen.get_width() - PANEL_WIDTH - 10, 60))
+
+    def render(self, counts):
+        if self.font is None:
+            self.font = pygame.font.SysFont(DEFAULT_FONT, 16)
+        layer = pygame.Surface((PANEL_WIDTH, PANEL_HEIGHT), pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 180))
+        bottom = GRAPH_HEIGHT + 4
+        scale = GRAPH_HEIGHT / GRAPH_SCALE_MS
+        step = PANEL_WIDTH / max(1, self.samples.maxlen)
+        scene_points = []
+        for i, sample in enumerate(self.samples):
+            x = int(i * step) + 1
+            y = bottom
+            # events, simulation and draw stacked from the bottom
+            for section in range(3):
+                height = sample[section] * scale
+                if height >= 1:
+                    top = max(4, y - height)
+                    pygame.draw.line(layer, COLORS[section], (x, y), (x, top), max(1, int(step)))
+                    y = top
+            scene_points.append((x, max(4, bottom - sample[3] * scale)))
+        if len(scene_points) > 1:
+            pygame.draw.lines(layer, COLORS[3], False, scene_points)
+        budget_y = bottom - (1000 / FPS) * scale
+        pygame.draw.line(layer, (255, 60, 60), (0, budget_y), (PANEL_WIDTH, budget_y))
+
+        samples = list(self.samples)
+        frames = list(self.frame_ms)
+        average = [sum(sample[i] for sample in samples) / max(1, len(samples)) for i in range(len(SECTIONS))]
+        frame_average = sum(frames) / len(frames) if frames else 0.0
+        per_frame = [total / max(1, self.frames) for total in self.totals]
+        lookups = self.totals[2] + self.totals[3]
+        lines = [
+            (f"frame {frame_average:.1f} ms avg, {max(frames, default=0.0):.1f} max"
+             f" ({1000 / frame_average if frame_average else 0:.0f} fps)", WHITE),
+            (f"events {average[0]:.2f}  sim {average[1]:.2f}  draw {average[2]:.2f}", WHITE),
+            (f"scene draw {average[3]:.2f} ms", COLORS[3]),
+            ("  ".join(f"{name} {count}" for name, count in counts.items()), WHITE),
+            (f"blits {per_frame[0]:.0f}  surfaces {per_frame[1]:.0f}  text cache "
+             f"{100 * self.totals[2] / lookups if lookups else 100:.0f}%", WHITE),
+            (f"hitches {hitches.count()} (frames over {hitches.BUDGET_MS * HITCH_FACTOR:.0f} ms)", COLORS[1])
+        ]
+        for hitch in reversed(hitches.recent(HITCH_LINES)):
+            lines.append((hitches.summary(hitch), COLORS[1]))
+        y = bottom + 4
+        for text, color in lines:
+            while len(text) > 1 and self.font.size(text)[0] > PANEL_WIDTH - 12:
+                text = text[:-1]
+            layer.blit(self.font.render(text, True, color), (6, y))
+            y += 14
+        return layer
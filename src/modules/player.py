@@ -2,12 +2,17 @@
 import pygame
 import random
 import os
-from src.config import TILE_SIZE, PLAYER_SPEED, CRITICAL_TINT, FPS, HUD_HEIGHT, OPTIMISM_RING_EFFECT
+from src.config import TILE_SIZE, PLAYER_SPEED, CRITICAL_TINT, SIMULATION_HZ, HUD_HEIGHT, OPTIMISM_RING_EFFECT
 from src.modules.inventory import Inventory
+from src.modules import frame_stats
+from src.modules.profiling import timed
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
 
 class Player:
     def __init__(self, x, y, name, gender, sprite):
-        print("Entering Player.__init__...")
+        log.debug("Entering Player.__init__...")
         try:
             self.rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
             self.name = name
@@ -38,22 +43,22 @@ class Player:
             # Load Optimism Ring effect sprite
             self.optimism_ring_sprite = None
             try:
-                print(f"Attempting to load Optimism Ring effect sprite from: {OPTIMISM_RING_EFFECT}")
+                log.debug("Attempting to load Optimism Ring effect sprite from: %s", OPTIMISM_RING_EFFECT)
                 if not os.path.exists(OPTIMISM_RING_EFFECT):
                     raise FileNotFoundError(f"File not found: {OPTIMISM_RING_EFFECT}")
                 self.optimism_ring_sprite = pygame.image.load(OPTIMISM_RING_EFFECT).convert_alpha()
                 self.optimism_ring_sprite = pygame.transform.scale(self.optimism_ring_sprite, (80, 80))  # Larger than player sprite to encompass
             except (pygame.error, FileNotFoundError, Exception) as e:
-                print(f"Failed to load Optimism Ring effect sprite at {OPTIMISM_RING_EFFECT}. Error: {e}. Using placeholder.")
+                log.warning("Failed to load Optimism Ring effect sprite at %s. Error: %s. Using placeholder.", OPTIMISM_RING_EFFECT, e)
                 self.optimism_ring_sprite = None
 
-            print("Player initialized successfully.")
+            log.debug("Player initialized successfully.")
         except Exception as e:
-            print(f"Error in Player.__init__: {e}")
+            log.error("Error in Player.__init__: %s", e)
             raise
 
     def move(self, keys, maze):
-        print("Entering Player.move...")
+        log.debug("Entering Player.move...")
         try:
             dx, dy = 0, 0
             if keys[pygame.K_LEFT]:
@@ -67,24 +72,16 @@ class Player:
             if keys[pygame.K_DOWN]:
                 dy += PLAYER_SPEED
 
-            new_rect = self.rect.copy()
-            new_rect.x += dx
-            if not maze.collides(new_rect):
-                self.rect.x = new_rect.x
-
-            new_rect = self.rect.copy()
-            new_rect.y += dy
-            if not maze.collides(new_rect):
-                self.rect.y = new_rect.y
+            self.rect.x, self.rect.y, _, _ = maze.move_and_slide(self.rect, dx, dy)
 
-            print("Player moved successfully.")
+            log.debug("Player moved successfully.")
         except Exception as e:
-            print(f"Error in Player.move: {e}")
+            log.error("Error in Player.move: %s", e)
             raise
 
     def take_damage(self, amount):
         if self.optimism_ring_active:
-            print("Player is invincible due to Optimism Ring!")
+            log.debug("Player is invincible due to Optimism Ring!")
             return
         self.hp -= amount
         self.shake_timer = 20  # Increased to 20 frames for more noticeable effect
@@ -104,15 +101,15 @@ class Player:
         self.hp = self.max_hp  # Restore HP on level up
         self.attack_power += 2
         self.optimism_ring_duration = min(10, self.optimism_ring_duration + 1)  # Cap at 10 seconds
-        print(f"Player leveled up to level {self.level}! HP: {self.max_hp}, Attack Power: {self.attack_power}, Optimism Ring Duration: {self.optimism_ring_duration}s")
+        log.info("Player leveled up to level %s! HP: %s, Attack Power: %s, Optimism Ring Duration: %ss", self.level, self.max_hp, self.attack_power, self.optimism_ring_duration)
 
+    @timed("render.player")
     def draw(self, screen):
-        print("Entering Player.draw...")
+        log.debug("Entering Player.draw...")
         try:
             # Apply shake effect if active
             if self.shake_timer > 0:
                 self.shake_offset = (random.randint(-2, 2), random.randint(-2, 2))
-                self.shake_timer -= 1
             else:
                 self.shake_offset = (0, 0)
 
@@ -127,6 +124,7 @@ class Player:
                     alpha = int(128 + 127 * (pygame.time.get_ticks() % 1000) / 1000)  # Oscillates every second
                     effect_surface = self.optimism_ring_sprite.copy()
                     effect_surface.set_alpha(alpha)
+                    frame_stats.surfaces += 1
                     # Center the effect on the player
                     sprite_pos = (
                     self.rect.centerx - 40 + self.shake_offset[0], self.rect.centery - 40 + self.shake_offset[1])
@@ -135,22 +133,23 @@ class Player:
                     # Fallback: Draw a pulsing circle
                     alpha = int(128 + 127 * (pygame.time.get_ticks() % 1000) / 1000)
                     circle_surface = pygame.Surface((80, 80), pygame.SRCALPHA)
+                    frame_stats.surfaces += 1
                     pygame.draw.circle(circle_surface, (255, 255, 0, alpha), (40, 40), 40, 2)
                     screen.blit(circle_surface, (
                     self.rect.centerx - 40 + self.shake_offset[0], self.rect.centery - 40 + self.shake_offset[1]))
-            print("Player drawn successfully.")
+            log.debug("Player drawn successfully.")
         except Exception as e:
-            print(f"Error in Player.draw: {e}")
+            log.error("Error in Player.draw: %s", e)
             raise
 
     def update(self):
-        print("Entering Player.update...")
+        log.debug("Entering Player.update...")
         try:
             # Update Optimism Ring fill
             if not self.optimism_ring_active and self.optimism_ring_cooldown <= 0:
-                self.optimism_ring_fill = min(100, self.optimism_ring_fill + self.optimism_ring_fill_rate / FPS)
+                self.optimism_ring_fill = min(100, self.optimism_ring_fill + self.optimism_ring_fill_rate / SIMULATION_HZ)
             elif self.optimism_ring_cooldown > 0:
-                self.optimism_ring_cooldown -= 1 / FPS
+                self.optimism_ring_cooldown -= 1 / SIMULATION_HZ
 
             # Update Optimism Ring active timer
             if self.optimism_ring_active:
@@ -160,55 +159,59 @@ class Player:
                     self.optimism_ring_fill = 0
                     self.optimism_ring_cooldown = self.optimism_ring_cooldown_max
 
-            print("Player updated successfully.")
+            # Hit shake counts simulation ticks, not rendered frames
+            if self.shake_timer > 0:
+                self.shake_timer -= 1
+
+            log.debug("Player updated successfully.")
         except Exception as e:
-            print(f"Error in Player.update: {e}")
+            log.error("Error in Player.update: %s", e)
             raise
 
     def update_infection(self, increment):
-        print("Entering Player.update_infection...")
+        log.debug("Entering Player.update_infection...")
         try:
             if self.inventory.has_sword:
                 increment = 0
             self.infection_level += increment
             if self.infection_level >= 100:
-                print("Infection level reached 100%. Game over.")
+                log.info("Infection level reached 100%. Game over.")
                 return True
             if self.infection_level < 0:
                 self.infection_level = 0
-            print(f"Infection level updated to: {self.infection_level}")
+            log.debug("Infection level updated to: %s", self.infection_level)
             return False
         except Exception as e:
-            print(f"Error in Player.update_infection: {e}")
+            log.error("Error in Player.update_infection: %s", e)
             raise
 
     def collect_fragment(self):
-        print("Entering Player.collect_fragment...")
+        log.debug("Entering Player.collect_fragment...")
         try:
             self.inventory.add_fragment()
             if self.inventory.fragments == 1:
                 self.infection_level = 0
-            print(f"Fragment collected. Total fragments: {self.inventory.fragments}")
+            log.info("Fragment collected. Total fragments: %s", self.inventory.fragments)
         except Exception as e:
-            print(f"Error in Player.collect_fragment: {e}")
+            log.error("Error in Player.collect_fragment: %s", e)
             raise
 
     def activate_optimism_ring(self):
-        print("Entering Player.activate_optimism_ring...")
+        log.debug("Entering Player.activate_optimism_ring...")
         try:
             if self.optimism_ring_fill >= 100 and not self.optimism_ring_active and self.optimism_ring_cooldown <= 0:
                 self.optimism_ring_active = True
-                self.optimism_ring_timer = self.optimism_ring_duration * FPS
-                print("Optimism Ring activated.")
+                self.optimism_ring_timer = self.optimism_ring_duration * SIMULATION_HZ
+                log.info("Optimism Ring activated.")
         except Exception as e:
-            print(f"Error in Player.activate_optimism_ring: {e}")
+            log.error("Error in Player.activate_optimism_ring: %s", e)
             raise
 
     def lose_sword(self):
-        print("Entering Player.lose_sword...")
+        log.debug("Entering Player.lose_sword...")
         try:
             self.inventory.remove_sword()
-            print("Sword lost.")
+            log.info("Sword lost.")
         except Exception as e:
-            print(f"Error in Player.lose_sword: {e}")
+            log.error("Error in Player.lose_sword: %s", e)
             raise
\ No newline at end of file
@@ -0,0 +1,136 @@
+# src/modules/profiling.py
+# Named timing scopes for production sessions (--timings). Each scope's durations are collected for one
+# second at a time and reduced to count/p50/p95/max/total rows, written as CSV or JSON on exit.
+# Disabled, scope() hands back a shared no-op context and timed() functions add one flag check.
+import csv
+import functools
+import json
+import os
+import time
+from contextlib import nullcontext
+from src.config import LOG_DIR
+from src.modules.logs import get_logger
+from src.modules.stats import percentile
+
+log = get_logger(__name__)
+
+FIELDS = ["second", "scope", "count", "p50_ms", "p95_ms", "max_ms", "total_ms"]
+
+_enabled = False
+_started = 0
+_window_start = 0
+_window = {}  # scope name -> durations in ns during the current second
+_rows = []
+_null = nullcontext()
+
+
+class _Scope:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        record(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+def enable():
+    global _enabled, _started, _window_start
+    _enabled = True
+    _started = _window_start = time.perf_counter_ns()
+    _window.clear()
+    _rows.clear()
+    log.info("Timing scopes enabled.")
+
+
+def enabled():
+    return _enabled
+
+
+def scope(name):
+    return _Scope(name) if _enabled else _null
+
+
+def timed(name=None):
+    # Decorator form of scope(); the scope is named after the function unless given
+    def decorate(function):
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(label, time.perf_counter_ns() - start)
+        return wrapper
+    return decorate
+
+
+def record(name, duration_ns):
+    durations = _window.get(name)
+    if durations is None:
+        durations = _window[name] = []
+    durations.append(duration_ns)
+
+
+def flush(now=None):
+    global _window_start
+    now = time.perf_counter_ns() if now is None else now
+    second = (_window_start - _started) // 1_000_000_000
+    for name, durations in _window.items():
+        if not durations:
+            continue
+        durations.sort()
+        _rows.append({"second": second, "scope": name, "count": len(durations),
+                      "p50_ms": round(percentile(durations, 0.5) / 1e6, 4),
+                      "p95_ms": round(percentile(durations, 0.95) / 1e6, 4),
+                      "max_ms": round(durations[-1] / 1e6, 4),
+                      "total_ms": round(sum(durations) / 1e6, 4)})
+        durations.clear()
+    _window_start = now
+
+
+def tick():
+    # Once per frame: closes the window when a second has passed
+    if _enabled:
+        now = time.perf_counter_ns()
+        if now - _window_start >= 1_000_000_000:
+            flush(now)
+
+
+def rows():
+    return list(_rows)
+
+
+def default_path():
+    return os.path.join(LOG_DIR, time.strftime("timings-%Y%m%d-%H%M%S.csv"))
+
+
+def write(path=None):
+    # .json gets a list of row objects, anything else CSV; returns the path or None
+    if not _enabled:
+        return None
+    flush()
+    path = path or default_path()
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            if path.endswith(".json"):
+                json.dump(_rows, f, indent=1)
+            else:
+                writer = csv.DictWriter(f, fieldnames=FIELDS)
+                writer.writeheader()
+                writer.writerows(_rows)
+        log.info("Wrote %s timing rows to %s", len(_rows), path)
+        return path
+    except OSError as e:
+        log.error("Failed to write timings to %s: %s", path, e)
+        return None
@@ -0,0 +1,128 @@
+# src/modules/projectiles.py
+from array import array
+import pygame
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, HUD_HEIGHT, PROJECTILE_CAPACITY, PROJECTILE_TYPES
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+TYPE_NAMES = list(PROJECTILE_TYPES)
+FLOAT_FIELDS = ["x", "y", "prev_x", "prev_y", "vx", "vy"]
+INT_FIELDS = ["width", "height", "life", "kind", "solid"]
+
+
+class ProjectileBuffer:
+    # Every live enemy projectile in parallel arrays. Slots 0..count-1 are live; removing one moves the
+    # last live slot into its place, so nothing is searched for or shifted.
+    def __init__(self, capacity=PROJECTILE_CAPACITY):
+        self.capacity = capacity
+        for field in FLOAT_FIELDS:
+            setattr(self, field, array("d", [0.0]) * capacity)
+        for field in INT_FIELDS:
+            setattr(self, field, array("i", [0]) * capacity)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def grow(self):
+        log.info("Growing projectile buffer to %s slots...", self.capacity * 2)
+        for field in FLOAT_FIELDS + INT_FIELDS:
+            getattr(self, field).extend(getattr(self, field))
+        self.capacity *= 2
+
+    def spawn(self, x, y, width, height, dx, dy, kind="bolt"):
+        if self.count == self.capacity:
+            self.grow()
+        spec = PROJECTILE_TYPES[kind]
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = dx * spec["speed"]
+        self.vy[i] = dy * spec["speed"]
+        self.width[i] = width
+        self.height[i] = height
+        self.life[i] = spec["lifetime"]
+        self.kind[i] = TYPE_NAMES.index(kind)
+        self.solid[i] = 1 if spec["solid"] else 0
+        self.count += 1
+
+    def add(self, attack):
+        # Enemy attacks return (rect, dx, dy) with an optional projectile type name; motionless ones are sweeps
+        rect, dx, dy = attack[:3]
+        kind = attack[3] if len(attack) > 3 else ("sweep" if dx == 0 and dy == 0 else "bolt")
+        self.spawn(rect.x, rect.y, rect.width, rect.height, dx, dy, kind)
+
+    def extend(self, attacks):
+        for attack in attacks:
+            self.add(attack)
+
+    def remove(self, i):
+        last = self.count - 1
+        if i != last:
+            for field in FLOAT_FIELDS + INT_FIELDS:
+                values = getattr(self, field)
+                values[i] = values[last]
+        self.count = last
+
+    def clear(self):
+        self.count = 0
+
+    def rects(self):
+        return [pygame.Rect(int(self.x[i]), int(self.y[i]), self.width[i], self.height[i]) for i in range(self.count)]
+
+    def update(self, maze, target_rect=None):
+        # One tick: age, move, drop the expired, off-screen or wall-struck, and consume those that reach
+        # target_rect (None = nothing to hit). Returns how many hit the target.
+        x, y, prev_x, prev_y, vx, vy = self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy
+        width, height, life, solid = self.width, self.height, self.life, self.solid
+        grid = maze.grid
+        maze_width, maze_height = maze.width, maze.height
+        tile_height = (SCREEN_HEIGHT - HUD_HEIGHT) / maze_height
+        if target_rect is not None:
+            target_left, target_top = target_rect.left, target_rect.top
+            target_right, target_bottom = target_rect.right, target_rect.bottom
+        hits = 0
+        i = 0
+        while i < self.count:
+            life[i] -= 1
+            if life[i] <= 0:
+                self.remove(i)
+                continue
+            px = prev_x[i] = x[i]
+            py = prev_y[i] = y[i]
+            px += vx[i]
+            py += vy[i]
+            x[i] = px
+            y[i] = py
+            if px < 0 or px > SCREEN_WIDTH or py < 0 or py > SCREEN_HEIGHT:
+                self.remove(i)
+                continue
+            left, top = int(px), int(py)
+            w, h = width[i], height[i]
+            if solid[i]:
+                column = (left + w // 2) // TILE_SIZE
+                row = int((top + h // 2 - HUD_HEIGHT) // tile_height)
+                if 0 <= column < maze_width and 0 <= row < maze_height and grid[row][column] == 1:
+                    self.remove(i)
+                    continue
+            if (target_rect is not None and left < target_right and left + w > target_left
+                    and top < target_bottom and top + h > target_top):
+                hits += 1
+                self.remove(i)
+                continue
+            i += 1
+        return hits
+
+    def draw(self, screen, sprite=None, alpha=1.0):
+        # Drawn between the previous and current tick positions, like the Interpolator does for rects
+        x, y, prev_x, prev_y = self.x, self.y, self.prev_x, self.prev_y
+        if sprite is not None:
+            screen.blits([(sprite, (round(prev_x[i] + (x[i] - prev_x[i]) * alpha),
+                                    round(prev_y[i] + (y[i] - prev_y[i]) * alpha)))
+                          for i in range(self.count)], False)
+            return
+        for i in range(self.count):
+            pygame.draw.rect(screen, (255, 0, 0), (round(prev_x[i] + (x[i] - prev_x[i]) * alpha),
+                                                   round(prev_y[i] + (y[i] - prev_y[i]) * alpha),
+                                                   self.width[i], self.height[i]))
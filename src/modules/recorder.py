@@ -0,0 +1,328 @@
+# src/modules/recorder.py
+# --record: captures everything a session reads from outside the game so python -m src.tools.replay can run
+# it again headless, uncapped, and land in the same state. That is the keydown/quit events and
+# key.get_pressed() snapshots, the values of pygame.time.get_ticks(), Clock.tick() and the fixed timestep's
+# clock, every fresh seed from rng.new_seed(), the seed of the global random module, and the save file the
+# session started from. Every REPLAY_CHECKPOINT_FRAMES main-loop frames a digest of the game state is
+# stored, so a replay can say where it first went its own way.
+#
+# The file is gzipped JSON; each channel is a list of values in the order the game asked for them, and
+# runs of repeated values (no events, same keys held) are stored once with a count.
+import base64
+import gzip
+import hashlib
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+import pygame
+from src.config import LOG_DIR, REPLAY_CHECKPOINT_FRAMES
+from src.modules import game_state, rng
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+VERSION = 1
+RECORDING, REPLAYING = "recording", "replaying"
+CHANNELS = ["events", "keys", "ticks", "clock", "time", "seeds"]
+RUN_LENGTH = {"events", "keys"}
+EVENT_TYPES = {pygame.KEYDOWN: "keydown", pygame.QUIT: "quit"}
+EVENT_CODES = {name: code for code, name in EVENT_TYPES.items()}
+SCANCODES = 512  # length of key.get_pressed()
+
+_mode = None
+_path = None
+_header = {}
+_channels = {}  # channel -> values (recording) or decoded values (replaying)
+_cursor = {}  # channel -> next index while replaying
+_state = None  # callable returning the objects that make up the game state, from main
+_frames = 0
+_checkpoints = []  # [frame, digest] while recording
+_expected = {}  # replaying: frame -> digest from the recording
+_divergence = None
+_frame_ms = []
+_last_frame = None
+_started = 0.0
+_real = {}
+
+
+def active():
+    return _mode
+
+
+def _record(channel, value):
+    _channels[channel].append(value)
+    return value
+
+
+def _next(channel):
+    values = _channels[channel]
+    index = _cursor[channel]
+    if index >= len(values):
+        # The recorded session stopped here (window closed, crash); so does the replay
+        log.info("Recording exhausted (%s) after %s frames.", channel, _frames)
+        raise SystemExit(0)
+    _cursor[channel] = index + 1
+    return values[index]
+
+
+def _encode(channel, values):
+    if channel not in RUN_LENGTH:
+        return values
+    runs = []
+    for value in values:
+        if runs and runs[-1][1] == value:
+            runs[-1][0] += 1
+        else:
+            runs.append([1, value])
+    return runs
+
+
+def _decode(channel, values):
+    if channel not in RUN_LENGTH:
+        return values
+    decoded = []
+    for count, value in values:
+        decoded.extend([value] * count)
+    return decoded
+
+
+class _RecordingClock:
+    # pygame.time.Clock can't be subclassed
+    def __init__(self):
+        self.clock = _real["Clock"]()
+
+    def tick(self, framerate=0):
+        return _record("clock", self.clock.tick(framerate))
+
+    def tick_busy_loop(self, framerate=0):
+        return _record("clock", self.clock.tick_busy_loop(framerate))
+
+    def __getattr__(self, name):
+        return getattr(self.clock, name)
+
+
+class _ReplayClock:
+    # Hands back the recorded frame times without waiting
+    def __init__(self):
+        self.clock = _real["Clock"]()
+
+    def tick(self, framerate=0):
+        return _next("clock")
+
+    tick_busy_loop = tick
+
+    def __getattr__(self, name):
+        return getattr(self.clock, name)
+
+
+def _record_events(*args, **kwargs):
+    events = _real["get"](*args, **kwargs)
+    _record("events", [[EVENT_TYPES[event.type], event.key, event.mod, event.unicode, event.scancode]
+                       if event.type == pygame.KEYDOWN else [EVENT_TYPES[event.type]]
+                       for event in events if event.type in EVENT_TYPES])
+    return events
+
+
+def _replay_events(*args, **kwargs):
+    # The real queue is still drained so SDL stays responsive
+    _real["get"]()
+    events = []
+    for values in _next("events"):
+        if values[0] == "keydown":
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=values[1], mod=values[2], unicode=values[3],
+                                             scancode=values[4]))
+        else:
+            events.append(pygame.event.Event(EVENT_CODES[values[0]]))
+    return events
+
+
+def _record_pressed():
+    pressed = _real["get_pressed"]()
+    _record("keys", [index for index, down in enumerate(pressed) if down])
+    return pressed
+
+
+def _replay_pressed():
+    state = [False] * SCANCODES
+    for index in _next("keys"):
+        state[index] = True
+    return pygame.key.ScancodeWrapper(state)
+
+
+def _record_ticks():
+    return _record("ticks", _real["get_ticks"]())
+
+
+def _replay_ticks():
+    return _next("ticks")
+
+
+def _no_wait(milliseconds):
+    return 0
+
+
+def _record_seed():
+    return _record("seeds", random.SystemRandom().getrandbits(63))
+
+
+def _replay_seed():
+    return _next("seeds")
+
+
+def timestep_clock():
+    # Clock for FixedTimestep: the number of simulation ticks per frame follows from it
+    if _mode == RECORDING:
+        return lambda: _record("time", time.perf_counter())
+    if _mode == REPLAYING:
+        return lambda: _next("time")
+    return time.perf_counter
+
+
+def _patch(replaying):
+    _real.update(get=pygame.event.get, get_pressed=pygame.key.get_pressed, get_ticks=pygame.time.get_ticks,
+                 Clock=pygame.time.Clock, delay=pygame.time.delay, wait=pygame.time.wait)
+    if replaying:
+        pygame.event.get = _replay_events
+        pygame.key.get_pressed = _replay_pressed
+        pygame.time.get_ticks = _replay_ticks
+        pygame.time.Clock = _ReplayClock
+        pygame.time.delay = pygame.time.wait = _no_wait
+        rng.set_seed_source(_replay_seed)
+    else:
+        pygame.event.get = _record_events
+        pygame.key.get_pressed = _record_pressed
+        pygame.time.get_ticks = _record_ticks
+        pygame.time.Clock = _RecordingClock
+        rng.set_seed_source(_record_seed)
+
+
+def start_recording(path=None, seed=None, horde=0):
+    # Before pygame.init() and before anything draws a random number
+    global _mode, _path, _started
+    _mode = RECORDING
+    _path = path or os.path.join(LOG_DIR, time.strftime("recording-%Y%m%d-%H%M%S.json.gz"))
+    random_seed = random.SystemRandom().getrandbits(63)
+    random.seed(random_seed)
+    save = None
+    if os.path.exists(game_state.SAVE_PATH):
+        with open(game_state.SAVE_PATH, "rb") as f:
+            save = base64.b64encode(f.read()).decode("ascii")
+    _header.update(time=time.strftime("%Y-%m-%dT%H:%M:%S"), seed=seed, horde=horde,
+                   random_seed=random_seed, save=save, platform=platform.platform(),
+                   python=platform.python_version(), pygame=pygame.version.ver)
+    for channel in CHANNELS:
+        _channels[channel] = []
+    _patch(replaying=False)
+    _started = time.perf_counter()
+    log.info("Recording input to %s", _path)
+
+
+def read(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def start_replay(path):
+    # Returns the recording's header; main() must be called with its seed and horde
+    global _mode, _path, _started
+    recording = read(path)
+    if recording.get("version") != VERSION:
+        raise ValueError(f"{path} is a version {recording.get('version')} recording, expected {VERSION}")
+    _mode = REPLAYING
+    _path = path
+    _header.update(recording["header"])
+    for channel in CHANNELS:
+        _channels[channel] = _decode(channel, recording["channels"][channel])
+        _cursor[channel] = 0
+    _expected.update({frame: digest for frame, digest in recording["checkpoints"]})
+    random.seed(_header["random_seed"])
+    # Saves made during the replay go to a scratch file, never over the player's own save
+    scratch = os.path.join(tempfile.mkdtemp(prefix="replay-"), "savegame.pkl")
+    if _header["save"] is not None:
+        with open(scratch, "wb") as f:
+            f.write(base64.b64decode(_header["save"]))
+    game_state.SAVE_PATH = scratch
+    _patch(replaying=True)
+    _started = time.perf_counter()
+    log.info("Replaying %s (%s frames recorded)", path, recording["frames"])
+    return dict(_header, frames=recording["frames"], final=recording["final"])
+
+
+def watch(state):
+    # state() returns the live player, world, projectiles, combat system and timestep; a callable because
+    # main replaces the world on a restart
+    global _state
+    _state = state
+
+
+def _rect(rect):
+    return rect.x, rect.y, rect.w, rect.h
+
+
+def state_digest(player, world, projectiles, combat, timestep):
+    # Everything gameplay can change, reduced to a short hash
+    live = len(projectiles)
+    parts = [timestep.ticks, _rect(player.rect), player.hp, player.max_hp, player.infection_level, player.level,
+             player.xp, player.optimism_ring_fill, player.inventory.supercollateral, player.inventory.fragments,
+             player.inventory.has_sword, world.seed, world.current_area, world.current_scene,
+             projectiles.x[:live].tolist(), projectiles.y[:live].tolist(),
+             [(_rect(attack.rect), attack.lifetime) for attack in combat.attacks]]
+    for area in world.areas:
+        for scene in area.scenes:
+            npcs = ([scene.npc] if scene.npc else []) + list(getattr(scene, "npcs", []))
+            parts.append([scene.seed, scene.maze.version,
+                          [(type(sapa).__name__, _rect(sapa.rect), sapa.hp) for sapa in scene.sapas],
+                          [_rect(token) for token in scene.tokens], [_rect(item) for item in scene.checkpoints],
+                          [_rect(item) for item in scene.fragments], [_rect(npc.rect) for npc in npcs]])
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _digest():
+    return state_digest(*_state()) if _state is not None else None
+
+
+def frame():
+    # Once per main-loop frame, after the flip
+    global _frames, _last_frame, _divergence
+    if _mode is None:
+        return
+    now = time.perf_counter()
+    if _last_frame is not None:
+        _frame_ms.append((now - _last_frame) * 1000)
+    _last_frame = now
+    _frames += 1
+    if _frames % REPLAY_CHECKPOINT_FRAMES == 0:
+        digest = _digest()
+        if _mode == RECORDING:
+            _checkpoints.append([_frames, digest])
+        elif _divergence is None and _frames in _expected and _expected[_frames] != digest:
+            _divergence = _frames
+            log.warning("Replay diverged from the recording by frame %s.", _frames)
+
+
+def write():
+    # atexit while recording
+    if _mode != RECORDING:
+        return None
+    recording = {"version": VERSION, "header": _header, "frames": _frames, "final": _digest(),
+                 "checkpoints": _checkpoints,
+                 "channels": {channel: _encode(channel, values) for channel, values in _channels.items()}}
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(_path)), exist_ok=True)
+        with gzip.open(_path, "wt", encoding="utf-8") as f:
+            json.dump(recording, f, separators=(",", ":"))
+        log.info("Wrote %s frames of input to %s", _frames, _path)
+        return _path
+    except OSError as e:
+        log.error("Failed to write recording to %s: %s", _path, e)
+        return None
+
+
+def finish():
+    # After a replay's main() has exited: how it went, for src.tools.replay
+    ordered = sorted(_frame_ms)
+    return {"frames": _frames, "seconds": round(time.perf_counter() - _started, 3), "final": _digest(),
+            "divergence": _divergence, "frame_ms": ordered}
@@ -0,0 +1,47 @@
+# src/modules/rng.py
+import hashlib
+import random
+
+
+_seed_source = None  # set while recording or replaying, so fresh seeds can be captured and fed back
+
+
+def set_seed_source(source):
+    global _seed_source
+    _seed_source = source
+
+
+def new_seed():
+    # 63 bits keeps seeds printable and safe to store as plain ints in save files
+    if _seed_source is not None:
+        return _seed_source()
+    return random.SystemRandom().getrandbits(63)
+
+
+def derive_seed(seed, *keys):
+    # Stable across runs and Python versions (unlike hash()), so a world seed always
+    # expands into the same per-area / per-scene / per-subsystem seeds.
+    material = ":".join(str(part) for part in (seed,) + keys)
+    digest = hashlib.sha256(material.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") >> 1
+
+
+def make_rng(seed, *keys):
+    return random.Random(derive_seed(seed, *keys))
+
+
+class RngStreams:
+    # Lazily creates one independent random.Random per named subsystem
+    def __init__(self, seed):
+        self.seed = seed
+        self.streams = {}
+
+    def stream(self, name):
+        rng = self.streams.get(name)
+        if rng is None:
+            rng = make_rng(self.seed, name)
+            self.streams[name] = rng
+        return rng
+
+    def reset(self):
+        self.streams.clear()
@@ -0,0 +1,38 @@
+# src/modules/scheduler.py
+from src.config import SIMULATION_HZ
+
+
+class TickScheduler:
+    # Decides which behaviours run on a given simulation tick. Each task has a period (every N ticks, or a
+    # time interval converted at SIMULATION_HZ) and a phase; tasks sharing a period get consecutive phases
+    # unless one is given, so periodic work is spread across ticks instead of landing on the same one.
+    def __init__(self, hz=SIMULATION_HZ):
+        self.hz = hz
+        self.tick_count = 0
+        self.tasks = {}  # name -> [period, phase, callback]
+        self.next_phase = {}  # period -> phase handed to the next task registered without one
+
+    def register(self, name, every=1, seconds=None, phase=None, callback=None):
+        period = max(1, round(seconds * self.hz)) if seconds is not None else max(1, int(every))
+        if phase is None:
+            phase = self.next_phase.get(period, 0)
+            self.next_phase[period] = phase + 1
+        self.tasks[name] = [period, phase % period, callback]
+
+    def unregister(self, name):
+        self.tasks.pop(name, None)
+
+    def due(self, name):
+        # Unknown names are always due, so callers work unchanged without a registration
+        task = self.tasks.get(name)
+        if task is None:
+            return True
+        period, phase, _ = task
+        return (self.tick_count - phase) % period == 0
+
+    def tick(self):
+        # Call once at the start of each simulation tick; runs the callbacks that are due on it
+        self.tick_count += 1
+        for name, (period, phase, callback) in list(self.tasks.items()):
+            if callback is not None and (self.tick_count - phase) % period == 0:
+                callback()
@@ -3,18 +3,23 @@ import pygame
 import sys
 import os
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, BLACK, MORNING_GLORY, DEFAULT_FONT, MALE_SPRITE, FEMALE_SPRITE, TILE_SIZE
+from src.modules.context_profile import profiled
+from src.modules.logs import get_logger
 
+log = get_logger(__name__)
+
+@profiled("player_setup")
 def get_player_info(screen):
-    print("Entering get_player_info...")
+    log.debug("Entering get_player_info...")
     try:
         font = pygame.font.SysFont(DEFAULT_FONT, 36)
     except:
-        print(f"Failed to load font '{DEFAULT_FONT}'. Using default font.")
+        log.warning("Failed to load font '%s'. Using default font.", DEFAULT_FONT)
         font = pygame.font.Font(None, 36)
     try:
         title_font = pygame.font.SysFont(DEFAULT_FONT, 48, bold=True)
     except:
-        print(f"Failed to load font '{DEFAULT_FONT}'. Using default font.")
+        log.warning("Failed to load font '%s'. Using default font.", DEFAULT_FONT)
         title_font = pygame.font.Font(None, 48)
 
     background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -35,10 +40,10 @@ def get_player_info(screen):
     while name_input_active:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in name input.")
+                log.info("Quit event in name input.")
                 sys.exit()
             if event.type == pygame.KEYDOWN:
-                print(f"Key pressed in name input: {event.key}")
+                log.debug("Key pressed in name input: %s", event.key)
                 if event.key == pygame.K_RETURN and name:
                     name_input_active = False
                 elif event.key == pygame.K_BACKSPACE:
@@ -76,24 +81,24 @@ def get_player_info(screen):
     error_message = ""
 
     try:
-        print(f"Attempting to load male sprite from: {MALE_SPRITE}")
+        log.debug("Attempting to load male sprite from: %s", MALE_SPRITE)
         if not os.path.exists(MALE_SPRITE):
             raise FileNotFoundError(f"File not found: {MALE_SPRITE}")
         male_sprite = pygame.image.load(MALE_SPRITE).convert_alpha()
         male_sprite = pygame.transform.scale(male_sprite, (TILE_SIZE, TILE_SIZE))
     except (pygame.error, FileNotFoundError, Exception) as e:
-        print(f"Failed to load male sprite at {MALE_SPRITE}. Error: {e}. Using placeholder.")
+        log.warning("Failed to load male sprite at %s. Error: %s. Using placeholder.", MALE_SPRITE, e)
         male_sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
         male_sprite.fill(MORNING_GLORY)
 
     try:
-        print(f"Attempting to load female sprite from: {FEMALE_SPRITE}")
+        log.debug("Attempting to load female sprite from: %s", FEMALE_SPRITE)
         if not os.path.exists(FEMALE_SPRITE):
             raise FileNotFoundError(f"File not found: {FEMALE_SPRITE}")
         female_sprite = pygame.image.load(FEMALE_SPRITE).convert_alpha()
         female_sprite = pygame.transform.scale(female_sprite, (TILE_SIZE, TILE_SIZE))
     except (pygame.error, FileNotFoundError, Exception) as e:
-        print(f"Failed to load female sprite at {FEMALE_SPRITE}. Error: {e}. Using placeholder.")
+        log.warning("Failed to load female sprite at %s. Error: %s. Using placeholder.", FEMALE_SPRITE, e)
         female_sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
         female_sprite.fill((255, 105, 180))
 
@@ -107,10 +112,10 @@ def get_player_info(screen):
     while gender_input_active:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in gender input.")
+                log.info("Quit event in gender input.")
                 sys.exit()
             if event.type == pygame.KEYDOWN:
-                print(f"Key pressed in gender input: {event.key}")
+                log.debug("Key pressed in gender input: %s", event.key)
                 if event.key in (pygame.K_m, pygame.K_f):
                     gender = "male" if event.key == pygame.K_m else "female"
                     gender_input_active = False
@@ -127,25 +132,25 @@ def get_player_info(screen):
                 female_sprite_direction *= -1
 
         screen.blit(background, (0, 0))
-        print("Drawing background during gender selection")
+        log.debug("Drawing background during gender selection")
         screen.blit(panel, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 - 100))
-        print("Drawing panel during gender selection")
+        log.debug("Drawing panel during gender selection")
 
         title_text = title_font.render("Select Your Gender", True, WHITE)
         title_shadow = title_font.render("Select Your Gender", True, BLACK)
         screen.blit(title_shadow, (SCREEN_WIDTH // 2 - title_text.get_width() // 2 + 2, 50 + 2))
         screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 50))
-        print("Drawing title text during gender selection")
+        log.debug("Drawing title text during gender selection")
 
         gender_text = font.render(f"Gender: {gender or 'Press M/F'}", True, WHITE)
         gender_shadow = font.render(f"Gender: {gender or 'Press M/F'}", True, BLACK)
         screen.blit(gender_shadow, (SCREEN_WIDTH // 2 - gender_text.get_width() // 2 + 2, SCREEN_HEIGHT // 2 - 20 + 2))
         screen.blit(gender_text, (SCREEN_WIDTH // 2 - gender_text.get_width() // 2, SCREEN_HEIGHT // 2 - 20))
-        print("Drawing gender text during gender selection")
+        log.debug("Drawing gender text during gender selection")
 
         screen.blit(male_sprite, (SCREEN_WIDTH // 2 - 75, male_sprite_y))
         screen.blit(female_sprite, (SCREEN_WIDTH // 2 + 25, female_sprite_y))
-        print("Drawing sprites during gender selection")
+        log.debug("Drawing sprites during gender selection")
 
         error_text = font.render(error_message, True, (255, 0, 0)) if error_message else None
         if error_text:
@@ -162,33 +167,33 @@ def get_player_info(screen):
     for alpha in range(0, 255, 5):
         fade_surface.set_alpha(alpha)
         screen.blit(background, (0, 0))
-        print("Drawing background during fade-out")
+        log.debug("Drawing background during fade-out")
         screen.blit(panel, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 - 100))
-        print("Drawing panel during fade-out")
+        log.debug("Drawing panel during fade-out")
         title_text = title_font.render("Select Your Gender", True, WHITE)
         title_shadow = title_font.render("Select Your Gender", True, BLACK)
         screen.blit(title_shadow, (SCREEN_WIDTH // 2 - title_text.get_width() // 2 + 2, 50 + 2))
         screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 50))
-        print("Drawing title text during fade-out")
+        log.debug("Drawing title text during fade-out")
         gender_text = font.render(f"Gender: {gender}", True, WHITE)
         gender_shadow = font.render(f"Gender: {gender}", True, BLACK)
         screen.blit(gender_shadow, (SCREEN_WIDTH // 2 - gender_text.get_width() // 2 + 2, SCREEN_HEIGHT // 2 - 20 + 2))
         screen.blit(gender_text, (SCREEN_WIDTH // 2 - gender_text.get_width() // 2, SCREEN_HEIGHT // 2 - 20))
-        print("Drawing gender text during fade-out")
+        log.debug("Drawing gender text during fade-out")
         screen.blit(male_sprite, (SCREEN_WIDTH // 2 - 75, male_sprite_y))
         screen.blit(female_sprite, (SCREEN_WIDTH // 2 + 25, female_sprite_y))
-        print("Drawing sprites during fade-out")
+        log.debug("Drawing sprites during fade-out")
         screen.blit(fade_surface, (0, 0))
-        print(f"Fade-out alpha: {alpha}")
+        log.debug("Fade-out alpha: %s", alpha)
         pygame.display.flip()
         pygame.time.delay(20)
 
     screen.fill(BLACK)
     pygame.display.flip()
-    print("Cleared screen before transition")
+    log.debug("Cleared screen before transition")
     pygame.event.clear()
-    print("Cleared event queue before transition")
+    log.debug("Cleared event queue before transition")
     pygame.time.delay(500)
 
-    print("Exiting get_player_info with name:", name, "and gender:", gender)
+    log.debug("Exiting get_player_info with name: %s and gender: %s", name, gender)
     return name, gender, player_sprite
\ No newline at end of file
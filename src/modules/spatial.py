@@ -0,0 +1,141 @@
+# src/modules/spatial.py
+from src.config import TILE_SIZE
+
+class SpatialHash:
+    # Uniform-grid broadphase. Entries are keyed by id() because pygame.Rect (and tuples holding one)
+    # are unhashable; rect_of maps an entry to its current rect.
+    def __init__(self, cell_size=TILE_SIZE, rect_of=None):
+        self.cell_size = cell_size
+        self.rect_of = rect_of if rect_of is not None else (lambda obj: obj)
+        self.buckets = {}
+        self.entries = {}  # id(obj) -> [obj, tag, cell span, registration order]
+        self.counter = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def span(self, rect):
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                max(rect.left, rect.right - 1) // size, max(rect.top, rect.bottom - 1) // size)
+
+    def link(self, key, span):
+        x0, y0, x1, y1 = span
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = self.buckets.get((cx, cy))
+                if bucket is None:
+                    bucket = self.buckets[(cx, cy)] = set()
+                bucket.add(key)
+
+    def unlink(self, key, span):
+        x0, y0, x1, y1 = span
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = self.buckets.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self.buckets[(cx, cy)]
+
+    def insert(self, obj, tag=None):
+        key = id(obj)
+        if key in self.entries:
+            self.update(obj)
+            return
+        span = self.span(self.rect_of(obj))
+        self.entries[key] = [obj, tag, span, self.counter]
+        self.counter += 1
+        self.link(key, span)
+
+    def update(self, obj):
+        # Call after an entry moves; only touches buckets when it crosses a cell boundary
+        entry = self.entries.get(id(obj))
+        if entry is None:
+            return
+        span = self.span(self.rect_of(obj))
+        if span != entry[2]:
+            self.unlink(id(obj), entry[2])
+            self.link(id(obj), span)
+            entry[2] = span
+
+    def remove(self, obj):
+        entry = self.entries.pop(id(obj), None)
+        if entry is not None:
+            self.unlink(id(obj), entry[2])
+
+    def clear(self):
+        self.buckets.clear()
+        self.entries.clear()
+
+    def sync(self, objects, tag=None):
+        # Make the entries carrying `tag` match `objects`: register new ones, re-bucket moved ones, drop the rest
+        present = set()
+        for obj in objects:
+            present.add(id(obj))
+            if id(obj) in self.entries:
+                self.update(obj)
+            else:
+                self.insert(obj, tag)
+        for key, entry in list(self.entries.items()):
+            if entry[1] == tag and key not in present:
+                self.remove(entry[0])
+
+    def candidates(self, rect):
+        keys = set()
+        x0, y0, x1, y1 = self.span(rect)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = self.buckets.get((cx, cy))
+                if bucket:
+                    keys.update(bucket)
+        return keys
+
+    def nearby(self, rect):
+        # Lazily yields the entries bucketed under rect (possibly more than once, possibly a few outside it),
+        # for early-exit scans; a wide rect over a sparse hash just walks the entries
+        x0, y0, x1, y1 = self.span(rect)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self.entries):
+            for entry in list(self.entries.values()):
+                yield entry[0]
+            return
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = self.buckets.get((cx, cy))
+                if bucket:
+                    for key in bucket:
+                        yield self.entries[key][0]
+
+    def query(self, rect, tag=None):
+        # Entries overlapping rect, in registration order so results match a linear scan of the source list
+        hits = []
+        for key in self.candidates(rect):
+            obj, entry_tag, _, order = self.entries[key]
+            if (tag is None or entry_tag == tag) and rect.colliderect(self.rect_of(obj)):
+                hits.append((order, obj))
+        hits.sort(key=lambda hit: hit[0])
+        return [obj for _, obj in hits]
+
+    def pairs(self, tag_a=None, tag_b=None):
+        # Each overlapping pair once; with tags, only (tag_a, tag_b) pairs, yielded in that order
+        seen = set()
+        for bucket in self.buckets.values():
+            if len(bucket) < 2:
+                continue
+            keys = sorted(bucket, key=lambda key: self.entries[key][3])
+            for i, key_a in enumerate(keys):
+                for key_b in keys[i + 1:]:
+                    first, second = key_a, key_b
+                    if tag_a is not None or tag_b is not None:
+                        tags = (self.entries[first][1], self.entries[second][1])
+                        if tags == (tag_b, tag_a) and tag_a != tag_b:
+                            first, second = second, first
+                        elif tags != (tag_a, tag_b):
+                            continue
+                    if (first, second) in seen:
+                        continue
+                    seen.add((first, second))
+                    obj_a = self.entries[first][0]
+                    obj_b = self.entries[second][0]
+                    if self.rect_of(obj_a).colliderect(self.rect_of(obj_b)):
+                        yield obj_a, obj_b
@@ -0,0 +1,141 @@
+# src/modules/spawning.py
+import time
+import pygame
+from src.config import TILE_SIZE, HUD_HEIGHT, MAZE_WIDTH, MAZE_HEIGHT
+from src.modules import hitches
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+# Placement rules per spawn kind (pixel distances, measured between top-left corners as before)
+SPAWN_RULES = {
+    "enemy": {"entry_distance": 100, "exit_distance": 100, "player_distance": 150, "separation": 200,
+              "near_wall": False, "interior": False},
+    "npc": {"entry_distance": 100, "exit_distance": 100, "player_distance": 200, "separation": 0,
+            "near_wall": True, "interior": True}
+}
+
+
+def quadrant_of(x, y):
+    # Quadrant index (top-left, top-right, bottom-left, bottom-right) of a pixel position, or None off the maze
+    column = x // TILE_SIZE
+    row = (y - HUD_HEIGHT) // TILE_SIZE
+    if not (0 <= column < MAZE_WIDTH and 0 <= row < MAZE_HEIGHT):
+        return None
+    return int(column >= MAZE_WIDTH // 2) + 2 * int(row >= MAZE_HEIGHT // 2)
+
+
+class SpawnService:
+    # Per-scene spawn points. Tiles that satisfy a kind's static rules (walls, entry/exit distance) are
+    # worked out once per maze version and rect size and bucketed by quadrant; reserve() then only has to
+    # check the moving constraints (player distance, separation from other sapas) on a few random picks.
+    def __init__(self, scene, tries=12):
+        self.scene = scene
+        self.tries = tries
+        self.candidates = {}  # (kind, width, height) -> [tiles per quadrant], [every tile that fits]
+        self.version = None
+        self.occupancy = [0] * 4
+        self.reserved = []  # enemy rects handed out since the last track(); sapa_index only has them after that
+
+    def track(self, enemies):
+        # Call once per tick after enemies move; reserve() fills the emptiest quadrant first
+        occupancy = [0] * 4
+        for enemy in enemies:
+            quadrant = quadrant_of(enemy.rect.x, enemy.rect.y)
+            if quadrant is not None:
+                occupancy[quadrant] += 1
+        self.occupancy = occupancy
+        self.reserved = []
+
+    def build(self, kind, width, height):
+        log.debug("Building %s spawn candidates for %sx%s...", kind, width, height)
+        rules = SPAWN_RULES[kind]
+        maze = self.scene.maze
+        entry_x, entry_y = maze.entry[0] * TILE_SIZE, maze.entry[1] * TILE_SIZE + HUD_HEIGHT
+        exit_x, exit_y = maze.exit[0] * TILE_SIZE, maze.exit[1] * TILE_SIZE + HUD_HEIGHT
+        by_quadrant = [[], [], [], []]
+        fits = []
+        margin = 1 if rules["interior"] else 0
+        for row in range(margin, MAZE_HEIGHT - margin):
+            for column in range(margin, MAZE_WIDTH - margin):
+                x, y = column * TILE_SIZE, row * TILE_SIZE + HUD_HEIGHT
+                if maze.collides(pygame.Rect(x, y, width, height)):
+                    continue
+                fits.append((x, y))
+                if (x - entry_x) ** 2 + (y - entry_y) ** 2 <= rules["entry_distance"] ** 2:
+                    continue
+                if (x - exit_x) ** 2 + (y - exit_y) ** 2 <= rules["exit_distance"] ** 2:
+                    continue
+                if rules["near_wall"] and not any(
+                        0 <= column + dx < MAZE_WIDTH and 0 <= row + dy < MAZE_HEIGHT and maze.grid[row + dy][column + dx] == 1
+                        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]):
+                    continue
+                by_quadrant[quadrant_of(x, y)].append((x, y))
+        return by_quadrant, fits
+
+    def buckets(self, kind, width, height):
+        if self.version != self.scene.maze.version:
+            # Carving or a replayed delta changed the walls
+            self.candidates.clear()
+            self.version = self.scene.maze.version
+        key = (kind, width, height)
+        if key not in self.candidates:
+            self.candidates[key] = self.build(kind, width, height)
+        return self.candidates[key]
+
+    def allowed(self, x, y, rules):
+        player = self.scene.player.rect
+        if (x - player.x) ** 2 + (y - player.y) ** 2 <= rules["player_distance"] ** 2:
+            return False
+        separation = rules["separation"]
+        if separation:
+            area = pygame.Rect(x - separation, y - separation, separation * 2, separation * 2)
+            limit = separation ** 2
+            for sapa in self.scene.sapa_index.nearby(area):
+                if (x - sapa.rect.x) ** 2 + (y - sapa.rect.y) ** 2 < limit:
+                    return False
+            for rect in self.reserved:
+                if (x - rect.x) ** 2 + (y - rect.y) ** 2 < limit:
+                    return False
+        return True
+
+    def reserve(self, kind, width=TILE_SIZE, height=TILE_SIZE, rng=None):
+        # Returns a Rect for a new entity of this kind: the emptiest quadrant first, then the others,
+        # then any tile it fits in, then (1, 1)
+        rng = rng if rng is not None else self.scene.rng
+        rules = SPAWN_RULES[kind]
+        start = time.perf_counter()
+        by_quadrant, fits = self.buckets(kind, width, height)
+        if kind == "enemy":
+            fewest = min(self.occupancy)
+            first = rng.choice([i for i in range(4) if self.occupancy[i] == fewest])
+            order = [first] + sorted((i for i in range(4) if i != first), key=lambda i: self.occupancy[i])
+        else:
+            first = rng.randrange(4)
+            order = [(first + i) % 4 for i in range(4)]
+        retries = 0
+        for quadrant in order:
+            tiles = by_quadrant[quadrant]
+            if not tiles:
+                continue
+            for _ in range(self.tries):
+                x, y = tiles[rng.randrange(len(tiles))]
+                if self.allowed(x, y, rules):
+                    if retries:
+                        hitches.note_since("spawn_retries", f"{kind} x{retries}", start)
+                    return self.claim(kind, pygame.Rect(x, y, width, height))
+                retries += 1
+        hitches.note_since("spawn_retries", f"{kind} x{retries}, fallback", start)
+        if fits:
+            x, y = fits[rng.randrange(len(fits))]
+            return self.claim(kind, pygame.Rect(x, y, width, height))
+        log.warning("no spawn tile fits a %sx%s %s. Placing at default position (1, 1).", width, height, kind)
+        return pygame.Rect(TILE_SIZE, TILE_SIZE + HUD_HEIGHT, width, height)
+
+    def claim(self, kind, rect):
+        if kind == "enemy":
+            quadrant = quadrant_of(rect.x, rect.y)
+            if quadrant is not None:
+                self.occupancy[quadrant] += 1
+            self.reserved.append(rect)
+        return rect
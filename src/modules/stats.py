@@ -0,0 +1,7 @@
+# src/modules/stats.py
+import math
+
+
+def percentile(ordered, fraction):
+    # Nearest rank on an already sorted list; 0 for an empty one
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)] if ordered else 0
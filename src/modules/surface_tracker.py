@@ -0,0 +1,148 @@
+# src/modules/surface_tracker.py
+# --track-surfaces: counts pygame surface allocations and their pixel bytes per frame, by call site.
+# pygame.Surface and Font become tracking subclasses, pygame.transform functions are wrapped, and Surface
+# methods that copy pixels (C methods of an immutable type, so they can't be wrapped) are seen through a
+# profile hook. Debug only: the hook slows every Python call down.
+import atexit
+import os
+import sys
+import pygame
+import pygame.sysfont
+from src.config import ROOT_DIR
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+RealSurface = pygame.Surface
+RealFont = pygame.font.Font
+COPY_METHODS = {"copy", "convert", "convert_alpha"}
+TRANSFORMS = ["scale", "scale_by", "smoothscale", "smoothscale_by", "rotate", "rotozoom", "flip", "scale2x", "chop",
+              "laplacian", "grayscale", "box_blur", "gaussian_blur", "average_surfaces"]
+
+_installed = False
+_sites = {}  # "file:line (function)" -> [allocations, bytes, frames seen, peak allocations in a frame]
+_frame = {}  # site -> [allocations, bytes] this frame
+_frames = 0
+_peak_frame = (0, 0)  # (allocations, bytes) of the worst frame
+
+
+def _site(frame):
+    # First frame outside this module, as a path relative to the project
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    path = os.path.relpath(frame.f_code.co_filename, ROOT_DIR)
+    if path.startswith(".."):
+        path = os.path.basename(frame.f_code.co_filename)
+    return f"{path}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+def _record(surface, frame=None, size=None):
+    if size is None:
+        if not isinstance(surface, RealSurface):
+            return
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+    site = _site(frame or sys._getframe(1))
+    entry = _frame.get(site)
+    if entry is None:
+        entry = _frame[site] = [0, 0]
+    entry[0] += 1
+    entry[1] += size
+
+
+class _SurfaceType(type):
+    # Surfaces made by pygame itself (image.load, transform, ...) are still pygame.Surface instances
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, RealSurface)
+
+    def __subclasscheck__(cls, subclass):
+        return issubclass(subclass, RealSurface)
+
+
+class TrackedSurface(RealSurface, metaclass=_SurfaceType):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _record(self)
+
+
+class TrackedFont(RealFont):
+    def render(self, *args, **kwargs):
+        surface = super().render(*args, **kwargs)
+        _record(surface)
+        return surface
+
+
+def _wrap_transform(function):
+    def wrapper(*args, **kwargs):
+        surface = function(*args, **kwargs)
+        _record(surface)
+        return surface
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def _profile_hook(frame, event, arg):
+    if event == "c_call" and arg.__name__ in COPY_METHODS:
+        source = getattr(arg, "__self__", None)
+        if isinstance(source, RealSurface):
+            width, height = source.get_size()
+            depth = 4 if arg.__name__ == "convert_alpha" else source.get_bytesize()
+            _record(None, frame, width * height * depth)
+
+
+def install(report_at_exit=True):
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    pygame.Surface = TrackedSurface
+    pygame.font.Font = pygame.sysfont.Font = TrackedFont
+    for name in TRANSFORMS:
+        function = getattr(pygame.transform, name, None)
+        if function is not None:
+            setattr(pygame.transform, name, _wrap_transform(function))
+    sys.setprofile(_profile_hook)
+    if report_at_exit:
+        atexit.register(report)
+    log.info("Surface allocation tracking enabled.")
+
+
+def installed():
+    return _installed
+
+
+def end_frame():
+    # Folds this frame's allocations into the per-site totals; the main loop calls it once a frame
+    global _frames, _peak_frame
+    if not _installed:
+        return
+    _frames += 1
+    count = total = 0
+    for site, (allocations, size) in _frame.items():
+        entry = _sites.get(site)
+        if entry is None:
+            entry = _sites[site] = [0, 0, 0, 0]
+        entry[0] += allocations
+        entry[1] += size
+        entry[2] += 1
+        entry[3] = max(entry[3], allocations)
+        count += allocations
+        total += size
+    _frame.clear()
+    if count > _peak_frame[0]:
+        _peak_frame = (count, total)
+
+
+def report(limit=15):
+    if not _installed or not _frames:
+        return
+    allocations = sum(entry[0] for entry in _sites.values())
+    size = sum(entry[1] for entry in _sites.values())
+    print(f"=== Surface allocations over {_frames} frames ===")
+    print(f"Per frame: {allocations / _frames:.1f} surfaces, {size / _frames / 1024:.1f} KB "
+          f"(worst frame {_peak_frame[0]} surfaces, {_peak_frame[1] / 1024:.1f} KB)")
+    print(f"  {'per frame':>9} {'KB/frame':>9} {'peak':>6}  call site")
+    for site, (count, total, frames, peak) in sorted(_sites.items(), key=lambda item: -item[1][0])[:limit]:
+        print(f"  {count / _frames:>9.1f} {total / _frames / 1024:>9.1f} {peak:>6}  {site}")
@@ -0,0 +1,170 @@
+# src/modules/telemetry.py
+# Local session telemetry: each session appends JSON lines to TELEMETRY_PATH (one object per event, all
+# tagged with a session id and seconds since the session started). Nothing leaves the machine; the
+# offline report is python -m src.tools.telemetry_report.
+#
+# Events: session_start, scene_build, asset_load, save, load, minigame, scene_frames, session_end.
+# Lines are buffered and appended when the scene changes, when the buffer fills, and at exit.
+import functools
+import json
+import os
+import platform
+import time
+import uuid
+import pygame
+from src.config import TELEMETRY_PATH, TELEMETRY_WINDOW
+from src.modules.logs import get_logger
+from src.modules.stats import percentile
+
+log = get_logger(__name__)
+
+BUFFER_SIZE = 200
+COUNTS = ("sapas", "projectiles", "attacks", "effects", "npcs")
+
+_enabled = False
+_path = None
+_session = None
+_started = 0.0
+_buffer = []
+_frames = 0
+_scene = None  # (area, scene) whose frames are being collected
+_frame_ms = []
+_peaks = {}
+_last_frame = None
+_minigame_start = None
+_minigame_loaded = None
+
+
+def enable(path=None, seed=None):
+    global _enabled, _path, _session, _started
+    _enabled = True
+    _path = path or TELEMETRY_PATH
+    _session = uuid.uuid4().hex[:12]
+    _started = time.perf_counter()
+    event("session_start", time=time.strftime("%Y-%m-%dT%H:%M:%S"), seed=seed, platform=platform.platform(),
+          python=platform.python_version(), pygame=pygame.version.ver)
+    log.info("Session telemetry %s appends to %s", _session, _path)
+
+
+def enabled():
+    return _enabled
+
+
+def elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+def event(kind, **fields):
+    if not _enabled:
+        return
+    record = {"session": _session, "t": round(time.perf_counter() - _started, 3), "type": kind}
+    record.update(fields)
+    _buffer.append(record)
+    if len(_buffer) >= BUFFER_SIZE:
+        flush()
+
+
+def flush():
+    if not _buffer:
+        return
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(_path)), exist_ok=True)
+        with open(_path, "a", encoding="utf-8") as f:
+            for record in _buffer:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+    except OSError as e:
+        log.warning("Failed to append telemetry to %s: %s", _path, e)
+    _buffer.clear()
+
+
+def scene_built(area, scene, start, maze, restored):
+    # End of Scene.__init__: construction time plus the maze generator's bookkeeping
+    if _enabled:
+        stats = maze.stats
+        event("scene_build", area=area, scene=scene, ms=elapsed_ms(start), source=maze.source,
+              attempts=stats["attempts"], fallback_attempts=stats["fallback_attempts"],
+              fallback_placed=stats["fallback_placed"], carved=stats["carved"], restored=restored)
+
+
+def asset_loaded(path, start, category):
+    if _enabled:
+        event("asset_load", path=os.path.basename(path), category=category, ms=elapsed_ms(start))
+
+
+def _close_window():
+    global _frame_ms
+    if _scene is None or not _frame_ms:
+        return
+    ordered = sorted(_frame_ms)
+    # Whole-millisecond histogram so the report can merge percentiles across visits and sessions
+    histogram = {}
+    for ms in ordered:
+        bucket = str(int(ms))
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+    event("scene_frames", area=_scene[0], scene=_scene[1], frames=len(ordered),
+          p50=round(percentile(ordered, 0.5), 3), p95=round(percentile(ordered, 0.95), 3),
+          p99=round(percentile(ordered, 0.99), 3), max=round(ordered[-1], 3),
+          mean=round(sum(ordered) / len(ordered), 3), peaks=dict(_peaks), histogram=histogram)
+    _frame_ms = []
+    _peaks.clear()
+
+
+def frame(area, scene, counts, modal=None):
+    # Once per main-loop frame with the entity counts the overlay shows; the time is measured from the
+    # previous call, so it is the frame interval the player saw. A frame that ran a modal screen
+    # (hitches.modal_this_frame()) lasted as long as the screen was open and is left out.
+    global _scene, _last_frame, _frames
+    if not _enabled:
+        return
+    now = time.perf_counter()
+    if (area, scene) != _scene:
+        _close_window()
+        flush()
+        _scene = (area, scene)
+    elif _last_frame is not None and modal is None:
+        _frame_ms.append((now - _last_frame) * 1000)
+        for key in COUNTS:
+            value = counts.get(key, 0)
+            if value > _peaks.get(key, 0):
+                _peaks[key] = value
+        if len(_frame_ms) >= TELEMETRY_WINDOW:
+            _close_window()
+    _last_frame = now
+    _frames += 1
+
+
+def minigame(name):
+    # Decorator for the minigame entry points: load time runs until minigame_loaded() (just before the
+    # game loop), duration until the function returns
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            global _minigame_start, _minigame_loaded
+            if not _enabled:
+                return function(*args, **kwargs)
+            _minigame_start, _minigame_loaded = time.perf_counter(), None
+            result = "error"
+            try:
+                outcome = function(*args, **kwargs)
+                result = {True: "won", False: "lost", None: "cancelled"}.get(outcome, str(outcome))
+                return outcome
+            finally:
+                load_ms = round((_minigame_loaded - _minigame_start) * 1000, 3) if _minigame_loaded else None
+                event("minigame", name=name, load_ms=load_ms, duration_ms=elapsed_ms(_minigame_start), result=result)
+        return wrapper
+    return decorate
+
+
+def minigame_loaded():
+    global _minigame_loaded
+    if _enabled and _minigame_loaded is None:
+        _minigame_loaded = time.perf_counter()
+
+
+def write():
+    # atexit: closes the open frame window and appends everything left
+    if not _enabled:
+        return
+    _close_window()
+    event("session_end", duration_s=round(time.perf_counter() - _started, 3), frames=_frames)
+    flush()
@@ -0,0 +1,64 @@
+# src/modules/timestep.py
+import time
+from src.config import SIMULATION_HZ, MAX_FRAME_TIME, TILE_SIZE
+
+class FixedTimestep:
+    # Accumulates real time and hands it out in fixed SIMULATION_HZ ticks, so gameplay speed
+    # no longer depends on how fast frames are rendered.
+    def __init__(self, hz=SIMULATION_HZ, max_frame_time=MAX_FRAME_TIME, clock=time.perf_counter):
+        self.dt = 1.0 / hz
+        self.max_frame_time = max_frame_time
+        # Seconds as a float; the input recorder swaps in a clock it can capture and replay
+        self.clock = clock
+        self.accumulator = 0.0
+        self.last_time = clock()
+        self.ticks = 0
+
+    def advance(self):
+        now = self.clock()
+        # Clamp so a long stall (window drag, hitch) doesn't trigger a burst of catch-up ticks; main resets
+        # the timestep after modal screens
+        self.accumulator = min(self.accumulator + (now - self.last_time), self.max_frame_time)
+        self.last_time = now
+
+    def step(self):
+        if self.accumulator >= self.dt:
+            self.accumulator -= self.dt
+            self.ticks += 1
+            return True
+        return False
+
+    def alpha(self):
+        # How far the render time is between the previous and the latest simulation state
+        return self.accumulator / self.dt
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.last_time = self.clock()
+
+class Interpolator:
+    # Remembers where moving rects were before the latest tick and, while drawing, temporarily places
+    # them between that and their current position.
+    def __init__(self, snap_distance=TILE_SIZE * 2):
+        self.snap_distance = snap_distance
+        self.previous = {}
+        self.restore = []
+
+    def capture(self, rects):
+        self.previous = {id(rect): (rect, rect.x, rect.y) for rect in rects}
+
+    def begin(self, alpha):
+        self.restore = []
+        for rect, previous_x, previous_y in self.previous.values():
+            current_x, current_y = rect.x, rect.y
+            # Teleports (scene changes, respawns) should not smear across the screen
+            if abs(current_x - previous_x) > self.snap_distance or abs(current_y - previous_y) > self.snap_distance:
+                continue
+            self.restore.append((rect, current_x, current_y))
+            rect.x = round(previous_x + (current_x - previous_x) * alpha)
+            rect.y = round(previous_y + (current_y - previous_y) * alpha)
+
+    def end(self):
+        for rect, x, y in self.restore:
+            rect.x, rect.y = x, y
+        self.restore = []
@@ -4,10 +4,16 @@ from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, BLACK, GOLD, DEF
 from src.utils import wrap_text
 from src.modules.npcs import NPC
 from src.modules.game_state import save_game, load_game
+from src.modules import frame_stats, hitches
+from src.modules.profiling import timed
+from src.modules.context_profile import profiled, dialogue as dialogue_context
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
 
 class DialogueBox:
     def __init__(self):
-        self.active = False
+        self._active = False
         self.lines = []
         self.current_line = 0
         self.context = "default"
@@ -16,13 +22,27 @@ class DialogueBox:
             self.speaker_font = pygame.font.SysFont(DEFAULT_FONT, 24, bold=True)
             self.prompt_font = pygame.font.SysFont(DEFAULT_FONT, 20)
         except pygame.error:
-            print(f"Failed to load font '{DEFAULT_FONT}'. Using default font.")
+            log.warning("Failed to load font '%s'. Using default font.", DEFAULT_FONT)
             self.font = pygame.font.Font(None, 36)
             self.speaker_font = pygame.font.Font(None, 24)
             self.prompt_font = pygame.font.Font(None, 20)
         self.max_width = int(SCREEN_WIDTH * 0.8) - 20
         self.show_prompt = True
 
+    @property
+    def active(self):
+        return self._active
+
+    @active.setter
+    def active(self, value):
+        # Menus and prompts open and close the box from many places; --profile follows it from here
+        if value != self._active:
+            dialogue_context(value)
+            if value:
+                # main's inline dialogue loops block inside the frame that opens the box
+                hitches.modal("dialogue")
+        self._active = value
+
     def show(self, lines, show_prompt=True, context="default"):
         self.lines = lines
         self.current_line = 0
@@ -35,6 +55,7 @@ class DialogueBox:
         if self.current_line >= len(self.lines):
             self.active = False
 
+    @timed("render.dialogue")
     def draw(self, screen):
         if not self.active or self.current_line >= len(self.lines):
             return
@@ -58,6 +79,7 @@ class DialogueBox:
             pygame.draw.rect(glow_surface, (GOLD[0], GOLD[1], GOLD[2], 50 - i * 10),
                              (i, i, box_width + 20 - 2 * i, box_height + 20 - 2 * i), 2)
 
+        frame_stats.surfaces += 2
         screen.blit(glow_surface, (box_x - 10, box_y - 10))
         screen.blit(dialogue_box, (box_x, box_y))
 
@@ -123,8 +145,9 @@ class DialogueBox:
             screen.blit(space_cue_shadow, (space_rect.x + 1, space_rect.y + 1))
             screen.blit(space_cue_text, space_rect)
 
+@profiled("tutorial")
 def show_tutorial(screen, dialogue_box, ui_background):
-    print("Showing tutorial...")
+    log.info("Showing tutorial...")
     tutorial_lines = [
         "Welcome to A Superseed Odyssey!",
         "Controls: Arrow keys to move, J to melee attack, K for ranged attack, E to interact.",
@@ -137,11 +160,11 @@ def show_tutorial(screen, dialogue_box, ui_background):
     while dialogue_box.active:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in tutorial.")
+                log.info("Quit event in tutorial.")
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN:
-                print(f"Key pressed in tutorial: {event.key}")
+                log.debug("Key pressed in tutorial: %s", event.key)
                 if event.key == pygame.K_SPACE:
                     dialogue_box.next_line()
                 elif event.key == pygame.K_ESCAPE:
@@ -152,8 +175,9 @@ def show_tutorial(screen, dialogue_box, ui_background):
         dialogue_box.draw(screen)
         pygame.display.flip()
 
+@profiled("pause_menu")
 def show_pause_menu(screen, player, dialogue_box, ui_background, world, checkpoints, music_volume, sfx_volume, vitalik_freed, choice_made, self_save_choice_made, vitalik, current_scene):
-    print("Showing pause menu...")
+    log.info("Showing pause menu...")
     options = [
         "Resume (ESC)",
         "Tutorial (T)",
@@ -180,11 +204,11 @@ def show_pause_menu(screen, player, dialogue_box, ui_background, world, checkpoi
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in pause menu.")
+                log.info("Quit event in pause menu.")
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN:
-                print(f"Key pressed in pause menu: {event.key}")
+                log.debug("Key pressed in pause menu: %s", event.key)
                 if event.key == pygame.K_UP:
                     selected = (selected - 1) % len(options)
                 elif event.key == pygame.K_DOWN:
@@ -509,19 +533,20 @@ def show_pause_menu(screen, player, dialogue_box, ui_background, world, checkpoi
 
     return show_minimap
 
+@profiled("easy_mode_prompt")
 def prompt_easy_mode(screen, dialogue_box, player, ui_background):
-    print("Prompting easy mode switch...")
+    log.info("Prompting easy mode switch...")
     dialogue_box.show(["You've lost 3 times in a row...switch to easy mode? Press Y/N to decide."], show_prompt=True, context="default")
     choice_made = False
 
     while not choice_made:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in easy mode prompt.")
+                log.info("Quit event in easy mode prompt.")
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN:
-                print(f"Key pressed in easy mode prompt: {event.key}")
+                log.debug("Key pressed in easy mode prompt: %s", event.key)
                 if event.key == pygame.K_y:
                     player.easy_mode = True
                     choice_made = True
@@ -538,15 +563,16 @@ def prompt_easy_mode(screen, dialogue_box, player, ui_background):
         dialogue_box.draw(screen)
         pygame.display.flip()
 
+@profiled("game_over")
 def prompt_game_over(screen, dialogue_box, player, world, checkpoints, ui_background):
-    print("Prompting game over...")
+    log.info("Prompting game over...")
     pygame.mixer.music.stop()
     try:
         pygame.mixer.music.load(SOUND_CUTSCENE_MUSIC)
         pygame.mixer.music.play(-1)
-        print("Cutscene music loaded and playing for game over.")
+        log.info("Cutscene music loaded and playing for game over.")
     except pygame.error as e:
-        print(f"Failed to load cutscene music for game over: {e}. Continuing without music.")
+        log.warning("Failed to load cutscene music for game over: %s. Continuing without music.", e)
 
     has_checkpoint = checkpoints.has_checkpoint()
     message = ["Vitalik: Infection has taken over! Choose an option:"]
@@ -557,11 +583,11 @@ def prompt_game_over(screen, dialogue_box, player, world, checkpoints, ui_backgr
     while not choice_made:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                print("Quit event in game over prompt.")
+                log.info("Quit event in game over prompt.")
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN:
-                print(f"Key pressed in game over prompt: {event.key}")
+                log.debug("Key pressed in game over prompt: %s", event.key)
                 if event.key == pygame.K_s:
                     choice = "start_over"
                     choice_made = True
@@ -572,7 +598,7 @@ def prompt_game_over(screen, dialogue_box, player, world, checkpoints, ui_backgr
                     choice = "restart_area"
                     choice_made = True
                 elif event.key == pygame.K_ESCAPE:
-                    print("Game over prompt closed by user.")
+                    log.info("Game over prompt closed by user.")
                     pygame.quit()
                     sys.exit()
                 elif event.key == pygame.K_SPACE:
@@ -590,8 +616,8 @@ def prompt_game_over(screen, dialogue_box, player, world, checkpoints, ui_backgr
     try:
         pygame.mixer.music.load(SOUND_GAME_MUSIC)
         pygame.mixer.music.play(-1)
-        print("Game music restored after game over prompt.")
+        log.info("Game music restored after game over prompt.")
     except pygame.error as e:
-        print(f"Failed to load game music after game over: {e}. Continuing without music.")
+        log.warning("Failed to load game music after game over: %s. Continuing without music.", e)
 
     return choice
\ No newline at end of file
@@ -1,6 +1,8 @@
 import pygame
 import random
 import os
+import math
+import time
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, MAZE_WIDTH, MAZE_HEIGHT, \
     AREA_0_BACKGROUND, AREA_1_BACKGROUND, AREA_2_BACKGROUND, AREA_3_BACKGROUND, AREA_4_BACKGROUND, AREA_5_BACKGROUND, \
     HUD_HEIGHT, AREA_0_FLOOR, AREA_0_WALL, AREA_1_FLOOR, AREA_1_WALL, AREA_2_FLOOR, AREA_2_WALL, \
@@ -8,13 +10,68 @@ from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, MAZE_WIDTH, MAZE_
     SWORD_SPRITE, TOKEN_SPRITE, CHECKPOINT_SPRITE, FRAGMENT_SPRITE
 from src.modules.enemies import Sapa, SplitterSapa, ProjectileSapa, ChaserSapa, DiagonalSapa, BossArea1, BossArea2, \
     BossArea3, BossArea4, BossArea5, Skuld
+from src.modules.rng import RngStreams, derive_seed, make_rng, new_seed
+from src.modules.mazepack import get_maze_pack
+from src.modules.spatial import SpatialHash
+from src.modules.assets import load_image, shared_surface
+from src.modules import frame_stats, hitches, telemetry
+from src.modules.profiling import timed
+from src.modules.enemy_pool import EnemyPool
+from src.modules.pathing import FlowField
+from src.modules.spawning import SpawnService
 from collections import deque
+from src.modules.logs import get_logger
+
+log = get_logger(__name__)
+
+class CellPool:
+    # Set of grid cells with O(1) add, discard and uniform random pick (swap-remove list + index map)
+    def __init__(self):
+        self.cells = []
+        self.index = {}
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        return cell in self.index
+
+    def add(self, cell):
+        if cell not in self.index:
+            self.index[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def discard(self, cell):
+        position = self.index.pop(cell, None)
+        if position is None:
+            return
+        last = self.cells.pop()
+        if position < len(self.cells):
+            self.cells[position] = last
+            self.index[last] = position
+
+    def pick(self, rng):
+        return self.cells[rng.randrange(len(self.cells))]
 
 class Maze:
     def __init__(self, num_crosses=8, cross_size_range=(1, 3), shape_weights=None, min_cross_distance=2,
-                 min_path_length=5):  # Reduced min_path_length to 5
-        print("Entering Maze.__init__...")
+                 min_path_length=5, rng=None):  # Reduced min_path_length to 5
+        log.debug("Entering Maze.__init__...")
         try:
+            # All layout decisions draw from this stream so a seeded rng reproduces the maze exactly
+            self.rng = rng if rng is not None else random.Random()
+            # Generator bookkeeping for benchmarks and diagnostics
+            self.stats = {
+                "attempts": 0,
+                "placed": 0,
+                "fallback_attempts": 0,
+                "fallback_placed": 0,
+                "carved": False
+            }
+            # Cells with 2-wide clearance, bucketed by distance to entry/exit; built once the layout is final
+            self.free_cells = None
+            # Bumped on every set_cell so derived data (e.g. FlowField) knows the layout changed
+            self.version = 0
             self.width = MAZE_WIDTH
             self.height = MAZE_HEIGHT
             self.grid = self.create_arena()
@@ -29,13 +86,36 @@ class Maze:
                 min_path_length=min_path_length
             )
             if not self.is_connected(self.entry, self.exit):
-                print("Connectivity broken, carving fallback path...")
+                log.info("Connectivity broken, carving fallback path...")
                 self.carve_path(self.entry, self.exit)
-            print("Maze initialized successfully.")
+                self.stats["carved"] = True
+            # Pristine layout, used to express later carving as a small per-scene delta
+            self.base_grid = [row[:] for row in self.grid]
+            self.build_free_cells()
+            self.source = "generated"
+            log.debug("Maze initialized successfully.")
         except Exception as e:
-            print(f"Error in Maze.__init__: {e}")
+            log.error("Error in Maze.__init__: %s", e)
             raise
 
+    @classmethod
+    def from_layout(cls, grid, entry, exit_, rng=None, source="layout"):
+        # Wraps an already validated layout (e.g. a maze pack record) without running the generator
+        maze = cls.__new__(cls)
+        maze.rng = rng if rng is not None else random.Random()
+        maze.stats = {"attempts": 0, "placed": 0, "fallback_attempts": 0, "fallback_placed": 0, "carved": False}
+        maze.free_cells = None
+        maze.version = 0
+        maze.width = MAZE_WIDTH
+        maze.height = MAZE_HEIGHT
+        maze.grid = grid
+        maze.entry = entry
+        maze.exit = exit_
+        maze.base_grid = [row[:] for row in grid]
+        maze.build_free_cells()
+        maze.source = source
+        return maze
+
     def create_arena(self):
         arena = [[0 for _ in range(self.width)] for _ in range(self.height)]
         for x in range(self.width):
@@ -54,31 +134,31 @@ class Maze:
 
         def pick_opening(side, opposite_pos=None):
             if side == "top":
-                x = random.randrange(1, width - 3) if opposite_pos is None else (width - 1 - opposite_pos)
+                x = self.rng.randrange(1, width - 3) if opposite_pos is None else (width - 1 - opposite_pos)
                 y = 0
                 for i in range(x, x + 2):
                     self.grid[y][i] = 0
                 return (x + 1, y)
             elif side == "bottom":
-                x = random.randrange(1, width - 3) if opposite_pos is None else (width - 1 - opposite_pos)
+                x = self.rng.randrange(1, width - 3) if opposite_pos is None else (width - 1 - opposite_pos)
                 y = height - 1
                 for i in range(x, x + 2):
                     self.grid[y][i] = 0
                 return (x + 1, y)
             elif side == "left":
                 x = 0
-                y = random.randrange(1, height - 3) if opposite_pos is None else (height - 1 - opposite_pos)
+                y = self.rng.randrange(1, height - 3) if opposite_pos is None else (height - 1 - opposite_pos)
                 for i in range(y, y + 2):
                     self.grid[i][x] = 0
                 return (x, y + 1)
             else:  # "right"
                 x = width - 1
-                y = random.randrange(1, height - 3) if opposite_pos is None else (height - 1 - opposite_pos)
+                y = self.rng.randrange(1, height - 3) if opposite_pos is None else (height - 1 - opposite_pos)
                 for i in range(y, y + 2):
                     self.grid[i][x] = 0
                 return (x, y + 1)
 
-        entry_side = random.choice(sides)
+        entry_side = self.rng.choice(sides)
         exit_side = opposite_sides[entry_side]
 
         entry = pick_opening(entry_side)
@@ -95,7 +175,7 @@ class Maze:
             distance = ((entry[0] - exit_[0]) ** 2 + (entry[1] - exit_[1]) ** 2) ** 0.5
             if distance >= 10:
                 break
-            entry_side = random.choice(sides)
+            entry_side = self.rng.choice(sides)
             exit_side = opposite_sides[entry_side]
             entry = pick_opening(entry_side)
             if entry_side in ["top", "bottom"]:
@@ -106,7 +186,7 @@ class Maze:
             attempt += 1
 
         if attempt >= max_attempts:
-            print("Warning: Could not place entry and exit 10 tiles apart after maximum attempts. Using last positions.")
+            log.warning("Could not place entry and exit 10 tiles apart after maximum attempts. Using last positions.")
 
         return entry, exit_
 
@@ -148,6 +228,87 @@ class Maze:
                         queue.append(((nx, ny), dist + 1))
         return None
 
+    def label_components(self):
+        # One flood fill over the whole grid; labels[y][x] is the component id of an open cell, -1 for walls
+        labels = [[-1] * self.width for _ in range(self.height)]
+        label = 0
+        for sy in range(self.height):
+            for sx in range(self.width):
+                if self.grid[sy][sx] != 0 or labels[sy][sx] != -1:
+                    continue
+                labels[sy][sx] = label
+                queue = deque([(sx, sy)])
+                while queue:
+                    x, y = queue.popleft()
+                    for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+                        nx, ny = x + dx, y + dy
+                        if 0 <= nx < self.width and 0 <= ny < self.height:
+                            if self.grid[ny][nx] == 0 and labels[ny][nx] == -1:
+                                labels[ny][nx] = label
+                                queue.append((nx, ny))
+                label += 1
+        return labels
+
+    def connect_targets(self, start, targets):
+        # Make every target reachable from start, carving as few walls as possible. Each round is a
+        # multi-source 0-1 BFS seeded with the whole reachable region (open cells cost 0, interior
+        # walls cost 1) that stops at the first cell belonging to a still-unreached target.
+        carved = []
+        while True:
+            labels = self.label_components()
+            home = labels[start[1]][start[0]]
+            pending = [(x, y) for x, y in targets if home == -1 or labels[y][x] != home]
+            if not pending:
+                return carved
+            goal_labels = {labels[y][x] for x, y in pending if labels[y][x] != -1}
+            goal_cells = set(pending)
+
+            cost = [[None] * self.width for _ in range(self.height)]
+            parent = {}
+            queue = deque()
+            if home == -1:
+                cost[start[1]][start[0]] = 1
+                queue.append(start)
+            else:
+                for y in range(self.height):
+                    for x in range(self.width):
+                        if labels[y][x] == home:
+                            cost[y][x] = 0
+                            queue.append((x, y))
+            found = None
+            while queue:
+                x, y = queue.popleft()
+                if (x, y) in goal_cells or labels[y][x] in goal_labels:
+                    found = (x, y)
+                    break
+                for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+                    nx, ny = x + dx, y + dy
+                    if not (0 <= nx < self.width and 0 <= ny < self.height):
+                        continue
+                    is_wall = self.grid[ny][nx] != 0
+                    interior = 1 <= nx < self.width - 1 and 1 <= ny < self.height - 1
+                    if is_wall and not interior and (nx, ny) not in goal_cells:
+                        continue  # never open the outer border except at a target
+                    step = cost[y][x] + (1 if is_wall else 0)
+                    if cost[ny][nx] is None or step < cost[ny][nx]:
+                        cost[ny][nx] = step
+                        parent[(nx, ny)] = (x, y)
+                        if is_wall:
+                            queue.append((nx, ny))
+                        else:
+                            queue.appendleft((nx, ny))
+            if found is None:
+                log.warning("Could not connect targets %s to %s.", pending, start)
+                return carved
+
+            cell = found
+            while cell is not None:
+                x, y = cell
+                if self.grid[y][x] != 0:
+                    self.set_cell(x, y, 0)
+                    carved.append(cell)
+                cell = parent.get(cell)
+
     def generate_shape_cells(self, center, cross_size, shape_type):
         cx, cy = center
         cells = set()
@@ -172,7 +333,7 @@ class Maze:
                 {(cx - d, cy) for d in range(1, cross_size + 1)},
                 {(cx + d, cy) for d in range(1, cross_size + 1)}
             ]
-            remove_arm = random.choice(arm_options)
+            remove_arm = self.rng.choice(arm_options)
             temp = temp - remove_arm
             cells = cells.union(temp)
         elif shape_type == "L":
@@ -182,7 +343,7 @@ class Maze:
                 [(1, 0), (0, -1)],
                 [(-1, 0), (0, -1)]
             ]
-            arms = random.choice(orientations)
+            arms = self.rng.choice(orientations)
             for dx, dy in arms:
                 for dist in range(1, cross_size + 1):
                     cells.add((cx + dx * dist, cy + dy * dist))
@@ -193,7 +354,7 @@ class Maze:
                 "down_left": [(-1, 0), (0, 1)],
                 "down_right": [(1, 0), (0, 1)]
             }
-            quadrant = random.choice(list(quadrants.keys()))
+            quadrant = self.rng.choice(list(quadrants.keys()))
             for dx, dy in quadrants[quadrant]:
                 for dist in range(1, cross_size + 1):
                     cells.add((cx + dx * dist, cy + dy * dist))
@@ -214,6 +375,7 @@ class Maze:
         placed = 0
         attempts = 0
         max_attempts = num_crosses * 200  # Increased attempts
+        self.stats["requested"] = num_crosses
         placed_centers = []
 
         if shape_weights is None:
@@ -224,15 +386,15 @@ class Maze:
 
         while placed < num_crosses and attempts < max_attempts:
             attempts += 1
-            cx = random.randint(1, width - 2)
-            cy = random.randint(1, height - 2)
+            cx = self.rng.randint(1, width - 2)
+            cy = self.rng.randint(1, height - 2)
             center = (cx, cy)
 
             if any(abs(cx - pcx) + abs(cy - pcy) < min_cross_distance for (pcx, pcy) in placed_centers):
                 continue
 
-            shape_type = random.choices(shape_types, weights=weights, k=1)[0]
-            cross_size = random.randint(cross_size_range[0], cross_size_range[1])
+            shape_type = self.rng.choices(shape_types, weights=weights, k=1)[0]
+            cross_size = self.rng.randint(cross_size_range[0], cross_size_range[1])
             candidate_cells = self.generate_shape_cells(center, cross_size, shape_type)
 
             if any(self.grid[y][x] != 0 for (x, y) in candidate_cells):
@@ -256,18 +418,20 @@ class Maze:
 
             placed_centers.append(center)
             placed += 1
-            print(f"Placed obstacle {placed}/{num_crosses}: Shape {shape_type} at ({cx}, {cy})")
+            log.debug("Placed obstacle %s/%s: Shape %s at (%s, %s)", placed, num_crosses, shape_type, cx, cy)
 
+        self.stats["attempts"] = attempts
+        self.stats["placed"] = placed
         if placed < num_crosses:
-            print(f"Warning: Only placed {placed}/{num_crosses} obstacles after {attempts} attempts. Adding single-tile obstacles as fallback.")
+            log.warning("Only placed %s/%s obstacles after %s attempts. Adding single-tile obstacles as fallback.", placed, num_crosses, attempts)
             # Fallback: Place single-tile obstacles
             remaining = num_crosses - placed
             attempts = 0
             max_fallback_attempts = remaining * 100
             while placed < num_crosses and attempts < max_fallback_attempts:
                 attempts += 1
-                cx = random.randint(1, width - 2)
-                cy = random.randint(1, height - 2)
+                cx = self.rng.randint(1, width - 2)
+                cy = self.rng.randint(1, height - 2)
                 if self.grid[cy][cx] != 0:
                     continue
                 self.grid[cy][cx] = 1
@@ -280,10 +444,12 @@ class Maze:
                         self.grid[cy][cx] = 0
                         continue
                 placed += 1
-                print(f"Placed fallback single-tile obstacle {placed}/{num_crosses} at ({cx}, {cy})")
+                self.stats["fallback_placed"] += 1
+                log.debug("Placed fallback single-tile obstacle %s/%s at (%s, %s)", placed, num_crosses, cx, cy)
+            self.stats["fallback_attempts"] = attempts
 
         if placed < num_crosses:
-            print(f"Warning: Only placed {placed}/{num_crosses} obstacles after all attempts.")
+            log.warning("Only placed %s/%s obstacles after all attempts.", placed, num_crosses)
         return self.grid
 
     def carve_path(self, start, goal):
@@ -302,7 +468,41 @@ class Maze:
                 for dy in range(2):
                     nx, ny = x + dx, y + dy
                     if 0 <= nx < self.width and 0 <= ny < self.height:
-                        self.grid[ny][nx] = 0
+                        self.set_cell(nx, ny, 0)
+
+    def build_free_cells(self):
+        self.free_cells = {
+            "open": CellPool(),  # any cell with 2-wide clearance
+            "clear": CellPool(),  # ...and more than 3 tiles from both entry and exit
+            "near_entry": CellPool()  # ...and within 3 tiles (per axis) of the entry
+        }
+        for y in range(1, self.height - 1):
+            for x in range(1, self.width - 1):
+                self.index_cell(x, y)
+
+    def index_cell(self, x, y):
+        if not (1 <= x <= self.width - 2 and 1 <= y <= self.height - 2):
+            return
+        cell = (x, y)
+        if self.grid[y][x] != 0 or self.grid[y][x + 1] != 0:
+            for pool in self.free_cells.values():
+                pool.discard(cell)
+            return
+        self.free_cells["open"].add(cell)
+        entry_x, entry_y = self.entry
+        exit_x, exit_y = self.exit
+        if (x - entry_x) ** 2 + (y - entry_y) ** 2 > 9 and (x - exit_x) ** 2 + (y - exit_y) ** 2 > 9:
+            self.free_cells["clear"].add(cell)
+        if abs(x - entry_x) <= 3 and abs(y - entry_y) <= 3:
+            self.free_cells["near_entry"].add(cell)
+
+    def set_cell(self, x, y, value):
+        self.grid[y][x] = value
+        self.version += 1
+        if self.free_cells is not None:
+            # A cell's clearance depends on itself and its right-hand neighbour
+            self.index_cell(x, y)
+            self.index_cell(x - 1, y)
 
     def collides(self, rect):
         try:
@@ -319,59 +519,131 @@ class Maze:
                         return True
             return False
         except Exception as e:
-            print(f"Error in Maze.collides: {e}")
+            log.error("Error in Maze.collides: %s", e)
+            raise
+
+    def column_of(self, px):
+        return px // TILE_SIZE
+
+    def row_of(self, py):
+        # Same clamped, non-integer row height that collides() uses
+        tile_height = (SCREEN_HEIGHT - HUD_HEIGHT) / self.height
+        return int(max(0, min((py - HUD_HEIGHT) // tile_height, self.height - 1)))
+
+    def wall_in_column(self, column, row_top, row_bottom):
+        if not 0 <= column < self.width:
+            return False  # Off the sides of the grid (through an opening) is open space
+        for row in range(row_top, row_bottom + 1):
+            if self.grid[row][column] == 1:
+                return True
+        return False
+
+    def wall_in_row(self, row, column_left, column_right):
+        cells = self.grid[row]
+        for column in range(max(0, column_left), min(self.width, column_right + 1)):
+            if cells[column] == 1:
+                return True
+        return False
+
+    def move_and_slide(self, rect, dx, dy):
+        # Sweeps rect by dx (then dy) through the grid and stops flush against the first wall, so
+        # fast movers cannot tunnel and slow ones still reach the wall. Reads rect, never allocates one.
+        # Returns the new (x, y) and whether each axis was blocked.
+        return self.slide(rect.x, rect.y, rect.width, rect.height, dx, dy)
+
+    def slide(self, x, y, width, height, dx, dy):
+        # move_and_slide on plain numbers, for batched movers that keep positions outside Rects
+        try:
+            tile_height = (SCREEN_HEIGHT - HUD_HEIGHT) / self.height
+            blocked_x = blocked_y = False
+
+            target_x = int(round(x + dx))
+            if target_x != x:
+                row_top, row_bottom = self.row_of(y), self.row_of(y + height - 1)
+                if target_x > x:
+                    lead = self.column_of(x + width - 1)
+                    for column in range(lead, self.column_of(target_x + width - 1) + 1):
+                        if self.wall_in_column(column, row_top, row_bottom):
+                            target_x = x if column == lead else max(x, column * TILE_SIZE - width)
+                            blocked_x = True
+                            break
+                else:
+                    lead = self.column_of(x)
+                    for column in range(lead, self.column_of(target_x) - 1, -1):
+                        if self.wall_in_column(column, row_top, row_bottom):
+                            target_x = x if column == lead else min(x, (column + 1) * TILE_SIZE)
+                            blocked_x = True
+                            break
+                x = target_x
+
+            target_y = int(round(y + dy))
+            if target_y != y:
+                column_left, column_right = self.column_of(x), self.column_of(x + width - 1)
+                if target_y > y:
+                    lead = self.row_of(y + height - 1)
+                    for row in range(lead, self.row_of(target_y + height - 1) + 1):
+                        if self.wall_in_row(row, column_left, column_right):
+                            # Lowest bottom edge that still maps to the row above the wall
+                            bottom = math.ceil(HUD_HEIGHT + row * tile_height) - 1
+                            target_y = y if row == lead else max(y, bottom - height + 1)
+                            blocked_y = True
+                            break
+                else:
+                    lead = self.row_of(y)
+                    for row in range(lead, self.row_of(target_y) - 1, -1):
+                        if self.wall_in_row(row, column_left, column_right):
+                            top = math.ceil(HUD_HEIGHT + (row + 1) * tile_height)
+                            target_y = y if row == lead else min(y, top)
+                            blocked_y = True
+                            break
+                y = target_y
+
+            return x, y, blocked_x, blocked_y
+        except Exception as e:
+            log.error("Error in Maze.slide: %s", e)
             raise
 
     def find_open_start_position(self):
-        print("Finding open start position near entry...")
         try:
             entry_x, entry_y = self.entry
-            max_attempts = 100
-            attempt = 0
-            radius = 3
-            while attempt < max_attempts:
-                x = random.randint(max(1, entry_x - radius), min(self.width - 2, entry_x + radius))
-                y = random.randint(max(1, entry_y - radius), min(self.height - 2, entry_y + radius))
-                if self.grid[y][x] == 0 and self.grid[y][x + 1] == 0:
-                    screen_x = x * TILE_SIZE
-                    screen_y = y * TILE_SIZE + HUD_HEIGHT
-                    return screen_x, screen_y
-                attempt += 1
-            print("Warning: Failed to find open start position near entry after maximum attempts. Using entry position.")
+            pool = self.free_cells["near_entry"]
+            if pool:
+                x, y = pool.pick(self.rng)
+                return x * TILE_SIZE, y * TILE_SIZE + HUD_HEIGHT
+            log.warning("No open start position near entry. Using entry position.")
             return entry_x * TILE_SIZE, entry_y * TILE_SIZE + HUD_HEIGHT
         except Exception as e:
-            print(f"Error in Maze.find_open_start_position: {e}")
+            log.error("Error in Maze.find_open_start_position: %s", e)
             raise
 
-    def find_open_position(self):
-        print("Finding open position...")
+    def find_open_position(self, rng=None):
         try:
-            max_attempts = 200
-            attempt = 0
-            while attempt < max_attempts:
-                x = random.randint(1, self.width - 2)
-                y = random.randint(1, self.height - 2)
-                if self.grid[y][x] == 0 and self.grid[y][x + 1] == 0:
-                    entry_distance = ((x - self.entry[0]) ** 2 + (y - self.entry[1]) ** 2) ** 0.5
-                    exit_distance = ((x - self.exit[0]) ** 2 + (y - self.exit[1]) ** 2) ** 0.5
-                    if entry_distance > 3 and exit_distance > 3:
-                        screen_x = x * TILE_SIZE
-                        screen_y = y * TILE_SIZE + HUD_HEIGHT
-                        print(f"Found open position at ({screen_x}, {screen_y})")
-                        return screen_x, screen_y
-                attempt += 1
-            print("Warning: Failed to find open position after maximum attempts. Using default (1, 1).")
+            rng = rng if rng is not None else self.rng
+            pool = self.free_cells["clear"]
+            if not pool:
+                log.warning("No open position away from entry and exit. Using any open cell.")
+                pool = self.free_cells["open"]
+            if pool:
+                x, y = pool.pick(rng)
+                return x * TILE_SIZE, y * TILE_SIZE + HUD_HEIGHT
+            log.warning("Maze has no open position. Using default (1, 1).")
             return TILE_SIZE, TILE_SIZE + HUD_HEIGHT
         except Exception as e:
-            print(f"Error in Maze.find_open_position: {e}")
+            log.error("Error in Maze.find_open_position: %s", e)
             raise
 
 class Scene:
-    def __init__(self, area_id, scene_id, player, vitalik_freed):
-        print(f"Entering Scene.__init__ for Area {area_id}, Scene {scene_id}...")
+    def __init__(self, area_id, scene_id, player, vitalik_freed, seed=None, delta=None):
+        log.debug("Entering Scene.__init__ for Area %s, Scene %s...", area_id, scene_id)
+        start = time.perf_counter()
         try:
             self.area_id = area_id
             self.scene_id = scene_id
+            # Every random decision in this scene comes from a named stream derived from this seed,
+            # so the same seed (and player state) rebuilds the scene bit-for-bit.
+            self.seed = seed if seed is not None else new_seed()
+            self.rngs = RngStreams(self.seed)
+            self.rng = self.stream("elements")
             self.player = player
             self.tokens = []
             self.checkpoints = []
@@ -387,6 +659,11 @@ class Scene:
             self.boss = None
             self.exits = {}
             self.vitalik_freed = vitalik_freed
+            # Broadphase for combat and pickups; synced from the lists above as things move or disappear
+            self.sapa_index = SpatialHash(rect_of=lambda sapa: sapa.rect)
+            # Backing store for every enemy in this scene (see Enemy)
+            self.enemy_pool = EnemyPool(self.stream("enemies"))
+            self.pickup_index = SpatialHash()
 
             background_paths = {
                 0: AREA_0_BACKGROUND,
@@ -397,25 +674,14 @@ class Scene:
                 5: AREA_5_BACKGROUND
             }
             background_path = background_paths.get(area_id, AREA_0_BACKGROUND)
-            self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            try:
-                print(f"Attempting to load area background from: {background_path}")
-                if not os.path.exists(background_path):
-                    raise FileNotFoundError(f"File not found: {background_path}")
-                self.background = pygame.image.load(background_path).convert()
-                self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            except (pygame.error, FileNotFoundError, Exception) as e:
-                print(f"Failed to load area background at {background_path}. Error: {e}. Using placeholder.")
-                for y in range(SCREEN_HEIGHT):
-                    r = 14 + (y / SCREEN_HEIGHT) * (50 - 14)
-                    g = 39 + (y / SCREEN_HEIGHT) * (70 - 39)
-                    b = 59 + (y / SCREEN_HEIGHT) * (100 - 59)
-                    pygame.draw.line(self.background, (int(r), int(g), int(b)), (0, y), (SCREEN_WIDTH, y))
-
-            if self.scene_id == 4:
-                self.maze = Maze(num_crosses=2)
-            else:
-                self.maze = Maze()
+            # Every scene of an area shares one background surface
+            self.background = shared_surface(("background", background_path),
+                                             lambda: self.load_background(background_path), category="backgrounds")
+
+            self.maze = self.build_maze()
+            # Shared by every pursuer in the scene; rebuilt only when the player changes tile
+            self.flow_field = FlowField(self.maze)
+            self.spawns = SpawnService(self)
             self.grid = self.maze.grid
             self.width = self.maze.width
             self.height = self.maze.height
@@ -443,69 +709,92 @@ class Scene:
             self.wall_tile = None
             self.floor_tile = None
             try:
-                print(f"Attempting to load floor tile from: {floor_path}")
+                log.debug("Attempting to load floor tile from: %s", floor_path)
                 if not os.path.exists(floor_path):
                     raise FileNotFoundError(f"File not found: {floor_path}")
-                self.floor_tile = pygame.image.load(floor_path).convert_alpha()
-                self.floor_tile = pygame.transform.scale(self.floor_tile, (TILE_SIZE, TILE_SIZE))
+                self.floor_tile = load_image(floor_path, (TILE_SIZE, TILE_SIZE), category="tiles")
 
-                print(f"Attempting to load wall tile from: {wall_path}")
+                log.debug("Attempting to load wall tile from: %s", wall_path)
                 if not os.path.exists(wall_path):
                     raise FileNotFoundError(f"File not found: {wall_path}")
-                self.wall_tile = pygame.image.load(wall_path).convert_alpha()
-                self.wall_tile = pygame.transform.scale(self.wall_tile, (TILE_SIZE, TILE_SIZE))
+                self.wall_tile = load_image(wall_path, (TILE_SIZE, TILE_SIZE), category="tiles")
             except (pygame.error, FileNotFoundError, Exception) as e:
-                print(f"Failed to load floor/wall tiles: {e}. Will use procedural rendering.")
+                log.warning("Failed to load floor/wall tiles: %s. Will use procedural rendering.", e)
 
             try:
-                print(f"Attempting to load sword sprite from: {SWORD_SPRITE}")
+                log.debug("Attempting to load sword sprite from: %s", SWORD_SPRITE)
                 if not os.path.exists(SWORD_SPRITE):
                     raise FileNotFoundError(f"File not found: {SWORD_SPRITE}")
-                self.sword_sprite = pygame.image.load(SWORD_SPRITE).convert_alpha()
-                self.sword_sprite = pygame.transform.scale(self.sword_sprite, (TILE_SIZE, TILE_SIZE))
+                self.sword_sprite = load_image(SWORD_SPRITE, (TILE_SIZE, TILE_SIZE), category="items")
             except (pygame.error, FileNotFoundError, Exception) as e:
-                print(f"Failed to load sword sprite at {SWORD_SPRITE}. Error: {e}. Using placeholder.")
+                log.warning("Failed to load sword sprite at %s. Error: %s. Using placeholder.", SWORD_SPRITE, e)
                 self.sword_sprite = None
 
             try:
-                print(f"Attempting to load token sprite from: {TOKEN_SPRITE}")
+                log.debug("Attempting to load token sprite from: %s", TOKEN_SPRITE)
                 if not os.path.exists(TOKEN_SPRITE):
                     raise FileNotFoundError(f"File not found: {TOKEN_SPRITE}")
-                self.token_sprite = pygame.image.load(TOKEN_SPRITE).convert_alpha()
-                self.token_sprite = pygame.transform.scale(self.token_sprite, (TILE_SIZE, TILE_SIZE))
+                self.token_sprite = load_image(TOKEN_SPRITE, (TILE_SIZE, TILE_SIZE), category="items")
             except (pygame.error, FileNotFoundError, Exception) as e:
-                print(f"Failed to load token sprite at {TOKEN_SPRITE}. Error: {e}. Using placeholder.")
+                log.warning("Failed to load token sprite at %s. Error: %s. Using placeholder.", TOKEN_SPRITE, e)
                 self.token_sprite = None
 
             try:
-                print(f"Attempting to load checkpoint sprite from: {CHECKPOINT_SPRITE}")
+                log.debug("Attempting to load checkpoint sprite from: %s", CHECKPOINT_SPRITE)
                 if not os.path.exists(CHECKPOINT_SPRITE):
                     raise FileNotFoundError(f"File not found: {CHECKPOINT_SPRITE}")
-                self.checkpoint_sprite = pygame.image.load(CHECKPOINT_SPRITE).convert_alpha()
-                self.checkpoint_sprite = pygame.transform.scale(self.checkpoint_sprite, (TILE_SIZE, TILE_SIZE))
+                self.checkpoint_sprite = load_image(CHECKPOINT_SPRITE, (TILE_SIZE, TILE_SIZE), category="items")
             except (pygame.error, FileNotFoundError, Exception) as e:
-                print(f"Failed to load checkpoint sprite at {CHECKPOINT_SPRITE}. Error: {e}. Using placeholder.")
+                log.warning("Failed to load checkpoint sprite at %s. Error: %s. Using placeholder.", CHECKPOINT_SPRITE, e)
                 self.checkpoint_sprite = None
 
             try:
-                print(f"Attempting to load fragment sprite from: {FRAGMENT_SPRITE}")
+                log.debug("Attempting to load fragment sprite from: %s", FRAGMENT_SPRITE)
                 if not os.path.exists(FRAGMENT_SPRITE):
                     raise FileNotFoundError(f"File not found: {FRAGMENT_SPRITE}")
-                self.fragment_sprite = pygame.image.load(FRAGMENT_SPRITE).convert_alpha()
-                self.fragment_sprite = pygame.transform.scale(self.fragment_sprite, (TILE_SIZE, TILE_SIZE))
+                self.fragment_sprite = load_image(FRAGMENT_SPRITE, (TILE_SIZE, TILE_SIZE), category="items")
             except (pygame.error, FileNotFoundError, Exception) as e:
-                print(f"Failed to load fragment sprite at {FRAGMENT_SPRITE}. Error: {e}. Using placeholder.")
+                log.warning("Failed to load fragment sprite at %s. Error: %s. Using placeholder.", FRAGMENT_SPRITE, e)
                 self.fragment_sprite = None
 
-            self.setup_exits()
-            self.place_elements()
-            print(f"Scene initialized: Area {area_id}, Scene {scene_id}")
+            if delta is not None and delta.get('maze_source', self.maze.source) != self.maze.source:
+                # The saved carving was made on a different layout (e.g. the maze pack was rebuilt)
+                log.info("Saved scene state targets %s, not %s; discarding.", delta.get('maze_source'), self.maze.source)
+                delta = None
+            if delta is not None:
+                self.apply_delta(delta)
+            else:
+                self.setup_exits()
+                self.place_elements()
+            telemetry.scene_built(area_id, scene_id, start, self.maze, delta is not None)
+            hitches.note_since("scene_build", f"area{area_id}_scene{scene_id}", start)
+            log.info("Scene initialized: Area %s, Scene %s", area_id, scene_id)
         except Exception as e:
-            print(f"Error in Scene.__init__: {e}")
+            log.error("Error in Scene.__init__: %s", e)
             raise
 
+    def stream(self, name):
+        return self.rngs.stream(name)
+
+    def sync_pickups(self):
+        self.pickup_index.sync(self.tokens, "token")
+        self.pickup_index.sync(self.checkpoints, "checkpoint")
+        self.pickup_index.sync(self.fragments, "fragment")
+
+    def build_maze(self):
+        config = "num_crosses_2" if self.scene_id == 4 else "default"
+        rng = self.stream("maze")
+        pack = get_maze_pack()
+        picked = pack.pick(config, rng) if pack else None
+        if picked:
+            grid, entry, exit_, source = picked
+            return Maze.from_layout(grid, entry, exit_, rng=rng, source=source)
+        if config == "num_crosses_2":
+            return Maze(num_crosses=2, rng=rng)
+        return Maze(rng=rng)
+
     def setup_exits(self):
-        print("Setting up exits...")
+        log.debug("Setting up exits...")
         try:
             if self.scene_id < 4:
                 self.exits["east"] = (self.area_id, self.scene_id + 1)
@@ -515,15 +804,29 @@ class Scene:
                     self.exits["east"] = (self.area_id + 1, 0)
             elif self.scene_id == 4 and self.area_id > 0 and self.area_id < 5:
                 self.exits["east"] = (self.area_id + 1, 0)
-            print(f"Exits set: {self.exits}")
+            log.info("Exits set: %s", self.exits)
         except Exception as e:
-            print(f"Error in Scene.setup_exits: {e}")
+            log.error("Error in Scene.setup_exits: %s", e)
             raise
 
+    def load_background(self, background_path):
+        try:
+            log.debug("Attempting to load area background from: %s", background_path)
+            return load_image(background_path, (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False, category="backgrounds")
+        except (pygame.error, FileNotFoundError, Exception) as e:
+            log.warning("Failed to load area background at %s. Error: %s. Using placeholder.", background_path, e)
+            background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            for y in range(SCREEN_HEIGHT):
+                r = 14 + (y / SCREEN_HEIGHT) * (50 - 14)
+                g = 39 + (y / SCREEN_HEIGHT) * (70 - 39)
+                b = 59 + (y / SCREEN_HEIGHT) * (100 - 59)
+                pygame.draw.line(background, (int(r), int(g), int(b)), (0, y), (SCREEN_WIDTH, y))
+            return background
+
     def place_elements(self):
-        print("Placing elements in scene...")
+        log.debug("Placing elements in scene...")
         try:
-            for _ in range(random.randint(1, 3)):
+            for _ in range(self.rng.randint(1, 3)):
                 x, y = self.find_open_position()
                 token = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
                 self.tokens.append(token)
@@ -536,7 +839,7 @@ class Scene:
             if self.area_id == 0 and self.scene_id == 4 and not self.player.inventory.has_sword:
                 x, y = self.find_open_position()
                 self.sword = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-                print(f"Sword placed at ({x}, {y}) in Area 0, Scene 4")
+                log.info("Sword placed at (%s, %s) in Area 0, Scene 4", x, y)
 
             if self.scene_id == 4 and self.area_id > 0 and hasattr(self.player,
                                                                    'world_choice_made') and self.player.world_choice_made:
@@ -557,49 +860,23 @@ class Scene:
                 elif self.area_id == 6:
                     self.boss = Skuld(self, self.player.level)
 
-            start_x = max(0, min(self.player.rect.x // TILE_SIZE, self.width - 1))
-            start_y = max(0, min((self.player.rect.y - HUD_HEIGHT) // TILE_SIZE, self.height - 1))
-            start = (start_x, start_y)
-
-            for token in self.tokens:
-                goal_x = max(0, min(token.x // TILE_SIZE, self.width - 1))
-                goal_y = max(0, min((token.y - HUD_HEIGHT) // TILE_SIZE, self.height - 1))
-                goal = (goal_x, goal_y)
-                if not self.maze.is_connected(start, goal):
-                    print(f"Carving path to token at {goal}...")
-                    self.maze.carve_path(start, goal)
-            for checkpoint in self.checkpoints:
-                goal_x = max(0, min(checkpoint.x // TILE_SIZE, self.width - 1))
-                goal_y = max(0, min((checkpoint.y - HUD_HEIGHT) // TILE_SIZE, self.height - 1))
-                goal = (goal_x, goal_y)
-                if not self.maze.is_connected(start, goal):
-                    print(f"Carving path to checkpoint at {goal}...")
-                    self.maze.carve_path(start, goal)
-            if self.sword:
-                goal_x = max(0, min(self.sword.x // TILE_SIZE, self.width - 1))
-                goal_y = max(0, min((self.sword.y - HUD_HEIGHT) // TILE_SIZE, self.height - 1))
-                goal = (goal_x, goal_y)
-                if not self.maze.is_connected(start, goal):
-                    print(f"Carving path to sword at {goal}...")
-                    self.maze.carve_path(start, goal)
-            for fragment in self.fragments:
-                goal_x = max(0, min(fragment.x // TILE_SIZE, self.width - 1))
-                goal_y = max(0, min((fragment.y - HUD_HEIGHT) // TILE_SIZE, self.height - 1))
-                goal = (goal_x, goal_y)
-                if not self.maze.is_connected(start, goal):
-                    print(f"Carving path to fragment at {goal}...")
-                    self.maze.carve_path(start, goal)
-
-            exit_x = max(0, min(self.exit[0], self.width - 1))
-            exit_y = max(0, min(self.exit[1], self.height - 1))
-            exit_goal = (exit_x, exit_y)
-            if not self.maze.is_connected(start, exit_goal):
-                print(f"Carving path to exit at {exit_goal}...")
-                self.maze.carve_path(start, exit_goal)
-
-            print("Elements placed successfully.")
+            # Check reachability from the entry the player arrives through, not the player's current
+            # position, so the result depends only on the scene seed.
+            start = self.entry
+
+            targets = []
+            for item in self.tokens + self.checkpoints + self.fragments + ([self.sword] if self.sword else []):
+                goal_x = max(0, min(item.x // TILE_SIZE, self.width - 1))
+                goal_y = max(0, min((item.y - HUD_HEIGHT) // TILE_SIZE, self.height - 1))
+                targets.append((goal_x, goal_y))
+            targets.append((max(0, min(self.exit[0], self.width - 1)), max(0, min(self.exit[1], self.height - 1))))
+            carved = self.maze.connect_targets(start, targets)
+            if carved:
+                log.info("Carved %s wall(s) to connect %s targets.", len(carved), len(targets))
+
+            log.debug("Elements placed successfully.")
         except Exception as e:
-            print(f"Error in Scene.place_elements: {e}")
+            log.error("Error in Scene.place_elements: %s", e)
             raise
 
     def carve_path(self, start, goal):
@@ -614,7 +891,41 @@ class Scene:
                 y += 1
             elif y > gy:
                 y -= 1
-            self.grid[y][x] = 0
+            self.maze.set_cell(x, y, 0)
+
+    def snapshot_delta(self):
+        # Everything that differs from what the seed alone would produce: carved cells, the
+        # pickups still on the floor and the boss's remaining health.
+        carved = [(x, y, self.grid[y][x])
+                  for y in range(self.height) for x in range(self.width)
+                  if self.grid[y][x] != self.maze.base_grid[y][x]]
+        return {
+            'seed': self.seed,
+            'maze_source': self.maze.source,
+            'carved': carved,
+            'exits': dict(self.exits),
+            'tokens': [(token.x, token.y) for token in self.tokens],
+            'checkpoints': [(checkpoint.x, checkpoint.y) for checkpoint in self.checkpoints],
+            'fragments': [(fragment.x, fragment.y) for fragment in self.fragments],
+            'sword': (self.sword.x, self.sword.y) if self.sword else None,
+            'boss_hp': self.boss.hp if self.boss else None
+        }
+
+    def apply_delta(self, delta):
+        log.info("Rebuilding Area %s, Scene %s from seed %s...", self.area_id, self.scene_id, self.seed)
+        for x, y, value in delta['carved']:
+            self.maze.set_cell(x, y, value)
+        self.exits = dict(delta['exits'])
+        self.tokens = [pygame.Rect(x, y, TILE_SIZE, TILE_SIZE) for x, y in delta['tokens']]
+        self.checkpoints = [pygame.Rect(x, y, TILE_SIZE, TILE_SIZE) for x, y in delta['checkpoints']]
+        self.fragments = [pygame.Rect(x, y, TILE_SIZE, TILE_SIZE) for x, y in delta['fragments']]
+        self.sword = pygame.Rect(delta['sword'][0], delta['sword'][1], TILE_SIZE, TILE_SIZE) if delta['sword'] else None
+        if delta['boss_hp'] is not None:
+            boss_types = {1: BossArea1, 2: BossArea2, 3: BossArea3, 4: BossArea4, 5: BossArea5, 6: Skuld}
+            boss_type = boss_types.get(self.area_id)
+            if boss_type:
+                self.boss = boss_type(self, self.player.level)
+                self.boss.hp = delta['boss_hp']
 
     def is_connected(self, start, goal):
         height = len(self.grid)
@@ -636,43 +947,25 @@ class Scene:
         return False
 
     def find_open_position(self):
-        print("Finding open position...")
-        try:
-            max_attempts = 200
-            attempt = 0
-            while attempt < max_attempts:
-                x = random.randint(1, self.width - 2)
-                y = random.randint(1, self.height - 2)
-                if self.grid[y][x] == 0 and self.grid[y][x + 1] == 0:
-                    entry_distance = ((x - self.entry[0]) ** 2 + (y - self.entry[1]) ** 2) ** 0.5
-                    exit_distance = ((x - self.exit[0]) ** 2 + (y - self.exit[1]) ** 2) ** 0.5
-                    if entry_distance > 3 and exit_distance > 3:
-                        screen_x = x * TILE_SIZE
-                        screen_y = y * TILE_SIZE + HUD_HEIGHT
-                        print(f"Found open position at ({screen_x}, {screen_y})")
-                        return screen_x, screen_y
-                attempt += 1
-            print("Warning: Failed to find open position after maximum attempts. Using default (1, 1).")
-            return TILE_SIZE, TILE_SIZE + HUD_HEIGHT
-        except Exception as e:
-            print(f"Error in Scene.find_open_position: {e}")
-            raise
+        # Scene placement draws from the scene's element stream, not the maze layout stream
+        return self.maze.find_open_position(self.rng)
 
     def relocate_sword(self):
-        print("Relocating sword...")
+        log.debug("Relocating sword...")
         try:
             if not self.player.inventory.has_sword:
                 x, y = self.find_open_position()
                 self.sword = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-                print("Sword relocated successfully.")
+                log.debug("Sword relocated successfully.")
             else:
-                print("Player already has the sword; not relocating.")
+                log.info("Player already has the sword; not relocating.")
         except Exception as e:
-            print(f"Error in Scene.relocate_sword: {e}")
+            log.error("Error in Scene.relocate_sword: %s", e)
             raise
 
+    @timed("render.scene")
     def draw(self, screen):
-        print("Drawing scene...")
+        log.debug("Drawing scene...")
         try:
             screen.blit(self.background, (0, 0))
             playable_height = SCREEN_HEIGHT - HUD_HEIGHT
@@ -688,6 +981,7 @@ class Scene:
                         else:
                             scaled_wall = pygame.transform.scale(self.wall_tile, (TILE_SIZE, int(tile_height)))
                             screen.blit(scaled_wall, (x * TILE_SIZE, int(screen_y)))
+                frame_stats.surfaces += self.width * self.height
             else:
                 for y in range(self.height):
                     screen_y = HUD_HEIGHT + y * tile_height
@@ -721,16 +1015,18 @@ class Scene:
                     screen.blit(self.fragment_sprite, (fragment.x, fragment.y))
                 else:
                     pygame.draw.rect(screen, (255, 165, 0), (fragment.x, fragment.y, fragment.width, fragment.height))
-            print("Scene drawn successfully.")
+            log.debug("Scene drawn successfully.")
         except Exception as e:
-            print(f"Error in Scene.draw: {e}")
+            log.error("Error in Scene.draw: %s", e)
             raise
 
 class Area:
-    def __init__(self, area_id, player, vitalik_freed):
-        print(f"Entering Area.__init__ for Area {area_id}...")
+    def __init__(self, area_id, player, vitalik_freed, seed=None, deltas=None):
+        log.debug("Entering Area.__init__ for Area %s...", area_id)
         try:
             self.area_id = area_id
+            self.seed = seed if seed is not None else new_seed()
+            self.rng = make_rng(self.seed, "area")
             area_names = {
                 0: "The Slums of Krypto",
                 1: "Seisan Spires",
@@ -740,43 +1036,66 @@ class Area:
                 5: "Skuld’s Lair"
             }
             self.name = area_names.get(area_id, f"Unknown Region {area_id}")
-            self.scenes = [Scene(area_id, scene_id, player, vitalik_freed) for scene_id in range(5)]
-            self.sapa_free_scene = 2 if self.area_id == 0 else random.randint(0, 3) if self.area_id in range(1,
-                                                                                                             6) else None
-            print(f"Area {area_id} initialized with {len(self.scenes)} scenes. Sapa-free scene: {self.sapa_free_scene}")
+            deltas = deltas or {}
+            self.scenes = [Scene(area_id, scene_id, player, vitalik_freed, seed=self.scene_seed(scene_id),
+                                 delta=deltas.get((area_id, scene_id)))
+                           for scene_id in range(5)]
+            self.sapa_free_scene = 2 if self.area_id == 0 else self.rng.randint(0, 3) if self.area_id in range(1,
+                                                                                                               6) else None
+            log.info("Area %s initialized with %s scenes. Sapa-free scene: %s", area_id, len(self.scenes), self.sapa_free_scene)
         except Exception as e:
-            print(f"Error in Area.__init__: {e}")
+            log.error("Error in Area.__init__: %s", e)
             raise
 
+    def scene_seed(self, scene_id):
+        return derive_seed(self.seed, "scene", scene_id)
+
 class World:
-    def __init__(self, player, vitalik_freed=False):
-        print("Entering World.__init__...")
+    def __init__(self, player, vitalik_freed=False, seed=None, scene_deltas=None):
+        log.debug("Entering World.__init__...")
         try:
+            self.seed = seed if seed is not None else new_seed()
+            self.player = player
+            self.vitalik_freed = vitalik_freed
             self.current_area = 0
             self.current_scene = 0
-            self.areas = [Area(area_id, player, vitalik_freed) for area_id in range(6)]
-            print("World initialized successfully.")
+            # Saved deltas only make sense for the world they were taken from
+            scene_deltas = {key: delta for key, delta in (scene_deltas or {}).items()
+                            if delta['seed'] == derive_seed(self.area_seed(key[0]), "scene", key[1])}
+            self.areas = [Area(area_id, player, vitalik_freed, seed=self.area_seed(area_id), deltas=scene_deltas)
+                          for area_id in range(6)]
+            log.info("World initialized successfully with seed %s.", self.seed)
         except Exception as e:
-            print(f"Error in World.__init__: {e}")
+            log.error("Error in World.__init__: %s", e)
             raise
 
+    def area_seed(self, area_id):
+        return derive_seed(self.seed, "area", area_id)
+
+    def get_scene(self, area_id, scene_id):
+        return self.areas[area_id].scenes[scene_id]
+
+    def snapshot_deltas(self):
+        return {(scene.area_id, scene.scene_id): scene.snapshot_delta()
+                for area in self.areas for scene in area.scenes}
+
     def get_current_scene(self):
-        print(f"Getting current scene: Area {self.current_area}, Scene {self.current_scene}")
+        log.debug("Getting current scene: Area %s, Scene %s", self.current_area, self.current_scene)
         try:
-            return self.areas[self.current_area].scenes[self.current_scene]
+            return self.get_scene(self.current_area, self.current_scene)
         except Exception as e:
-            print(f"Error in World.get_current_scene: {e}")
+            log.error("Error in World.get_current_scene: %s", e)
             raise
 
     def move_to_scene(self, direction):
-        print(f"Moving to scene in direction: {direction}")
+        log.info("Moving to scene in direction: %s", direction)
         try:
             current_scene = self.get_current_scene()
             if direction in current_scene.exits:
                 new_area, new_scene = current_scene.exits[direction]
                 self.current_area = new_area
                 self.current_scene = new_scene
-                print(f"Moved to Area {self.current_area}, Scene {self.current_scene}")
+                log.info("Moved to Area %s, Scene %s", self.current_area, self.current_scene)
         except Exception as e:
-            print(f"Error in World.move_to_scene: {e}")
+            log.error("Error in World.move_to_scene: %s", e)
             raise
\ No newline at end of file
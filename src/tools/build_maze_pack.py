@@ -0,0 +1,91 @@
+# src/tools/build_maze_pack.py
+# Bakes validated Maze layouts into data/maze_pack.bin for instant scene creation.
+#
+#   python -m src.tools.build_maze_pack --count 512 --seed 0
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from src.config import MAZE_PACK_PATH
+from src.modules.mazepack import TRANSFORMS, apply_transform, pack_record, unpack_record, write_pack
+from src.modules.rng import make_rng
+from src.modules.world import Maze
+
+# Must match the configurations Scene.build_maze asks for
+CONFIGURATIONS = {
+    "default": {},
+    "num_crosses_2": {"num_crosses": 2}
+}
+
+MIN_PATH_LENGTH = 5
+# A scene places up to 3 tokens plus a checkpoint and a sword or fragment
+MIN_ITEM_SLOTS = 8
+
+
+def validate(maze):
+    if maze.stats["carved"]:
+        return "needed a carved fallback path"
+    if maze.stats["placed"] + maze.stats["fallback_placed"] < maze.stats["requested"]:
+        return "short of requested obstacles"
+    distance = maze.bfs_distance(maze.entry, maze.exit)
+    if distance is None or distance < MIN_PATH_LENGTH:
+        return "entry-exit path too short"
+    if len(maze.free_cells["clear"]) < MIN_ITEM_SLOTS:
+        return "not enough item slots"
+    if not maze.free_cells["near_entry"]:
+        return "no start position near entry"
+    return None
+
+
+def check_record(record):
+    # Every variety transform of a stored record must still be a valid maze
+    grid, entry, exit_ = unpack_record(record)
+    for transform in TRANSFORMS:
+        layout = apply_transform(grid, entry, exit_, transform)
+        maze = Maze.from_layout(*layout)
+        for x, y in (maze.entry, maze.exit):
+            if maze.grid[y][x] != 0:
+                raise ValueError(f"{transform} moved an opening onto a wall at ({x}, {y})")
+        if not maze.is_connected(maze.entry, maze.exit):
+            raise ValueError(f"{transform} broke entry-exit connectivity")
+
+
+def build(name, kwargs, count, seed):
+    records = []
+    rejected = {}
+    index = 0
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        while len(records) < count:
+            maze = Maze(rng=make_rng(seed, "pack", name, index), **kwargs)
+            index += 1
+            reason = validate(maze)
+            if reason:
+                rejected[reason] = rejected.get(reason, 0) + 1
+                continue
+            record = pack_record(maze.grid, maze.entry, maze.exit)
+            check_record(record)
+            records.append(record)
+    print(f"{name}: kept {len(records)} of {index} generated mazes; rejected {rejected or 'none'}")
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the pre-baked maze pack.")
+    parser.add_argument("--count", type=int, default=512, help="Mazes per configuration")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed for generation")
+    parser.add_argument("--output", default=MAZE_PACK_PATH, help="Pack file to write")
+    args = parser.parse_args(argv)
+
+    began = time.perf_counter()
+    configurations = [(name, build(name, kwargs, args.count, args.seed)) for name, kwargs in CONFIGURATIONS.items()]
+    write_pack(args.output, configurations)
+    print(f"Wrote {args.output} ({os.path.getsize(args.output)} bytes) in {time.perf_counter() - began:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
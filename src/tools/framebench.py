@@ -0,0 +1,253 @@
+# src/tools/framebench.py
+# Headless frame-time benchmark: fixed-seed scenarios run one tick of the main loop's simulation
+# (src/modules/gameloop.py: spawn roll, scheduled phases, movement, enemies, projectiles, combat) and one
+# interpolated frame of its draw per frame, uncapped, on SDL's dummy video and audio drivers. The modal
+# parts of a tick (exits, pickups, interactions, prompts) stay in main() and are not benchmarked.
+#
+#   python -m src.tools.framebench --frames 600 --output src/tools/framebench_baseline.json
+#   python -m src.tools.framebench --compare
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, DEFAULT_FONT, MALE_SPRITE, HUD_HEART_ICON, \
+    HUD_COIN_ICON, HUD_VIRUS_ICON, HUD_RING_ICON, SAPA_PROJECTILE, EXIT_ARROW_SPRITE
+from src.modules.assets import load_image
+from src.modules.logs import configure
+from src.modules.player import Player
+from src.modules.world import World
+from src.modules.combat import CombatSystem
+from src.modules.enemies import Sapa, DiagonalSapa, ChaserSapa, SplitterSapa, ProjectileSapa, BossArea5, Skuld
+from src.modules.projectiles import ProjectileBuffer
+from src.modules.timestep import Interpolator
+from src.modules.perf_overlay import PerfOverlay
+from src.modules.ui import DialogueBox
+from src.modules import gameloop
+from src.modules.stats import percentile
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "framebench_baseline.json")
+WARMUP_FRAMES = 30
+ALPHA = 0.5  # frames are drawn halfway between ticks, as when rendering at twice the tick rate
+
+
+def load_or_placeholder(path, size, color=(200, 200, 200)):
+    try:
+        return load_image(path, size)
+    except (pygame.error, FileNotFoundError):
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        return surface
+
+
+class Bench:
+    # The per-frame state main() keeps in locals, for one scenario
+    def __init__(self, seed, area=0, scene=1):
+        sprite = load_or_placeholder(MALE_SPRITE, (TILE_SIZE, TILE_SIZE))
+        self.player = Player(0, 0, "Bench", "male", sprite)
+        self.world = World(self.player, seed=seed)
+        self.world.current_area, self.world.current_scene = area, scene
+        self.scene = self.world.get_current_scene()
+        self.scene.sapas.clear()
+        self.player.rect.x, self.player.rect.y = self.scene.maze.find_open_start_position()
+        self.combat = CombatSystem()
+        self.projectiles = ProjectileBuffer()
+        self.dialogue_box = DialogueBox()
+        self.scheduler = gameloop.new_scheduler()
+        self.interpolator = Interpolator()
+        self.perf = PerfOverlay()
+        self.vitalik = None
+        self.horde = 0
+        self.show_minimap = False
+        self.infection_active = True
+
+    def add(self, enemy_type):
+        enemy = enemy_type(self.scene, self.player.level)
+        self.scene.sapas.append(enemy)
+        return enemy
+
+
+def idle(bench):
+    pass
+
+
+def mixed_sapas(bench):
+    for enemy_type in (Sapa, DiagonalSapa, ChaserSapa, SplitterSapa, ProjectileSapa):
+        bench.add(enemy_type)
+
+
+def boss5_radial(bench):
+    # Bosses aren't spawned by the main loop's sapa logic, so the fight is set up directly
+    bench.add(BossArea5).circle_cooldown_max = 20
+
+
+def skuld_minions(bench):
+    skuld = bench.add(Skuld)
+    skuld.hp = 70  # between 75 and 50: the minion phase
+    skuld.minion_cooldown_max = 60
+
+
+def dialogue_open(bench):
+    mixed_sapas(bench)
+    bench.dialogue_box.show(["Vitalik: The Sapa grow stronger the longer you wait.",
+                             "Vitalik: Find the fragment before the infection spreads."])
+
+
+def minimap_on(bench):
+    mixed_sapas(bench)
+    bench.show_minimap = True
+
+
+def critical_tint(bench):
+    mixed_sapas(bench)
+    bench.player.infection_level = 90
+
+
+SCENARIOS = {
+    "idle": idle,
+    "mixed_sapas": mixed_sapas,
+    "boss5_radial": boss5_radial,
+    "skuld_minions": skuld_minions,
+    "dialogue_open": dialogue_open,
+    "minimap_on": minimap_on,
+    "critical_tint": critical_tint
+}
+
+
+def simulate(bench):
+    # One fixed tick of the main loop, minus its modal screens
+    scene = gameloop.begin_tick(bench.world, bench.player, bench.vitalik, bench.combat, bench.scheduler,
+                                bench.interpolator, bench.horde)
+    gameloop.finish_tick(scene, bench.player, bench.projectiles, bench.combat, bench.scheduler)
+    # Keep the fight going for the whole run
+    bench.player.hp = bench.player.max_hp
+
+
+def draw(bench, screen, sprites):
+    gameloop.draw_frame(screen, bench.world, bench.world.get_current_scene(), bench.player, bench.vitalik,
+                        bench.projectiles, bench.combat, bench.dialogue_box, sprites, bench.interpolator, ALPHA,
+                        bench.infection_active, bench.show_minimap, bench.perf)
+    pygame.display.flip()
+
+
+def summarize(values):
+    ordered = sorted(values)
+    return {"p50": percentile(ordered, 0.5), "p95": percentile(ordered, 0.95), "p99": percentile(ordered, 0.99),
+            "max": ordered[-1] if ordered else 0.0, "mean": sum(ordered) / len(ordered) if ordered else 0.0}
+
+
+def run_scenario(name, setup, frames, seed, screen, sprites):
+    bench = Bench(seed)
+    setup(bench)
+    totals, simulation, drawing = [], [], []
+    peak_sapas = peak_projectiles = 0
+    for frame in range(WARMUP_FRAMES + frames):
+        began = time.perf_counter()
+        pygame.event.pump()
+        simulate(bench)
+        simulated = time.perf_counter()
+        draw(bench, screen, sprites)
+        ended = time.perf_counter()
+        if frame >= WARMUP_FRAMES:
+            totals.append((ended - began) * 1000)
+            simulation.append((simulated - began) * 1000)
+            drawing.append((ended - simulated) * 1000)
+            peak_sapas = max(peak_sapas, len(bench.scene.sapas))
+            peak_projectiles = max(peak_projectiles, len(bench.projectiles))
+    return {"scenario": name, "frames": frames, "ms_per_frame": summarize(totals),
+            "simulation_ms": summarize(simulation), "draw_ms": summarize(drawing),
+            "peak_sapas": peak_sapas, "peak_projectiles": peak_projectiles}
+
+
+def print_report(result):
+    total, simulation, drawing = result["ms_per_frame"], result["simulation_ms"], result["draw_ms"]
+    print(f"== {result['scenario']} ({result['frames']} frames, up to {result['peak_sapas']} sapas, "
+          f"{result['peak_projectiles']} projectiles) ==")
+    print(f"  frame      : p50 {total['p50']:.3f}  p95 {total['p95']:.3f}  p99 {total['p99']:.3f}  "
+          f"max {total['max']:.3f} ms")
+    print(f"  simulation : p50 {simulation['p50']:.3f}  p95 {simulation['p95']:.3f} ms")
+    print(f"  draw       : p50 {drawing['p50']:.3f}  p95 {drawing['p95']:.3f} ms")
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    baseline_by_name = {entry["scenario"]: entry for entry in baseline["results"]}
+    for result in results:
+        old = baseline_by_name.get(result["scenario"])
+        if old is None:
+            continue
+        for key in ("p50", "p95"):
+            new_ms, old_ms = result["ms_per_frame"][key], old["ms_per_frame"][key]
+            if new_ms > old_ms * (1 + tolerance):
+                regressions.append(f"{result['scenario']}: {key} {new_ms:.3f} ms vs baseline {old_ms:.3f} ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark headless frame times for scripted game scenarios.")
+    parser.add_argument("--frames", type=int, default=600, help="Measured frames per scenario")
+    parser.add_argument("--seed", type=int, default=1, help="World seed")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Only run the named scenario (repeatable)")
+    parser.add_argument("--output", help="Write results as a JSON baseline")
+    parser.add_argument("--compare", nargs="?", const=BASELINE_PATH,
+                        help="Compare against a JSON baseline (default: the checked-in one) and exit non-zero "
+                             "on regression")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative increase in p50/p95 frame time (default 0.25)")
+    args = parser.parse_args(argv)
+
+    configure("ERROR")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    sprites = {
+        "font": pygame.font.SysFont(DEFAULT_FONT, 24),
+        "heart": load_or_placeholder(HUD_HEART_ICON, (20, 20), (255, 0, 0)),
+        "coin": load_or_placeholder(HUD_COIN_ICON, (20, 20), (255, 215, 0)),
+        "virus": load_or_placeholder(HUD_VIRUS_ICON, (20, 20), (0, 255, 0)),
+        "ring": load_or_placeholder(HUD_RING_ICON, (20, 20), (255, 215, 0)),
+        "projectile": load_or_placeholder(SAPA_PROJECTILE, (10, 10), (255, 0, 0)),
+        "arrow": load_or_placeholder(EXIT_ARROW_SPRITE, (30, 30), (255, 255, 255))
+    }
+
+    results = []
+    for name in args.scenario or list(SCENARIOS):
+        result = run_scenario(name, SCENARIOS[name], args.frames, args.seed, screen, sprites)
+        print_report(result)
+        results.append(result)
+    pygame.quit()
+
+    report = {
+        "machine": {"platform": platform.platform(), "python": platform.python_version(),
+                    "pygame": pygame.version.ver, "cpu_count": os.cpu_count()},
+        "frames": args.frames,
+        "seed": args.seed,
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline["machine"]["platform"] != report["machine"]["platform"]:
+            print(f"Note: baseline was recorded on {baseline['machine']['platform']}")
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+# src/tools/mazebench.py
+# Headless throughput/quality benchmark for the maze generator.
+#
+#   python -m src.tools.mazebench --count 10000 --workers 4 --output maze_baseline.json
+#   python -m src.tools.mazebench --count 2000 --compare maze_baseline.json
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from src.modules.rng import make_rng
+from src.modules.stats import percentile
+from src.modules.world import Maze
+
+CONFIGURATIONS = {
+    "default": {},
+    "num_crosses_2": {"num_crosses": 2},
+    "plus_heavy": {"shape_weights": {"plus": 4, "T": 1, "L": 1, "arc": 1}}
+}
+
+MEMORY_SAMPLE_EVERY = 100
+
+
+def parse_shape_weights(text):
+    weights = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = float(weight)
+    return weights
+
+
+def peak_rss_kb():
+    try:
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS reports bytes, Linux reports kilobytes
+        return usage // 1024 if sys.platform == "darwin" else usage
+    except ImportError:
+        return None
+
+
+def run_chunk(job):
+    name, kwargs, seed, start, stop = job
+    samples = []
+    memory_peaks = []
+    # Maze prints progress for every obstacle; keep that out of the report but keep its cost in the timing
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for index in range(start, stop):
+            rng = make_rng(seed, name, index)
+            if index % MEMORY_SAMPLE_EVERY == 0:
+                tracemalloc.start()
+                Maze(rng=make_rng(seed, name, index), **kwargs)
+                memory_peaks.append(tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+            began = time.perf_counter()
+            maze = Maze(rng=rng, **kwargs)
+            elapsed = time.perf_counter() - began
+            samples.append({
+                "seconds": elapsed,
+                "attempts": maze.stats["attempts"] + maze.stats["fallback_attempts"],
+                "fallback": maze.stats["fallback_attempts"] > 0,
+                "short": maze.stats["placed"] + maze.stats["fallback_placed"] < maze.stats["requested"],
+                "carved": maze.stats["carved"],
+                "path_length": maze.bfs_distance(maze.entry, maze.exit)
+            })
+    return name, samples, memory_peaks, peak_rss_kb()
+
+
+def summarize(name, samples, memory_peaks, rss_kb, wall_seconds):
+    count = len(samples)
+    seconds = sorted(sample["seconds"] for sample in samples)
+    attempts = sorted(sample["attempts"] for sample in samples)
+    histogram = {}
+    for sample in samples:
+        key = str(sample["path_length"]) if sample["path_length"] is not None else "unreachable"
+        histogram[key] = histogram.get(key, 0) + 1
+    attempt_buckets = {}
+    for value in attempts:
+        bucket = (value // 50) * 50
+        attempt_buckets[f"{bucket}-{bucket + 49}"] = attempt_buckets.get(f"{bucket}-{bucket + 49}", 0) + 1
+    return {
+        "configuration": name,
+        "kwargs": CONFIGURATIONS.get(name, {}),
+        "count": count,
+        "wall_seconds": wall_seconds,
+        "mazes_per_second": count / wall_seconds if wall_seconds > 0 else 0.0,
+        "ms_per_maze": {
+            "p50": percentile(seconds, 0.5) * 1000,
+            "p95": percentile(seconds, 0.95) * 1000,
+            "max": max(seconds) * 1000 if seconds else 0.0
+        },
+        "attempts": {
+            "min": min(attempts) if attempts else 0,
+            "p50": percentile(attempts, 0.5),
+            "p90": percentile(attempts, 0.9),
+            "p99": percentile(attempts, 0.99),
+            "max": max(attempts) if attempts else 0,
+            "histogram": dict(sorted(attempt_buckets.items(), key=lambda item: int(item[0].split("-")[0])))
+        },
+        "fallback_rate": sum(sample["fallback"] for sample in samples) / count if count else 0.0,
+        "short_rate": sum(sample["short"] for sample in samples) / count if count else 0.0,
+        "carve_rate": sum(sample["carved"] for sample in samples) / count if count else 0.0,
+        "path_length_histogram": dict(sorted(histogram.items(), key=lambda item: (not item[0].isdigit(), int(item[0]) if item[0].isdigit() else 0))),
+        "peak_traced_bytes_per_maze": max(memory_peaks) if memory_peaks else 0,
+        "peak_rss_kb": rss_kb
+    }
+
+
+def run_configuration(name, kwargs, count, workers, seed):
+    chunk = max(1, count // (workers * 4))
+    jobs = [(name, kwargs, seed, start, min(count, start + chunk)) for start in range(0, count, chunk)]
+    samples = []
+    memory_peaks = []
+    rss_kb = None
+    began = time.perf_counter()
+    if workers > 1:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(run_chunk, jobs)
+    else:
+        results = [run_chunk(job) for job in jobs]
+    wall_seconds = time.perf_counter() - began
+    for _, chunk_samples, chunk_peaks, chunk_rss in results:
+        samples.extend(chunk_samples)
+        memory_peaks.extend(chunk_peaks)
+        if chunk_rss is not None:
+            rss_kb = max(rss_kb or 0, chunk_rss)
+    return summarize(name, samples, memory_peaks, rss_kb, wall_seconds)
+
+
+def print_report(result):
+    print(f"== {result['configuration']} ({result['count']} mazes) ==")
+    print(f"  throughput     : {result['mazes_per_second']:.1f} mazes/s "
+          f"(p50 {result['ms_per_maze']['p50']:.2f} ms, p95 {result['ms_per_maze']['p95']:.2f} ms, "
+          f"max {result['ms_per_maze']['max']:.2f} ms)")
+    attempts = result["attempts"]
+    print(f"  attempts       : min {attempts['min']}  p50 {attempts['p50']}  p90 {attempts['p90']}  "
+          f"p99 {attempts['p99']}  max {attempts['max']}")
+    print(f"  fallback rate  : {result['fallback_rate'] * 100:.2f}%  "
+          f"(short of requested obstacles: {result['short_rate'] * 100:.2f}%)")
+    print(f"  carve rate     : {result['carve_rate'] * 100:.2f}%")
+    print(f"  peak memory    : {result['peak_traced_bytes_per_maze'] / 1024:.1f} KiB traced per maze, "
+          f"{result['peak_rss_kb']} KiB RSS per worker")
+    print("  path lengths   :")
+    largest = max(result["path_length_histogram"].values()) if result["path_length_histogram"] else 1
+    for length, amount in result["path_length_histogram"].items():
+        bar = "#" * max(1, int(40 * amount / largest))
+        print(f"    {length:>11} {amount:>7} {bar}")
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    baseline_by_name = {entry["configuration"]: entry for entry in baseline["results"]}
+    for result in results:
+        old = baseline_by_name.get(result["configuration"])
+        if old is None:
+            continue
+        if result["mazes_per_second"] < old["mazes_per_second"] * (1 - tolerance):
+            regressions.append(f"{result['configuration']}: throughput {result['mazes_per_second']:.1f}/s "
+                               f"vs baseline {old['mazes_per_second']:.1f}/s")
+        for key in ("fallback_rate", "carve_rate"):
+            if result[key] > old[key] + tolerance:
+                regressions.append(f"{result['configuration']}: {key} {result[key]:.3f} vs baseline {old[key]:.3f}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Maze generation throughput and quality.")
+    parser.add_argument("--count", type=int, default=1000, help="Mazes to generate per configuration")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed; each maze derives its own stream")
+    parser.add_argument("--config", action="append", choices=sorted(CONFIGURATIONS),
+                        help="Only run the named configuration (repeatable)")
+    parser.add_argument("--shape-weights", help="Extra configuration with custom weights, e.g. plus=3,T=1,L=1,arc=0")
+    parser.add_argument("--output", help="Write results as a JSON baseline")
+    parser.add_argument("--compare", help="Compare against a JSON baseline and exit non-zero on regression")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed relative throughput drop / absolute rate increase (default 0.15)")
+    args = parser.parse_args(argv)
+
+    names = args.config or list(CONFIGURATIONS)
+    configurations = [(name, CONFIGURATIONS[name]) for name in names]
+    if args.shape_weights:
+        custom = {"shape_weights": parse_shape_weights(args.shape_weights)}
+        CONFIGURATIONS["custom"] = custom
+        configurations.append(("custom", custom))
+
+    results = []
+    for name, kwargs in configurations:
+        result = run_configuration(name, kwargs, args.count, max(1, args.workers), args.seed)
+        print_report(result)
+        results.append(result)
+
+    report = {
+        "machine": {"platform": platform.platform(), "python": platform.python_version(),
+                    "cpu_count": os.cpu_count()},
+        "count": args.count,
+        "workers": args.workers,
+        "seed": args.seed,
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
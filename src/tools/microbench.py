@@ -0,0 +1,245 @@
+# src/tools/microbench.py
+# timeit harnesses for the game's hot functions, headless, with per-machine-profile JSON baselines.
+# Frame benchmarks (framebench) say that a frame got slower; these say which function did.
+#
+#   python -m src.tools.microbench --save
+#   python -m src.tools.microbench --compare
+#   python -m src.tools.microbench --bench combat_update --attacks 200 --enemies 50
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, HUD_HEIGHT, DEFAULT_FONT
+from src.modules.logs import configure
+from src.modules.rng import make_rng
+from src.modules.player import Player
+from src.modules.world import World, Maze
+from src.modules.enemies import Sapa
+from src.modules.combat import CombatSystem, Attack
+from src.modules.ui import DialogueBox
+from src.modules.rendering import draw_ui, draw_minimap
+from src.utils import wrap_text
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "microbench_baselines")
+REPEAT = 5
+MIN_SECONDS = 0.2
+DIALOGUE_TEXT = ("Vitalik: The Sapa feed on doubt. Every token you gather weakens the infection, and every "
+                 "fragment you recover brings the network closer to being whole again. Hurry, the next area waits.")
+
+
+def machine_profile():
+    return f"{platform.system().lower()}-{platform.machine()}-py{sys.version_info.major}{sys.version_info.minor}"
+
+
+class Fixture:
+    # One world, scene and set of UI objects shared by the benchmarks; built after the display exists
+    def __init__(self, seed, attacks, enemies):
+        self.seed = seed
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.font = pygame.font.SysFont(DEFAULT_FONT, 24)
+        self.icon = pygame.Surface((20, 20))
+        self.player = Player(0, 0, "Bench", "male", pygame.Surface((TILE_SIZE, TILE_SIZE)))
+        self.world = World(self.player, seed=seed)
+        self.world.current_area, self.world.current_scene = 1, 1
+        self.scene = self.world.get_current_scene()
+        self.scene.sapas.clear()
+        self.player.rect.x, self.player.rect.y = self.scene.maze.find_open_start_position()
+        self.maze = Maze(rng=make_rng(seed, "microbench"))
+        self.attack_count = attacks
+        self.enemy_count = enemies
+        self.dialogue_box = DialogueBox()
+
+
+def bench_maze_init(fixture):
+    counter = itertools.count()
+    return lambda: Maze(rng=make_rng(fixture.seed, "maze_init", next(counter)))
+
+
+def bench_maze_is_connected(fixture):
+    maze = fixture.maze
+    return lambda: maze.is_connected(maze.entry, maze.exit)
+
+
+def bench_maze_bfs_distance(fixture):
+    maze = fixture.maze
+    return lambda: maze.bfs_distance(maze.entry, maze.exit)
+
+
+def bench_maze_collides(fixture):
+    # 100 player-sized rects spread over the playfield per call
+    maze = fixture.maze
+    rects = [pygame.Rect((i * 37) % (SCREEN_WIDTH - TILE_SIZE), HUD_HEIGHT + (i * 53) % (SCREEN_HEIGHT - HUD_HEIGHT - TILE_SIZE),
+                         TILE_SIZE, TILE_SIZE) for i in range(100)]
+    collides = maze.collides
+
+    def run():
+        for rect in rects:
+            collides(rect)
+    return run
+
+
+def bench_scene_place_elements(fixture):
+    scene = fixture.scene
+
+    def run():
+        scene.tokens, scene.checkpoints, scene.fragments = [], [], []
+        scene.sword = scene.npc = scene.minigame = scene.boss = None
+        scene.place_elements()
+    return run
+
+
+def bench_enemy_place_in_maze(fixture):
+    return Sapa(fixture.scene, 1).place_in_maze
+
+
+def bench_combat_update(fixture):
+    # attack_count melee attacks spread over attack_count tiles against enemy_count sapas that can't die
+    scene = fixture.scene
+    combat = CombatSystem()
+    enemies = []
+    for _ in range(fixture.enemy_count):
+        enemy = Sapa(scene, 1)
+        enemy.hp = 10 ** 9
+        enemies.append(enemy)
+    attacks = []
+    for i in range(fixture.attack_count):
+        rect = pygame.Rect((i * 41) % (SCREEN_WIDTH - TILE_SIZE), HUD_HEIGHT + (i * 29) % (SCREEN_HEIGHT - HUD_HEIGHT - TILE_SIZE),
+                           TILE_SIZE, TILE_SIZE)
+        attacks.append(Attack(rect, 1, True, lifetime=10 ** 9))
+
+    def run():
+        combat.attacks[:] = attacks
+        combat.particles.clear()
+        combat.update(enemies, fixture.player, scene.sapa_index)
+    return run
+
+
+def bench_wrap_text(fixture):
+    return lambda: wrap_text(DIALOGUE_TEXT, fixture.dialogue_box.font, fixture.dialogue_box.max_width)
+
+
+def bench_draw_ui(fixture):
+    icon = fixture.icon
+    return lambda: draw_ui(fixture.screen, fixture.player, fixture.world, fixture.font, icon, icon, icon, icon, True)
+
+
+def bench_draw_minimap(fixture):
+    return lambda: draw_minimap(fixture.screen, fixture.scene, fixture.player, fixture.font)
+
+
+def bench_dialogue_draw(fixture):
+    box = fixture.dialogue_box
+    lines = [DIALOGUE_TEXT, "Vitalik: Press SPACE to continue."]
+
+    def run():
+        box.show(lines)
+        box.draw(fixture.screen)
+    return run
+
+
+BENCHMARKS = {
+    "maze_init": bench_maze_init,
+    "maze_is_connected": bench_maze_is_connected,
+    "maze_bfs_distance": bench_maze_bfs_distance,
+    "maze_collides_x100": bench_maze_collides,
+    "scene_place_elements": bench_scene_place_elements,
+    "enemy_place_in_maze": bench_enemy_place_in_maze,
+    "combat_update": bench_combat_update,
+    "wrap_text": bench_wrap_text,
+    "draw_ui": bench_draw_ui,
+    "draw_minimap": bench_draw_minimap,
+    "dialogue_draw": bench_dialogue_draw
+}
+
+
+def run_benchmark(name, fixture):
+    timer = timeit.Timer(BENCHMARKS[name](fixture))
+    number, elapsed = timer.autorange()
+    # autorange stops at 0.2 s; scale up so each repeat takes about MIN_SECONDS
+    number = max(1, int(number * MIN_SECONDS / max(elapsed, 1e-9)))
+    runs = [seconds / number * 1e6 for seconds in timer.repeat(repeat=REPEAT, number=number)]
+    return {"benchmark": name, "number": number, "best_us": min(runs), "median_us": statistics.median(runs),
+            "stdev_us": statistics.stdev(runs) if len(runs) > 1 else 0.0}
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    baseline_by_name = {entry["benchmark"]: entry for entry in baseline["results"]}
+    for result in results:
+        old = baseline_by_name.get(result["benchmark"])
+        if old is None:
+            continue
+        ratio = result["best_us"] / old["best_us"] if old["best_us"] else 1.0
+        result["vs_baseline"] = ratio
+        if ratio > 1 + tolerance:
+            regressions.append(f"{result['benchmark']}: {result['best_us']:.1f} us vs baseline "
+                               f"{old['best_us']:.1f} us ({(ratio - 1) * 100:+.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Microbenchmarks for the game's core functions.")
+    parser.add_argument("--bench", action="append", choices=sorted(BENCHMARKS),
+                        help="Only run the named benchmark (repeatable)")
+    parser.add_argument("--seed", type=int, default=1, help="World and maze seed")
+    parser.add_argument("--attacks", type=int, default=50, help="Player attacks in combat_update")
+    parser.add_argument("--enemies", type=int, default=30, help="Sapas in combat_update")
+    parser.add_argument("--machine", default=machine_profile(),
+                        help="Machine profile the baseline is stored under (default: %(default)s)")
+    parser.add_argument("--save", action="store_true", help="Store the results as this machine profile's baseline")
+    parser.add_argument("--compare", action="store_true",
+                        help="Compare against this machine profile's baseline and exit non-zero on regression")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative slowdown of the best time (default 0.2)")
+    args = parser.parse_args(argv)
+
+    configure("ERROR")
+    pygame.init()
+    fixture = Fixture(args.seed, args.attacks, args.enemies)
+    baseline_path = os.path.join(BASELINE_DIR, f"{args.machine}.json")
+
+    results = []
+    for name in args.bench or list(BENCHMARKS):
+        result = run_benchmark(name, fixture)
+        results.append(result)
+        print(f"{name:<22} {result['best_us']:>12.2f} us best  {result['median_us']:>12.2f} us median  "
+              f"({result['number']} calls x {REPEAT})")
+    pygame.quit()
+
+    status = 0
+    if args.compare:
+        if not os.path.exists(baseline_path):
+            print(f"No baseline for machine profile {args.machine} ({baseline_path}); run with --save first")
+            return 2
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            status = 1
+        else:
+            print(f"No regressions against the {args.machine} baseline.")
+    if args.save:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        report = {"machine": args.machine, "platform": platform.platform(), "python": platform.python_version(),
+                  "pygame": pygame.version.ver, "seed": args.seed, "attacks": args.attacks, "enemies": args.enemies,
+                  "results": results}
+        with open(baseline_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {baseline_path}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+# src/tools/replay.py
+# Replays a session recorded with python -m src.main --record: headless, uncapped, with the recorded seeds,
+# input, clock values and starting save. Prints frame times for the replay and checks the game state
+# against the digests stored in the recording, so two replays of one file are verified identical too.
+#
+#   python -m src.tools.replay logs/recording-20261019-120000.json.gz
+#   python -m src.tools.replay report.json.gz --timings replay-timings.csv --output replay.json
+import argparse
+import json
+import os
+import sys
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from src.modules import recorder
+from src.modules.stats import percentile
+from src.main import main as run_game
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded session headless and check it reproduces.")
+    parser.add_argument("recording", help="File written by python -m src.main --record")
+    parser.add_argument("--log-level", default="ERROR", type=str.upper,
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], help="Console log level")
+    parser.add_argument("--timings", nargs="?", const="", default=None, metavar="PATH",
+                        help="Also collect --timings scopes during the replay")
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="DIR",
+                        help="Also cProfile the replay by scene and modal screen, as --profile does")
+    parser.add_argument("--output", help="Write the replay's frame times and digests as JSON")
+    args = parser.parse_args(argv)
+
+    header = recorder.start_replay(args.recording)
+    try:
+        run_game(seed=header["seed"], horde=header["horde"], log_level=args.log_level, timings_path=args.timings,
+                 profile_dir=args.profile, telemetry_enabled=False)
+    except SystemExit:
+        pass
+    result = recorder.finish()
+
+    frame_ms = result.pop("frame_ms")
+    print(f"Replayed {result['frames']} of {header['frames']} recorded frames in {result['seconds']:.2f} s "
+          f"({result['frames'] / result['seconds'] if result['seconds'] else 0:.0f} fps uncapped)")
+    if frame_ms:
+        print(f"  frame: p50 {percentile(frame_ms, 0.5):.3f}  p95 {percentile(frame_ms, 0.95):.3f}  "
+              f"p99 {percentile(frame_ms, 0.99):.3f}  max {frame_ms[-1]:.3f} ms")
+    print(f"  final state {result['final']} (recorded {header['final']})")
+    status = 0
+    if result["divergence"] is not None:
+        print(f"DIVERGED from the recording by frame {result['divergence']}")
+        status = 1
+    elif result["frames"] != header["frames"] or result["final"] != header["final"]:
+        print("DIVERGED from the recording: the final state differs")
+        status = 1
+    else:
+        print("Replay matches the recording.")
+    if args.output:
+        result.update(recording=args.recording, recorded_frames=header["frames"], recorded_final=header["final"],
+                      p50_ms=percentile(frame_ms, 0.5), p95_ms=percentile(frame_ms, 0.95),
+                      p99_ms=percentile(frame_ms, 0.99), max_ms=frame_ms[-1] if frame_ms else 0.0)
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"Results written to {args.output}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+# src/tools/telemetry_report.py
+# Offline report over session telemetry files (see src/modules/telemetry.py): frame times per scene merged
+# from every visit's histogram, scene construction and maze generator effort, asset, save/load and minigame
+# load times, and peak entity counts.
+#
+#   python -m src.tools.telemetry_report
+#   python -m src.tools.telemetry_report logs/ ~/collected/*.jsonl --json report.json
+import argparse
+import glob
+import json
+import math
+import os
+import statistics
+import sys
+from collections import defaultdict
+from src.config import TELEMETRY_PATH
+from src.modules.stats import percentile
+
+
+def telemetry_files(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "**", "*.jsonl"), recursive=True)))
+        else:
+            files.append(path)
+    return files
+
+
+def read_events(files):
+    events, skipped = [], 0
+    for path in files:
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A session killed mid-write leaves a partial last line
+                        skipped += 1
+                        continue
+                    if isinstance(record, dict) and "type" in record:
+                        events.append(record)
+                    else:
+                        skipped += 1
+        except OSError as e:
+            print(f"Skipping {path}: {e}", file=sys.stderr)
+    return events, skipped
+
+
+def histogram_percentile(histogram, total, fraction):
+    # Upper edge of the whole-millisecond bucket holding the nearest-rank sample
+    rank = max(1, math.ceil(fraction * total))
+    seen = 0
+    for bucket in sorted(histogram):
+        seen += histogram[bucket]
+        if seen >= rank:
+            return bucket + 1
+    return 0
+
+
+def summarize(values):
+    ordered = sorted(values)
+    return {"count": len(ordered), "p50": round(percentile(ordered, 0.5), 3),
+            "p95": round(percentile(ordered, 0.95), 3), "max": round(ordered[-1], 3) if ordered else 0}
+
+
+def scene_name(record):
+    return f"area{record['area']}_scene{record['scene']}"
+
+
+def aggregate(events):
+    sessions = {}
+    frames = defaultdict(lambda: {"visits": 0, "frames": 0, "total_ms": 0.0, "max": 0.0,
+                                  "histogram": defaultdict(int), "peaks": defaultdict(int)})
+    builds = defaultdict(list)
+    assets = defaultdict(list)
+    storage = defaultdict(list)
+    storage_failures = defaultdict(int)
+    minigames = defaultdict(lambda: {"load_ms": [], "duration_ms": [], "results": defaultdict(int)})
+
+    for record in events:
+        kind = record["type"]
+        if kind == "session_start":
+            sessions[record.get("session")] = {"platform": record.get("platform"), "seconds": None}
+        elif kind == "session_end":
+            sessions.setdefault(record.get("session"), {"platform": None})["seconds"] = record.get("duration_s")
+        elif kind == "scene_frames":
+            entry = frames[scene_name(record)]
+            entry["visits"] += 1
+            entry["frames"] += record["frames"]
+            entry["total_ms"] += record["mean"] * record["frames"]
+            entry["max"] = max(entry["max"], record["max"])
+            for bucket, count in record.get("histogram", {}).items():
+                entry["histogram"][int(bucket)] += count
+            for key, value in record.get("peaks", {}).items():
+                entry["peaks"][key] = max(entry["peaks"][key], value)
+        elif kind == "scene_build":
+            builds[scene_name(record)].append(record)
+        elif kind == "asset_load":
+            assets[record["path"]].append(record["ms"])
+        elif kind in ("save", "load"):
+            if record.get("ok", True):
+                storage[kind].append(record["ms"])
+            else:
+                storage_failures[kind] += 1
+        elif kind == "minigame":
+            entry = minigames[record["name"]]
+            if record.get("load_ms") is not None:
+                entry["load_ms"].append(record["load_ms"])
+            entry["duration_ms"].append(record["duration_ms"])
+            entry["results"][record.get("result")] += 1
+
+    report = {"sessions": len(sessions),
+              "play_seconds": round(sum(s["seconds"] or 0 for s in sessions.values()), 1),
+              "unfinished_sessions": sum(1 for s in sessions.values() if s.get("seconds") is None),
+              "platforms": sorted({s["platform"] for s in sessions.values() if s.get("platform")}),
+              "scene_frames": {}, "scene_builds": {}, "assets": {}, "storage": {}, "minigames": {}}
+    for name, entry in sorted(frames.items()):
+        total = entry["frames"]
+        report["scene_frames"][name] = {
+            "visits": entry["visits"], "frames": total,
+            "mean": round(entry["total_ms"] / total, 3) if total else 0,
+            "p50": histogram_percentile(entry["histogram"], total, 0.5),
+            "p95": histogram_percentile(entry["histogram"], total, 0.95),
+            "p99": histogram_percentile(entry["histogram"], total, 0.99),
+            "max": round(entry["max"], 3), "peaks": dict(entry["peaks"])}
+    for name, records in sorted(builds.items()):
+        report["scene_builds"][name] = dict(
+            summarize([r["ms"] for r in records]),
+            attempts_mean=round(statistics.mean(r["attempts"] for r in records), 1),
+            fallback_attempts_mean=round(statistics.mean(r["fallback_attempts"] for r in records), 1),
+            carved=sum(1 for r in records if r.get("carved")),
+            restored=sum(1 for r in records if r.get("restored")),
+            # "pack:<hash>:<config>:<index>:<transform>" -> "pack"
+            sources=sorted({str(r.get("source")).split(":")[0] for r in records}))
+    for path, times in assets.items():
+        report["assets"][path] = summarize(times)
+    for kind in ("save", "load"):
+        report["storage"][kind] = dict(summarize(storage[kind]), failures=storage_failures[kind])
+    for name, entry in sorted(minigames.items()):
+        report["minigames"][name] = {"load_ms": summarize(entry["load_ms"]),
+                                     "duration_ms": summarize(entry["duration_ms"]),
+                                     "results": dict(entry["results"])}
+    return report
+
+
+def print_report(report, top):
+    print(f"=== {report['sessions']} sessions, {report['play_seconds'] / 60:.1f} min played "
+          f"({report['unfinished_sessions']} without a session_end) ===")
+    if report["platforms"]:
+        print("Platforms: " + ", ".join(report["platforms"]))
+
+    print("\nFrame times by scene (ms; percentiles at 1 ms resolution)")
+    print(f"  {'scene':<16} {'visits':>6} {'frames':>8} {'mean':>7} {'p50':>5} {'p95':>5} {'p99':>5} {'max':>8}  peaks")
+    for name, entry in report["scene_frames"].items():
+        peaks = " ".join(f"{key}={value}" for key, value in entry["peaks"].items() if value)
+        print(f"  {name:<16} {entry['visits']:>6} {entry['frames']:>8} {entry['mean']:>7.2f} {entry['p50']:>5} "
+              f"{entry['p95']:>5} {entry['p99']:>5} {entry['max']:>8.1f}  {peaks}")
+
+    print("\nScene construction (ms) and maze generator effort")
+    print(f"  {'scene':<16} {'builds':>6} {'p50':>8} {'p95':>8} {'max':>8} {'attempts':>9} {'fallback':>9} "
+          f"{'carved':>6}  source")
+    for name, entry in report["scene_builds"].items():
+        print(f"  {name:<16} {entry['count']:>6} {entry['p50']:>8.2f} {entry['p95']:>8.2f} {entry['max']:>8.2f} "
+              f"{entry['attempts_mean']:>9.1f} {entry['fallback_attempts_mean']:>9.1f} {entry['carved']:>6}  "
+              f"{', '.join(entry['sources'])}")
+
+    print(f"\nSlowest asset loads (top {top} by max ms)")
+    for path, entry in sorted(report["assets"].items(), key=lambda item: -item[1]["max"])[:top]:
+        print(f"  {entry['max']:>8.2f} max {entry['p50']:>8.2f} p50 {entry['count']:>5}x  {path}")
+
+    print("\nSave / load (ms)")
+    for kind, entry in report["storage"].items():
+        print(f"  {kind:<5} {entry['count']:>5}x  p50 {entry['p50']:.2f}  p95 {entry['p95']:.2f}  "
+              f"max {entry['max']:.2f}  failures {entry['failures']}")
+
+    print("\nMinigames (ms)")
+    for name, entry in report["minigames"].items():
+        load, duration = entry["load_ms"], entry["duration_ms"]
+        results = " ".join(f"{key}={value}" for key, value in sorted(entry["results"].items()))
+        print(f"  {name:<18} {duration['count']:>4}x  load p50 {load['p50']:.1f} max {load['max']:.1f}  "
+              f"played p50 {duration['p50'] / 1000:.1f} s  {results}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate session telemetry files into a report.")
+    parser.add_argument("paths", nargs="*", default=[TELEMETRY_PATH],
+                        help="Telemetry .jsonl files or directories to search (default: %(default)s)")
+    parser.add_argument("--top", type=int, default=10, help="Asset loads to list")
+    parser.add_argument("--json", metavar="PATH", help="Also write the aggregated report as JSON")
+    args = parser.parse_args(argv)
+
+    files = telemetry_files(args.paths)
+    events, skipped = read_events(files)
+    if not events:
+        print("No telemetry events found in " + ", ".join(args.paths))
+        return 1
+    report = aggregate(events)
+    report["files"] = len(files)
+    report["skipped_lines"] = skipped
+    print_report(report, args.top)
+    if skipped:
+        print(f"\n{skipped} unreadable lines skipped.")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())